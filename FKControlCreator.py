@@ -2,37 +2,50 @@
 
 What Can This Program Do?
 - This program creates FK Controllers for all selected joints.
+- It can also be imported and run on a list of joints with createFKControls().
 
 """
 
 # Import Maya Commands
 from maya import cmds
 
-# Creating List of Bind Joints
-jntList = cmds.ls( sl=True )
-
-# Storing Length of Joint List
-jntCount = len(jntList)
-
-# Looping Through Joint List
-for index in range(0, jntCount):
-    
-    # Putting Current Joint into Variable
-    jnt = jntList[index]
-    
-    # Creating and Positioning Controller
-    ctrl = cmds.circle(name = 'FK_Joint' + str(index) + '_Ctrl', r=3)[0]
-    grp = cmds.group(ctrl, name = 'FK_Joint' + str(index) + '_Group')
-    parentConst = cmds.parentConstraint(jnt, grp, mo=False)
-    cmds.delete(parentConst)
-    
-    # Rotating Controllers Properly
-    currentRotation = cmds.getAttr(grp + '.rotateY')
-    cmds.setAttr(grp + '.rotateY', currentRotation + 90)
-    
-    # Creating Constraint
-    cmds.parentConstraint(ctrl, jnt, mo=True)    
-    
-    # Parenting Under Previous if Joint is Not Top of Chain
-    if index > 0:
-        cmds.parent(grp, 'FK_Joint' + str(index - 1) + '_Ctrl')
\ No newline at end of file
+# Creating FK Controllers for a Chain of Joints
+def createFKControls(jntList=None):
+
+    # Creating List of Bind Joints
+    if jntList is None:
+        jntList = cmds.ls( sl=True )
+
+    # Storing Length of Joint List
+    jntCount = len(jntList)
+
+    # Looping Through Joint List
+    ctrlList = []
+    for index in range(0, jntCount):
+        
+        # Putting Current Joint into Variable
+        jnt = jntList[index]
+        
+        # Creating and Positioning Controller
+        ctrl = cmds.circle(name = 'FK_Joint' + str(index) + '_Ctrl', r=3)[0]
+        grp = cmds.group(ctrl, name = 'FK_Joint' + str(index) + '_Group')
+        parentConst = cmds.parentConstraint(jnt, grp, mo=False)
+        cmds.delete(parentConst)
+        
+        # Rotating Controllers Properly
+        currentRotation = cmds.getAttr(grp + '.rotateY')
+        cmds.setAttr(grp + '.rotateY', currentRotation + 90)
+        
+        # Creating Constraint
+        cmds.parentConstraint(ctrl, jnt, mo=True)    
+        
+        # Parenting Under Previous if Joint is Not Top of Chain
+        if index > 0:
+            cmds.parent(grp, 'FK_Joint' + str(index - 1) + '_Ctrl')
+        ctrlList.append(ctrl)
+
+    return ctrlList
+
+# Running on Selection When Executed from the Script Editor
+if __name__ == '__main__':
+    createFKControls()
@@ -0,0 +1,198 @@
+"""
+
+What Can This Program Do?
+- This program moves animation between rigs from bipedAutoRig.py through a compact binary cache, instead of .ma or .atom exports.
+- Channels are named by control and attribute from the control registry on the master controller, so the cache applies to any rig version with the same controls.
+- Keys can be copied as they are, or every animated channel can be sampled at every frame of a range.
+- Each channel is stored as one contiguous column of numbers, so loading a cache maps the file into memory instead of parsing it.
+- Each channel gets all of its keys in one edit of its animation curve when the cache is applied.
+
+Notes for Use:
+- exportAnimation(masterCtrl, path) copies keys, and exportAnimation(masterCtrl, path, startFrame, endFrame, sample=True) bakes every frame of the range.
+- importAnimation(masterCtrl, path, frameOffset) applies a cache to a rig, shifted by an optional number of frames.
+- Copied keys keep their times and values, and get auto tangents when applied. Sampling keeps the exact motion.
+- Values are stored in Maya's internal units, radians and centimeters, however they were exported, like poses from poseLibrary.py.
+- NumPy is used to read columns without copying when mayapy has it.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import array
+import json
+import mmap
+import struct
+import sys
+
+from maya import cmds
+import maya.api.OpenMayaAnim as omAnim
+
+# ikfkMatch, poseLibrary, and NumPy Are Imported by the Functions That Use Them, So Batch Workers Start Quickly
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Header That Marks an Animation Cache File
+cacheMagic = b'RIGANIM1'
+
+
+# **** UTILITIES ****
+
+
+# *** Importing NumPy When a Function Needs It, or Getting None, Since Not Every mayapy Ships It ***
+def getNumpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+# **** WRITING CACHES ****
+
+
+# *** Converting a Column of Numbers to Little-Endian Bytes ***
+def toBytes(values):
+    column = array.array('d', values)
+    if sys.byteorder != 'little':
+        column.byteswap()
+    return column.tobytes() if hasattr(column, 'tobytes') else column.tostring()
+
+# *** Getting the Key Times and Values of Every Animated Channel of a Rig ***
+def copyKeys(channels, startFrame=None, endFrame=None):
+    import poseLibrary
+    columns = []
+    timeRange = (startFrame, endFrame) if startFrame is not None and endFrame is not None else None
+    for name, attr, plug in zip(channels['names'], channels['attrs'], channels['plugs']):
+        if not omAnim.MAnimUtil.findAnimation(plug):
+            continue
+        if timeRange:
+            times = cmds.keyframe(attr, query=True, time=timeRange, timeChange=True) or []
+            values = cmds.keyframe(attr, query=True, time=timeRange, valueChange=True) or []
+        else:
+            times = cmds.keyframe(attr, query=True, timeChange=True) or []
+            values = cmds.keyframe(attr, query=True, valueChange=True) or []
+        
+        # Converting Key Values from the UI Units keyframe Reports to the Internal Units Sampling and Curve Edits Use
+        unitType = poseLibrary.getUnitType(plug)
+        values = [poseLibrary.toInternal(value, unitType) for value in values]
+        if times:
+            columns.append({'name': name, 'times': times, 'values': values})
+    return columns
+
+# *** Sampling Every Animated Channel of a Rig at Every Frame of a Range ***
+def sampleKeys(channels, startFrame, endFrame):
+    import ikfkMatch
+    animated = [i for i in range(0, len(channels['plugs'])) if omAnim.MAnimUtil.findAnimation(channels['plugs'][i])]
+    frames = list(range(int(startFrame), int(endFrame) + 1))
+    samples = ikfkMatch.samplePlugs([channels['plugs'][i] for i in animated], frames, asMatrix=False)
+    columns = []
+    for column in range(0, len(animated)):
+        columns.append({'name': channels['names'][animated[column]], 'times': None, 'values': [frameValues[column] for frameValues in samples]})
+    return columns
+
+# *** Exporting the Animation of a Rig's Controls to a Cache File ***
+def exportAnimation(masterCtrl, path, startFrame=None, endFrame=None, sample=False):
+    import poseLibrary
+    channels = poseLibrary.getChannels(masterCtrl)
+    if sample:
+        if startFrame is None or endFrame is None:
+            startFrame = cmds.playbackOptions(query=True, minTime=True)
+            endFrame = cmds.playbackOptions(query=True, maxTime=True)
+        columns = sampleKeys(channels, startFrame, endFrame)
+    else:
+        columns = copyKeys(channels, startFrame, endFrame)
+    
+    # Laying Out Each Channel's Times and Values as Columns After the Header
+    offset = 0
+    header = {'startFrame': startFrame, 'channels': []}
+    for column in columns:
+        entry = {'name': column['name'], 'count': len(column['values']), 'times': None, 'values': offset}
+        offset += entry['count']
+        if column['times'] is not None:
+            entry['times'] = offset
+            offset += entry['count']
+        header['channels'].append(entry)
+    headerBytes = json.dumps(header).encode('utf-8')
+    
+    # Padding the Header So Columns Start on 8 Byte Boundaries
+    headerBytes += b' ' * (-(len(cacheMagic) + 4 + len(headerBytes)) % 8)
+    with open(path, 'wb') as cacheFile:
+        cacheFile.write(cacheMagic + struct.pack('<I', len(headerBytes)) + headerBytes)
+        for column in columns:
+            cacheFile.write(toBytes(column['values']))
+            if column['times'] is not None:
+                cacheFile.write(toBytes(column['times']))
+    return {'path': path, 'channels': len(columns), 'values': offset}
+
+
+# **** READING CACHES ****
+
+
+# *** Mapping a Cache File into Memory and Reading Its Header ***
+def loadAnimCache(path):
+    with open(path, 'rb') as cacheFile:
+        data = mmap.mmap(cacheFile.fileno(), 0, access=mmap.ACCESS_READ)
+    if data[:len(cacheMagic)] != cacheMagic:
+        data.close()
+        raise ValueError(path + ' is not an animation cache.')
+    headerSize = struct.unpack('<I', data[len(cacheMagic):len(cacheMagic) + 4])[0]
+    dataStart = len(cacheMagic) + 4 + headerSize
+    header = json.loads(data[len(cacheMagic) + 4:dataStart].decode('utf-8'))
+    return {'path': path, 'header': header, 'data': data, 'dataStart': dataStart}
+
+# *** Reading One Column of a Mapped Cache ***
+def readColumn(cache, offset, count):
+    numpy = getNumpy()
+    start = cache['dataStart'] + (offset * 8)
+    if numpy is not None:
+        return numpy.frombuffer(cache['data'], dtype='<f8', count=count, offset=start)
+    column = array.array('d')
+    chunk = cache['data'][start:start + (count * 8)]
+    if hasattr(column, 'frombytes'):
+        column.frombytes(chunk)
+    else:
+        column.fromstring(chunk)
+    if sys.byteorder != 'little':
+        column.byteswap()
+    return column
+
+# *** Closing the Memory Map of a Cache ***
+def closeAnimCache(cache):
+    cache['data'].close()
+
+
+# **** APPLYING CACHES ****
+
+
+# *** Applying a Cache to a Rig's Controls, One Curve Edit per Channel ***
+def importAnimation(masterCtrl, path, frameOffset=0):
+    import ikfkMatch
+    import poseLibrary
+    channels = poseLibrary.getChannels(masterCtrl)
+    cache = loadAnimCache(path)
+    applied = 0
+    try:
+        startFrame = cache['header']['startFrame']
+        for entry in cache['header']['channels']:
+            
+            # Skipping Channels This Rig Version Does Not Have, or That Are Locked or Driven
+            i = channels['index'].get(entry['name'])
+            if i is None or not channels['writable'][i]:
+                continue
+            
+            # Copying Columns Out of the Map, So It Can Be Closed
+            values = [float(value) for value in readColumn(cache, entry['values'], entry['count'])]
+            if entry['times'] is None:
+                frames = [startFrame + frameOffset + f for f in range(0, entry['count'])]
+            else:
+                frames = [float(time) + frameOffset for time in readColumn(cache, entry['times'], entry['count'])]
+            node, attr = channels['attrs'][i].rsplit('.', 1)
+            ikfkMatch.writeKeys(node, attr, frames, values)
+            applied += 1
+    finally:
+        closeAnimCache(cache)
+    return applied
@@ -6,12 +6,23 @@ What Can This Program Do?
 - It uses this selection input and UI input for controller radius to create a full rig for the entire body.
 - The center controllers of the setup will be the generic dark blue, with the root controller being yellow.
 - The left controllers of the setup will be blue, and right controllers will be red.
+- Running the script opens the rig window. Importing it opens nothing, and buildRig() builds a rig without the UI.
+- Every node the rig creates is named with an optional prefix, so many characters can be rigged in one scene with buildRigs().
+- The foot pivot locators of both sides can optionally be placed from the mesh vertices around each foot instead of by hand.
+- An LOD attribute on the master controller freezes the fingers (Medium), then the limb twist and foot roll (Low), for fast crowd playback.
+- The fingers, twist, and foot roll can also be left out of the build entirely with the omit option of buildRig().
+- The mesh can optionally be bound to the bind skeleton, with weights from each vertex's distance to the bones written in one pass.
+- The IK wrist and ankle controls and the head aim can follow the world, root, chest, head, or pelvis through a Space attribute, built from matrix nodes without constraints.
+- Every control is registered on the master controller with its side, limb, build stage, and default values, for tools in rigControls.py.
+- After building, the rig is checked to leave the bind skeleton where it was, in IK and in FK, and the drift of every joint is reported.
 
 Notes for Prior Joint Creation:
-- The spine should have 5 joints.
-- The head and neck should have 3 joints.
+- The spine can have any number of joints, ending in the chest joint that holds the neck and clavicles.
+- The neck can have any number of joints, ending in the head joint.
+- The spine curve and the neck curve can have any number of CVs.
 - The arms should have 11 joints each.
 - The legs should have 9 joints each.
+- The hands can have any number of fingers, and each finger any number of knuckles.
 
 
 """
@@ -20,22 +31,308 @@ Notes for Prior Joint Creation:
 # ***** IMPORTING MODULES *****
 
 
+import bisect
+import json
+import math
+
 from maya import cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as omAnim
+
+# Other Rig Tools and NumPy Are Imported by the Functions That Use Them, So Batch Workers Start Quickly
 
 
 # ***** FUNCTION DEFINITIONS *****
 
 
-# **** SPINE CREATION ****
+# **** UTILITIES ****
 
 
+# *** Importing NumPy When a Function Needs It, or Getting None, Since Not Every mayapy Ships It ***
+def getNumpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
 # *** Function for Creating Lists Based on Selection ***
 def checkSelection():
     	objList = cmds.ls(sl=1)
     	if len(objList) < 1:
         	cmds.error("Please select an object.")
     	return objList
-    	
+
+# *** Describing the Bind Skeleton, Spine Curve, Mesh, and Locators for rigValidator.py ***
+def getSkeleton(rootJnt, spineCurve, mesh):
+    import rigValidator
+    skeleton = rigValidator.newSkeleton()
+    rigValidator.addJoint(skeleton, rootJnt)
+    
+    # Walking Down from the Root, So Every Joint Is Added Before Its Attributes Are Read
+    joints = [rootJnt]
+    for jnt in joints:
+        for child in cmds.listRelatives(jnt, children=True, type='joint') or []:
+            rigValidator.addJoint(skeleton, child, jnt)
+            joints.append(child)
+        skeleton['joints'][jnt]['translate'] = list(cmds.getAttr(jnt + '.translate')[0])
+        skeleton['joints'][jnt]['jointOrient'] = list(cmds.getAttr(jnt + '.jointOrient')[0])
+    if cmds.listRelatives(spineCurve, shapes=True, type='nurbsCurve'):
+        skeleton['curves'][spineCurve] = cmds.getAttr(spineCurve + '.spans') + cmds.getAttr(spineCurve + '.degree')
+    if cmds.listRelatives(mesh, shapes=True, type='mesh'):
+        skeleton['meshes'].append(mesh)
+    locators = cmds.ls(type='locator')
+    if locators:
+        skeleton['locators'] = cmds.listRelatives(locators, parent=True)
+    return skeleton
+
+# *** Getting World Matrices of Many Nodes in One Pass ***
+def getWorldMatrices(nodes):
+    selList = om.MSelectionList()
+    for node in nodes:
+        selList.add(node)
+    return [selList.getDagPath(i).inclusiveMatrix() for i in range(len(nodes))]
+
+# *** Converting World Matrices to Translate and Rotate Values ***
+def getWorldTransforms(matrices, rotOffset=(0.0, 0.0, 0.0)):
+    transforms = []
+    for matrix in matrices:
+        tMatrix = om.MTransformationMatrix(matrix)
+        pos = tMatrix.translation(om.MSpace.kWorld)
+        rot = tMatrix.rotation()
+        rotValues = [math.degrees(rot.x), math.degrees(rot.y), math.degrees(rot.z)]
+        rotValues = [rotValues[i] + rotOffset[i] for i in range(0, 3)]
+        transforms.append(([pos.x, pos.y, pos.z], rotValues))
+    return transforms
+
+# *** Computing Blend Amount Between Two Neighbouring Drivers ***
+def getCurveFalloff(s, blendWidth):
+    if blendWidth <= 0.0:
+        if s < 0.5:
+            return 0.0
+        elif s > 0.5:
+            return 1.0
+        return 0.5
+    start = 0.5 - (blendWidth / 2.0)
+    return min(max((s - start) / blendWidth, 0.0), 1.0)
+
+# *** Computing Curve Weights from CV and Driver Parameters ***
+def computeCurveWeights(cvParams, driverParams, blendWidth=0.5):
+    order = sorted(range(0, len(driverParams)), key=lambda j: driverParams[j])
+    sortedParams = [driverParams[j] for j in order]
+    weights = []
+    for u in cvParams:
+        row = [0.0] * len(driverParams)
+        
+        # Binding CVs Past the End Drivers Fully to Them
+        if u <= sortedParams[0]:
+            row[order[0]] = 1.0
+        elif u >= sortedParams[-1]:
+            row[order[-1]] = 1.0
+            
+        # Blending Between the Two Surrounding Drivers
+        else:
+            k = bisect.bisect_right(sortedParams, u) - 1
+            lo = sortedParams[k]
+            hi = sortedParams[k+1]
+            blend = getCurveFalloff((u - lo) / (hi - lo), blendWidth)
+            row[order[k]] = 1.0 - blend
+            row[order[k+1]] += blend
+        weights.append(row)
+    return weights
+
+# *** Skinning Curve CVs to Drivers in One Bulk Write ***
+def setCurveWeights(skinCluster, curve, driverChain, blendWidth=0.5):
+    selList = om.MSelectionList()
+    selList.add(skinCluster)
+    selList.add(curve)
+    skinFn = omAnim.MFnSkinCluster(selList.getDependNode(0))
+    curvePath = selList.getDagPath(1)
+    curvePath.extendToShape()
+    curveFn = om.MFnNurbsCurve(curvePath)
+    
+    # Getting CV Parameters from Knot Averages
+    knots = curveFn.knots()
+    degree = curveFn.degree
+    numCVs = curveFn.numCVs
+    cvParams = [sum(knots[i:i+degree]) / float(degree) for i in range(0, numCVs)]
+    
+    # Getting Driver Parameters from Closest Points on Curve
+    driverParams = []
+    for matrix in getWorldMatrices(driverChain):
+        driverPos = om.MPoint(matrix.getElement(3, 0), matrix.getElement(3, 1), matrix.getElement(3, 2))
+        driverParams.append(curveFn.closestPoint(driverPos, space=om.MSpace.kWorld)[1])
+    weights = computeCurveWeights(cvParams, driverParams, blendWidth)
+    
+    # Matching Drivers to Influence Indices
+    influenceIndices = {}
+    for path in skinFn.influenceObjects():
+        influenceIndices[path.partialPathName()] = skinFn.indexForInfluenceObject(path)
+    influences = om.MIntArray([influenceIndices[cmds.ls(jnt)[0]] for jnt in driverChain])
+    
+    # Writing Weights for Every CV at Once
+    compFn = om.MFnSingleIndexedComponent()
+    components = compFn.create(om.MFn.kCurveCVComponent)
+    compFn.addElements(list(range(0, numCVs)))
+    values = om.MDoubleArray([w for row in weights for w in row])
+    skinFn.setWeights(curvePath, components, influences, values, False)
+    return weights
+
+
+# **** RIG NAME REGISTRY ****
+
+
+# Prefix, Created Nodes, UUIDs of Nodes Created by Each Build Stage and Optional Subsystem, and Progress Job of the Rig Being Built
+rigRegistry = {'prefix': '', 'nodes': {}, 'stages': {}, 'subsystems': {}, 'omit': set(), 'progress': None}
+
+# Number of Progress Steps a Single Rig Build Reports
+rigBuildSteps = 8
+
+# Optional Subsystems and the Level of Detail at Which Each One Is Frozen
+lodLevels = {'Fingers': 1, 'Twist': 2, 'FootRoll': 2}
+
+# *** Starting a New Registry for a Rig Build ***
+def startRigRegistry(prefix='', omit=(), progress=None):
+    rigRegistry['prefix'] = prefix
+    rigRegistry['nodes'] = {}
+    rigRegistry['stages'] = {}
+    rigRegistry['subsystems'] = {}
+    rigRegistry['omit'] = set(omit)
+    rigRegistry['progress'] = progress
+    return rigRegistry
+
+# *** Checking Whether an Optional Subsystem Is Left Out of the Rig Being Built ***
+def isOmitted(subsystem):
+    return subsystem in rigRegistry['omit']
+
+# *** Recording Every Node an Optional Subsystem Created, for Level of Detail Freezing ***
+def recordRigSubsystem(subsystem, uuidsBefore):
+    created = set(cmds.ls(uuid=True)) - uuidsBefore
+    rigRegistry['subsystems'][subsystem] = rigRegistry['subsystems'].get(subsystem, []) + sorted(created)
+
+# *** Recording Every Node Created Since the Last Stage, by UUID So Renames Do Not Matter ***
+def recordRigStage(stage, uuidsBefore):
+    import progressReport
+    uuidsAfter = set(cmds.ls(uuid=True))
+    rigRegistry['stages'][stage] = sorted(uuidsAfter - uuidsBefore)
+    if rigRegistry['progress']:
+        progressReport.stepProgress(rigRegistry['progress'], 1, rigRegistry['prefix'] + stage)
+    return uuidsAfter
+
+# *** Checking Whether the Rig Build Was Cancelled Between Stages ***
+def isRigBuildCancelled():
+    import progressReport
+    return bool(rigRegistry['progress']) and progressReport.isCancelled(rigRegistry['progress'])
+
+# *** Deleting Every Node the Cancelled Build Created and Showing the Bind Skeleton Again ***
+def cancelRigBuild(rootJnt, spineCurve):
+    uuids = [uuid for stageUuids in rigRegistry['stages'].values() for uuid in stageUuids]
+    for node in (cmds.ls(uuids, long=True) if uuids else []):
+        # Deleting a Parent Already Deleted Its Children
+        if cmds.objExists(node):
+            cmds.delete(node)
+    cmds.showHidden(rootJnt, spineCurve)
+    cmds.warning('Rig build of ' + (rigRegistry['prefix'] or 'character') + ' was cancelled, and its nodes were deleted.')
+    return None
+
+# *** Scoping a Node Name to the Rig Being Built ***
+def scopedName(name):
+    return rigRegistry['prefix'] + name
+
+# *** Recording the Actual Name of a Created Node ***
+def registerNode(name, node):
+    rigRegistry['nodes'][name] = node
+    return node
+
+# *** Getting a Created Node by Its Unscoped Name ***
+def getNode(name):
+    return rigRegistry['nodes'][name]
+
+# *** Stripping Namespaces and Paths from a Node Name ***
+def shortName(node):
+    return node.split('|')[-1].split(':')[-1]
+
+
+# **** SPLINE CHAIN UTILITIES ****
+
+
+# *** Walking Down a Joint Chain Until It Branches or Ends ***
+def getJointChain(topJnt):
+    chain = [topJnt]
+    children = cmds.listRelatives(topJnt, children=True, type='joint') or []
+    while len(children) == 1:
+        chain.append(children[0])
+        children = cmds.listRelatives(children[0], children=True, type='joint') or []
+    return chain
+
+# *** Creating a Fresh Chain of Joints Matching Bind Joints, from Their World Matrices ***
+def createJointsFromMatrices(sources, names):
+    chain = []
+    parentMatrix = om.MMatrix()
+    for source, name, matrix in zip(sources, names, getWorldMatrices(sources)):
+        if chain:
+            jnt = cmds.createNode('joint', name=name, parent=chain[-1], skipSelect=True)
+        else:
+            jnt = cmds.createNode('joint', name=name, skipSelect=True)
+        
+        # Keeping Orientation in Joint Orient, Like Bind Joints Frozen After Placement
+        local = om.MTransformationMatrix(matrix * parentMatrix.inverse())
+        pos = local.translation(om.MSpace.kTransform)
+        rot = local.rotation()
+        cmds.setAttr(jnt + '.translate', pos.x, pos.y, pos.z)
+        cmds.setAttr(jnt + '.jointOrient', math.degrees(rot.x), math.degrees(rot.y), math.degrees(rot.z))
+        for attr in ['rotateOrder', 'radius']:
+            cmds.setAttr(jnt + '.' + attr, cmds.getAttr(source + '.' + attr))
+        cmds.setAttr(jnt + '.preferredAngle', *cmds.getAttr(source + '.preferredAngle')[0])
+        chain.append(jnt)
+        parentMatrix = matrix
+    return chain
+
+# *** Naming Driver Joints and Controllers Along a Spline ***
+def getDriverNames(baseName, midName, topName, count):
+    # A Spline Needs a Driver at Each End
+    if count < 2:
+        cmds.error('The ' + topName + ' spline needs at least 2 driver joints, not ' + str(count) + '.')
+    if count == 2:
+        return [baseName, topName]
+    elif count == 3:
+        return [baseName, midName, topName]
+    return [baseName] + [midName + str(i) for i in range(1, count-1)] + [topName]
+
+# *** Getting Evenly Spaced Positions Along a Curve ***
+def getCurvePoints(curve, count):
+    selList = om.MSelectionList()
+    selList.add(curve)
+    curvePath = selList.getDagPath(0)
+    curvePath.extendToShape()
+    curveFn = om.MFnNurbsCurve(curvePath)
+    
+    # Sampling Curve by Arc Length
+    length = curveFn.length()
+    endParam = curveFn.knotDomain[1]
+    points = []
+    for i in range(0, count):
+        if i == (count-1):
+            param = endParam
+        else:
+            param = curveFn.findParamFromLength(length * i / float(count-1))
+        point = curveFn.getPointAtParam(param, om.MSpace.kWorld)
+        points.append([point.x, point.y, point.z])
+    return points
+
+# *** Creating a Chain of Driver Joints Along a Curve ***
+def createDriverJoints(curve, names):
+    cmds.select(clear=True)
+    driverChain = []
+    for name, pos in zip(names, getCurvePoints(curve, len(names))):
+        driverChain.append(registerNode(name + '_j', cmds.joint(p=pos, name=scopedName(name + '_j'))))
+    cmds.select(clear=True)
+    return driverChain
+
+
+# **** SPINE CREATION ****
+
+
 # *** Duplicating Chest Joints from Bind Chain for Later Use ***
 def getSpineJoints(rad, rootJnt, spineCurve):
     
@@ -45,27 +342,12 @@ def getSpineJoints(rad, rootJnt, spineCurve):
             Bbase = obj
         else:
             pelvisJnt = obj
-    Bchain = cmds.listRelatives(Bbase, ad=True, type='joint')
-    Bchain.reverse()
-    Bchain.insert(0, Bbase)
-    
-    # Creating IK Spine Joint Chain  
-    spineChain = cmds.duplicate(Bchain, name='Spine_Chain', renameChildren=True)
-    sChest = spineChain[4]
-    chestChildren = cmds.listRelatives(sChest)
-    for child in chestChildren:
-        cmds.delete(child)
-    cmds.parent(spineChain[0], world=True)
-    
-    # Renaming Spine Joint Chain
-    newSpineChain = []
-    for i in range(0, 5):
-        if i == 4:
-            name = 'IK_Chest_j'
-        else:
-            name = 'IK_Spine_' + str((i+1)) + '_j'
-        cmds.rename(spineChain[i], name)
-        newSpineChain.append(name)
+    Bchain = getJointChain(Bbase)
+    
+    # Creating IK Spine Joint Chain
+    names = ['IK_Spine_' + str((i+1)) + '_j' for i in range(0, len(Bchain)-1)] + ['IK_Chest_j']
+    spineChain = createJointsFromMatrices(Bchain, [scopedName(name) for name in names])
+    newSpineChain = [registerNode(name, jnt) for name, jnt in zip(names, spineChain)]
         
     # Hiding IK Chains
     cmds.hide(newSpineChain[0])
@@ -74,96 +356,57 @@ def getSpineJoints(rad, rootJnt, spineCurve):
     return rootJnt, pelvisJnt, Bchain, newSpineChain, spineCurve
     
 # *** Creating IK Spline, Curve, and Driver Joints ***
-def createChestSpline(rad, rootJnt, spineCurve):
+def createChestSpline(rad, rootJnt, spineCurve, driverCount=3):
     rootJnt, pelvisJnt, Bchain, IKchain, spineCurve = getSpineJoints(rad, rootJnt, spineCurve)
     
     # Creating IK Spline
     spineIK = cmds.ikHandle(sj=IKchain[0], ee=IKchain[-1], sol='ikSplineSolver', c=spineCurve, ccv=False, pcv=False)[0]
-    cmds.rename(spineIK, 'Spine_IKhandle')
-    spineIK = 'Spine_IKhandle'
+    spineIK = registerNode('Spine_IKhandle', cmds.rename(spineIK, scopedName('Spine_IKhandle')))
     cmds.hide(spineIK)
     
-    # Getting Top and Bottom Positions
-    cmds.select(clear=True)
-    bottomPos = []
-    topPos = []
-    duplicateJnt = cmds.duplicate(IKchain[-1])[0]
-    cmds.parent(duplicateJnt, world=True)
-    for axis in 'XYZ':
-        bottomPos.append(cmds.getAttr(IKchain[0] + '.translate' + axis))
-        topPos.append(cmds.getAttr(duplicateJnt + '.translate' + axis))
-    cmds.delete(duplicateJnt)
-    
-    # Making Top and Bottom Joints
-    bottomDriver = cmds.joint(p=bottomPos, name='baseSpine_j')
-    cmds.select(clear=True)
-    topDriver = cmds.joint(p=topPos, name='Chest_j')
-    cmds.select(clear=True)
-    cmds.parent(topDriver, bottomDriver)
-    
-    # Making Middle Joint
-    midPos = []
-    for i in range(0,3):
-        pos = ((bottomPos[i] + topPos[i])/2)
-        midPos.append(pos)
-    midDriver = cmds.joint(p=midPos, name='midSpine_j')
-    cmds.parent(midDriver, bottomDriver)
-    cmds.parent(topDriver, midDriver)
+    # Making Driver Joints Along the Curve
+    names = getDriverNames('baseSpine', 'midSpine', 'Chest', driverCount)
+    driverChain = createDriverJoints(spineCurve, names)
     
     # Skinning Driver Joints to Curve
-    driverChain = [bottomDriver, midDriver, topDriver]
-    cmds.skinCluster(driverChain, spineCurve, mi=2, name='SpineCurve_SkinCluster')
+    spineSkin = cmds.skinCluster(driverChain, spineCurve, mi=2, name=scopedName('SpineCurve_SkinCluster'))[0]
     
     # Painting Curve Weights
-    cmds.skinPercent('SpineCurve_SkinCluster', spineCurve + '.cv[0]', transformValue=[(bottomDriver, 1.0)])
-    cmds.skinPercent('SpineCurve_SkinCluster', spineCurve + '.cv[1]', transformValue=[(bottomDriver, 1.0)])
-    cmds.skinPercent('SpineCurve_SkinCluster', spineCurve + '.cv[2]', transformValue=[(bottomDriver, 0.5), (midDriver, 0.5)])
-    cmds.skinPercent('SpineCurve_SkinCluster', spineCurve + '.cv[3]', transformValue=[(midDriver, 1.0)])
-    cmds.skinPercent('SpineCurve_SkinCluster', spineCurve + '.cv[4]', transformValue=[(midDriver, 0.5), (topDriver, 0.5)])
-    cmds.skinPercent('SpineCurve_SkinCluster', spineCurve + '.cv[5]', transformValue=[(topDriver, 1.0)])
-    cmds.skinPercent('SpineCurve_SkinCluster', spineCurve + '.cv[6]', transformValue=[(topDriver, 1.0)])
+    setCurveWeights(spineSkin, spineCurve, driverChain, blendWidth=0.5)
     
     return rootJnt, pelvisJnt, Bchain, IKchain, driverChain, spineCurve, spineIK
     
 # *** Creating and Implementing Chest Controllers ***    
-def createChestControllers(rad, rootJnt, spineCurve):
-    rootJnt, pelvisJnt, Bchain, IKchain, driverChain, spineCurve, spineIK = createChestSpline(rad, rootJnt, spineCurve)
+def createChestControllers(rad, rootJnt, spineCurve, driverCount=3):
+    rootJnt, pelvisJnt, Bchain, IKchain, driverChain, spineCurve, spineIK = createChestSpline(rad, rootJnt, spineCurve, driverCount)
     
     # Creating and Positioning Chest Controllers
-    baseSpineGrp = 0
-    names = ['baseSpine', 'midSpine', 'Chest']
-    for i in range(0,3):
+    names = getDriverNames('baseSpine', 'midSpine', 'Chest', driverCount)
+    driverTransforms = getWorldTransforms(getWorldMatrices(driverChain))
+    for i in range(0, driverCount):
         
         # Determining Controller Radius
-        if i == 0:
-            newRad = rad + 3
-        elif i == 1:
-            newRad = rad + 5
-        else:
-            newRad = rad + 7
+        newRad = rad + 3 + (4.0 * i / (driverCount-1))
         
         # Positioning Controllers
-        spineCtrl = cmds.circle(name = names[i] + '_Ctrl', r=newRad)[0]
-        spineGrp = cmds.group(spineCtrl, name = names[i] + '__Offset')
-        pointConst = cmds.pointConstraint(driverChain[i], spineGrp)
-        cmds.delete(pointConst)
-        currentX = cmds.getAttr(spineGrp + '.rotateX')
-        cmds.setAttr(spineGrp + '.rotateX', currentX + 90)
+        spineCtrl = registerNode(names[i] + '_Ctrl', cmds.circle(name = scopedName(names[i] + '_Ctrl'), r=newRad)[0])
+        spineGrp = registerNode(names[i] + '__Offset', cmds.group(spineCtrl, name = scopedName(names[i] + '__Offset')))
+        cmds.xform(spineGrp, translation=driverTransforms[i][0], rotation=(90, 0, 0), worldSpace=True)
         
         # Storing Base Spine Group for Later
         if i == 0:
             baseSpineGrp = spineGrp
         
     # Creating Controller Hierarchy
-    cmds.parent(names[2] + '__Offset', names[1] + '_Ctrl')
-    cmds.parent(names[1] + '__Offset', names[0] + '_Ctrl')
-    for i in range(0,3):
-        cmds.parent(names[i] + '_j', names[i] + '_Ctrl')
+    for i in range(1, driverCount):
+        cmds.parent(getNode(names[i] + '__Offset'), getNode(names[i-1] + '_Ctrl'))
+    for i in range(0, driverCount):
+        cmds.parent(driverChain[i], getNode(names[i] + '_Ctrl'))
         
     # Parenting Spine Controllers to Bind
-    for i in range(0,4):
+    for i in range(0, len(Bchain)-1):
         cmds.parentConstraint(IKchain[i], Bchain[i], mo=True)
-    cmds.parentConstraint('Chest_Ctrl', Bchain[4], mo=True)
+    cmds.parentConstraint(getNode('Chest_Ctrl'), Bchain[-1], mo=True)
     
     # Hiding Driving Joints
     for jnt in driverChain:
@@ -173,14 +416,14 @@ def createChestControllers(rad, rootJnt, spineCurve):
     return rootJnt, pelvisJnt, Bchain, IKchain, driverChain, spineCurve, spineIK, baseSpineGrp
     
 # *** Creating Controls for and Connecting Spine to Root and Pelvis 
-def createRootAndPelvis(rad, rootJnt, spineCurve):
-    rootJnt, pelvisJnt, Bchain, IKchain, driverChain, spineCurve, spineIK, baseSpineGrp = createChestControllers(rad, rootJnt, spineCurve)
+def createRootAndPelvis(rad, rootJnt, spineCurve, driverCount=3):
+    rootJnt, pelvisJnt, Bchain, IKchain, driverChain, spineCurve, spineIK, baseSpineGrp = createChestControllers(rad, rootJnt, spineCurve, driverCount)
     
     # Positioning Root Control
     rootRad = rad + 10
-    rootCtrl = cmds.circle(name = 'Root_Ctrl', r=rootRad)[0]
+    rootCtrl = registerNode('Root_Ctrl', cmds.circle(name = scopedName('Root_Ctrl'), r=rootRad)[0])
     cmds.color(rootCtrl, rgb=[1,1,0])
-    rootGrp = cmds.group(rootCtrl, name = 'Root__Offset')
+    rootGrp = registerNode('Root__Offset', cmds.group(rootCtrl, name = scopedName('Root__Offset')))
     pointConst = cmds.pointConstraint(rootJnt, rootGrp)
     cmds.delete(pointConst)
     currentX = cmds.getAttr(rootGrp + '.rotateX')
@@ -193,8 +436,8 @@ def createRootAndPelvis(rad, rootJnt, spineCurve):
     
     # Positioning Pelvis Control
     pelvisRad = rad + 6
-    pelvisCtrl = cmds.circle(name = 'Pelvis_Ctrl', r=pelvisRad)[0]
-    pelvisGrp = cmds.group(pelvisCtrl, name = 'Pelvis__Offset')
+    pelvisCtrl = registerNode('Pelvis_Ctrl', cmds.circle(name = scopedName('Pelvis_Ctrl'), r=pelvisRad)[0])
+    pelvisGrp = registerNode('Pelvis__Offset', cmds.group(pelvisCtrl, name = scopedName('Pelvis__Offset')))
     pointConst = cmds.pointConstraint(pelvisJnt, pelvisGrp)
     cmds.delete(pointConst)
     currentX = cmds.getAttr(pelvisGrp + '.rotateX')
@@ -209,15 +452,15 @@ def createRootAndPelvis(rad, rootJnt, spineCurve):
     return rootJnt, pelvisJnt, Bchain, IKchain, driverChain, spineCurve, spineIK, baseSpineGrp
     
 # *** Setting Up Advanced Twist on Spine IK Handle ***
-def setSpineAdvancedTwist(rad, rootJnt, spineCurve):
-    rootJnt, pelvisJnt, Bchain, IKchain, driverChain, spineCurve, spineIK, baseSpineGrp = createRootAndPelvis(rad, rootJnt, spineCurve)
+def setSpineAdvancedTwist(rad, rootJnt, spineCurve, driverCount=3):
+    rootJnt, pelvisJnt, Bchain, IKchain, driverChain, spineCurve, spineIK, baseSpineGrp = createRootAndPelvis(rad, rootJnt, spineCurve, driverCount)
     
     # Enabling and Setting Up Advanced Twist
     cmds.setAttr(spineIK + '.dTwistControlEnable', 1)
     cmds.setAttr(spineIK + '.dWorldUpType', 4)
     cmds.setAttr(spineIK + '.dWorldUpAxis', 4)
-    cmds.connectAttr('Pelvis_Ctrl.worldMatrix[0]', spineIK + '.dWorldUpMatrix', f=True)
-    cmds.connectAttr('Chest_Ctrl.worldMatrix[0]', spineIK + '.dWorldUpMatrixEnd', f=True)
+    cmds.connectAttr(getNode('Pelvis_Ctrl') + '.worldMatrix[0]', spineIK + '.dWorldUpMatrix', f=True)
+    cmds.connectAttr(getNode('Chest_Ctrl') + '.worldMatrix[0]', spineIK + '.dWorldUpMatrixEnd', f=True)
     
     # Returning Necessary Items
     return Bchain
@@ -230,18 +473,12 @@ def setSpineAdvancedTwist(rad, rootJnt, spineCurve):
 def getNeckJoints(rad, neckJnt, chestBchain, mesh):
     
     # Creating Bind Joint Chain
-    Bchain = cmds.listRelatives(neckJnt, ad=True, type='joint')
-    Bchain.reverse()
-    Bchain.insert(0, neckJnt)
+    Bchain = getJointChain(neckJnt)
 
     # Creating IK Joint Chain
-    IKchain = cmds.duplicate(Bchain, name='Neck_Chain', renameChildren=True)
-    cmds.parent(IKchain[0], world=True)
-    names = ['IK_Neck1_j', 'IK_Neck2_j', 'IK_Head_j']
-    newIKchain = []
-    for i in range(0,3):
-        cmds.rename(IKchain[i], names[i])
-        newIKchain.append(names[i])
+    names = ['IK_Neck' + str((i+1)) + '_j' for i in range(0, len(Bchain)-1)] + ['IK_Head_j']
+    IKchain = createJointsFromMatrices(Bchain, [scopedName(name) for name in names])
+    newIKchain = [registerNode(name, jnt) for name, jnt in zip(names, IKchain)]
     
     # Hiding IK Chain
     cmds.hide(newIKchain[0])
@@ -250,80 +487,58 @@ def getNeckJoints(rad, neckJnt, chestBchain, mesh):
     return Bchain, newIKchain
 
 # *** Creating IK Spline Curve and Driving Joints ***
-def createNeckSpline(rad, neckJnt, chestBchain, mesh):
+def createNeckSpline(rad, neckJnt, chestBchain, mesh, driverCount=2):
     Bchain, IKchain = getNeckJoints(rad, neckJnt, chestBchain, mesh)
     
     # Creating Neck IK Spline Handle
-    neckIK, neckEffector, neckCurve = cmds.ikHandle(sj=IKchain[0], ee=IKchain[-1], sol='ikSplineSolver')
-    cmds.rename(neckCurve, 'neckCurve')
-    neckCurve = 'neckCurve'
-    cmds.rename(neckIK, 'Neck_IKhandle')
-    neckIK = 'Neck_IKhandle'
+    neckIK, neckEffector, neckCurve = cmds.ikHandle(sj=IKchain[0], ee=IKchain[-1], sol='ikSplineSolver', ns=driverCount-1)
+    neckCurve = registerNode('neckCurve', cmds.rename(neckCurve, scopedName('neckCurve')))
+    neckIK = registerNode('Neck_IKhandle', cmds.rename(neckIK, scopedName('Neck_IKhandle')))
     cmds.hide(neckIK)
     
-    # Getting Top and Bottom Positions
-    cmds.select(clear=True)
-    bottomPos = []
-    topPos = []
-    duplicateJnt = cmds.duplicate(IKchain[-1])[0]
-    cmds.parent(duplicateJnt, world=True)
-    for axis in 'XYZ':
-        bottomPos.append(cmds.getAttr(IKchain[0] + '.translate' + axis))
-        topPos.append(cmds.getAttr(duplicateJnt + '.translate' + axis))
-    cmds.delete(duplicateJnt)
-    
-    # Making Top and Bottom Joints
-    bottomDriver = cmds.joint(p=bottomPos, name='Neck_j')
-    cmds.select(clear=True)
-    topDriver = cmds.joint(p=topPos, name='Head_j')
-    cmds.select(clear=True)
-    cmds.parent(topDriver, bottomDriver)
-    cmds.select(clear=True)
+    # Making Driver Joints Along the Curve
+    names = getDriverNames('Neck', 'midNeck', 'Head', driverCount)
+    driverChain = createDriverJoints(neckCurve, names)
     
     # Skinning Driver Joints to Curve
-    driverChain = [bottomDriver, topDriver]
-    cmds.skinCluster(driverChain, neckCurve, mi=2, name='NeckCurve_SkinCluster')
+    neckSkin = cmds.skinCluster(driverChain, neckCurve, mi=2, name=scopedName('NeckCurve_SkinCluster'))[0]
     cmds.hide(driverChain[0])
     
     # Painting Curve Weights
-    cmds.skinPercent('NeckCurve_SkinCluster', neckCurve + '.cv[0]', transformValue=[(bottomDriver, 1.0)])
-    cmds.skinPercent('NeckCurve_SkinCluster', neckCurve + '.cv[1]', transformValue=[(bottomDriver, 1.0)])
-    cmds.skinPercent('NeckCurve_SkinCluster', neckCurve + '.cv[2]', transformValue=[(topDriver, 1.0)])
-    cmds.skinPercent('NeckCurve_SkinCluster', neckCurve + '.cv[3]', transformValue=[(topDriver, 1.0)])
+    setCurveWeights(neckSkin, neckCurve, driverChain, blendWidth=0.0)
     
     # Returning Items
     return Bchain, IKchain, driverChain, neckCurve, neckIK
     
 # *** Creating and Implementing Neck Controllers ***
-def createNeckControllers(rad, neckJnt, chestBchain, mesh):
-    Bchain, IKchain, driverChain, neckCurve, neckIK = createNeckSpline(rad, neckJnt, chestBchain, mesh)
+def createNeckControllers(rad, neckJnt, chestBchain, mesh, driverCount=2):
+    Bchain, IKchain, driverChain, neckCurve, neckIK = createNeckSpline(rad, neckJnt, chestBchain, mesh, driverCount)
     
     # Positioning Controllers
-    names = ['Neck', 'Head']
-    for i in range(0,2):
-        neckCtrl = cmds.circle(name = names[i] + '_Ctrl', r=rad+3)[0]
-        neckGrp = cmds.group(neckCtrl, name = names[i] + '__Offset')
-        pointConst = cmds.pointConstraint(driverChain[i], neckGrp)
-        cmds.delete(pointConst)
-        currentX = cmds.getAttr(neckGrp + '.rotateX')
-        cmds.setAttr(neckGrp + '.rotateX', currentX + 90)
+    names = getDriverNames('Neck', 'midNeck', 'Head', driverCount)
+    driverTransforms = getWorldTransforms(getWorldMatrices(driverChain))
+    for i in range(0, driverCount):
+        neckCtrl = registerNode(names[i] + '_Ctrl', cmds.circle(name = scopedName(names[i] + '_Ctrl'), r=rad+3)[0])
+        neckGrp = registerNode(names[i] + '__Offset', cmds.group(neckCtrl, name = scopedName(names[i] + '__Offset')))
+        cmds.xform(neckGrp, translation=driverTransforms[i][0], rotation=(90, 0, 0), worldSpace=True)
         
     # Fixing Head Control Positioning
     bbox = cmds.xform(mesh, bb=True, query=True)
     for i in range(0,8):
-        cmds.select('Head_Ctrl.cv[' + str(i) + ']') 
+        cmds.select(getNode('Head_Ctrl') + '.cv[' + str(i) + ']') 
         cmds.move(bbox[4], moveY=True, absolute=True)
         cmds.select(clear=True)
         
     # Creating Controller Hierarchy
-    cmds.parent(names[1] + '__Offset', names[0] + '_Ctrl')
-    for i in range(0,2):
-        cmds.parent(names[i] + '_j', names[i] + '_Ctrl')
+    for i in range(1, driverCount):
+        cmds.parent(getNode(names[i] + '__Offset'), getNode(names[i-1] + '_Ctrl'))
+    for i in range(0, driverCount):
+        cmds.parent(driverChain[i], getNode(names[i] + '_Ctrl'))
 
     # Parenting Spine Controllers to Bind
-    for i in range(0,2):
+    for i in range(0, len(Bchain)-1):
         cmds.parentConstraint(IKchain[i], Bchain[i], mo=True)
-    cmds.parentConstraint('Head_Ctrl', Bchain[2], mo=True)
+    cmds.parentConstraint(getNode('Head_Ctrl'), Bchain[-1], mo=True)
 
     # Hiding Driving Joints
     for jnt in driverChain:
@@ -333,26 +548,26 @@ def createNeckControllers(rad, neckJnt, chestBchain, mesh):
     return Bchain, IKchain, driverChain, neckCurve, neckIK
     
 # *** Setting Up Advanced Twist on Spine IK Handle ***
-def setNeckAdvancedTwist(rad, neckJnt, chestBchain, mesh):
-    Bchain, IKchain, driverChain, neckCurve, neckIK = createNeckControllers(rad, neckJnt, chestBchain, mesh)
+def setNeckAdvancedTwist(rad, neckJnt, chestBchain, mesh, driverCount=2):
+    Bchain, IKchain, driverChain, neckCurve, neckIK = createNeckControllers(rad, neckJnt, chestBchain, mesh, driverCount)
     
     # Enabling and Setting Up Advanced Twist
     cmds.setAttr(neckIK + '.dTwistControlEnable', 1)
     cmds.setAttr(neckIK + '.dWorldUpType', 4)
     cmds.setAttr(neckIK + '.dWorldUpAxis', 4)
-    cmds.connectAttr('Neck_Ctrl.worldMatrix[0]', neckIK + '.dWorldUpMatrix', f=True)
-    cmds.connectAttr('Head_Ctrl.worldMatrix[0]', neckIK + '.dWorldUpMatrixEnd', f=True)
+    cmds.connectAttr(getNode('Neck_Ctrl') + '.worldMatrix[0]', neckIK + '.dWorldUpMatrix', f=True)
+    cmds.connectAttr(getNode('Head_Ctrl') + '.worldMatrix[0]', neckIK + '.dWorldUpMatrixEnd', f=True)
     
     # Returning Items
     return Bchain, IKchain, driverChain, neckCurve, neckIK
 
-def createHeadAim(rad, neckJnt, chestBchain, mesh):
-    Bchain, IKchain, driverChain, neckCurve, neckIK = setNeckAdvancedTwist(rad, neckJnt, chestBchain, mesh)
+def createHeadAim(rad, neckJnt, chestBchain, mesh, driverCount=2):
+    Bchain, IKchain, driverChain, neckCurve, neckIK = setNeckAdvancedTwist(rad, neckJnt, chestBchain, mesh, driverCount)
     
     # Creating Head Aim Control
-    aimCtrl = cmds.circle(name = 'Aim_Ctrl', r=rad)[0]
-    aimGrp = cmds.group(aimCtrl, name = 'Aim__Offset')
-    pointConst = cmds.pointConstraint('Head__Offset', aimGrp)
+    aimCtrl = registerNode('Aim_Ctrl', cmds.circle(name = scopedName('Aim_Ctrl'), r=rad)[0])
+    aimGrp = registerNode('Aim__Offset', cmds.group(aimCtrl, name = scopedName('Aim__Offset')))
+    pointConst = cmds.pointConstraint(getNode('Head__Offset'), aimGrp)
     cmds.delete(pointConst)
     
     # Positioning Aim Control and Setting Constraint
@@ -365,9 +580,33 @@ def createHeadAim(rad, neckJnt, chestBchain, mesh):
     #cmds.connectAttr(aimCtrl + '.Head_Aim', 'Head__Offset_aimConstraint1.Aim_CtrlW0')
     
     # Returning Necessary Items
-    return 'Neck__Offset', 'Chest_Ctrl'
+    return getNode('Neck__Offset'), getNode('Chest_Ctrl')
     
     
+# **** TWIST DISTRIBUTION ****
+
+
+# *** Distributing Upper and Lower Limb Twist with One Node ***
+def createTwistDistribution(side, limb, upperSource, upperJnts, lowerSource=None, lowerJnts=None, upperScale=1.0, lowerScale=1.0):
+    twistNode = cmds.shadingNode('multiplyDivide', asUtility=True, name=scopedName(side + '_' + limb + '_Twist_MultDiv'))
+    
+    # Splitting Upper Twist Evenly Through X Channel
+    if upperJnts:
+        cmds.connectAttr(upperSource, twistNode + '.input1X', force=True)
+        cmds.setAttr(twistNode + '.input2X', upperScale / len(upperJnts))
+        for jnt in upperJnts:
+            cmds.connectAttr(twistNode + '.outputX', jnt + '.rotateX', force=True)
+    
+    # Splitting Lower Twist Evenly Through Y Channel
+    if lowerSource and lowerJnts:
+        cmds.connectAttr(lowerSource, twistNode + '.input1Y', force=True)
+        cmds.setAttr(twistNode + '.input2Y', lowerScale / len(lowerJnts))
+        for jnt in lowerJnts:
+            cmds.connectAttr(twistNode + '.outputY', jnt + '.rotateX', force=True)
+    
+    return twistNode
+
+
 # **** CREATING ARMS ****
 
 
@@ -386,62 +625,19 @@ def createArmChainLists(size, side, limb, topJoint):
     else:
         jntNames = ['Hip', 'Knee', 'Ankle']
     
-    # Creating and Renaming IK Joint Chain    
-    IKchain = cmds.duplicate(Bchain, name='IK_Chain', renameChildren=True)
-    cmds.delete(IKchain[size])
-    cmds.parent(IKchain[0], world=True)
-    newIKchain = []
-    baseIKchain = []
-    for i in range(0, size):
-        cmds.rename(IKchain[i], side + '_' + limb + '_IK_' + str((i+1)) + '_j')
-        newIKchain.append(side + '_' + limb + '_IK_' + str((i+1)) + '_j')
-    
-    # Creating IK Base Joint Chain
-    baseIKchain = cmds.duplicate(newIKchain, name='IK_Base_', renameChildren=True)
-    for i in range(0, size):
-        if i == ((size-1)/2):
-            cmds.parent('IK_Base_' + str(((size-1)/2)), 'IK_Base_')
-        if i == (size-1):
-            cmds.parent('IK_Base_' + str((size-1)), 'IK_Base_' + str(((size-1)/2)))
-    cmds.delete('IK_Base_' + str(1))
-    cmds.delete('IK_Base_' + str(((size-1)/2)+1))
-    
-    # Renaming IK Base Joint Chain
-    newBaseIKchain = []
-    for i in range(0,3):
-        if i == 0:
-            cmds.rename('IK_Base_', side + '_' + limb + '_IK_Base_' + str((i+1)) + '_j')
-        if i == 1:
-            cmds.rename('IK_Base_' + str(((size-1)/2)), side + '_' + limb + '_IK_Base_' + str((i+1)) + '_j')
-        if i == 2:
-            cmds.rename('IK_Base_' + str((size-1)), side + '_' + limb + '_IK_Base_' + str((i+1)) + '_j')
-        newBaseIKchain.append(side + '_' + limb + '_IK_Base_' + str((i+1)) + '_j')
+    # Creating IK and FK Joint Chains Down to the Joint Past the Wrist, Without the Fingers
+    newIKchain = createJointsFromMatrices(Bchain[:size+1], [scopedName(side + '_' + limb + '_IK_' + str((i+1)) + '_j') for i in range(0, size+1)])
+    newFKchain = createJointsFromMatrices(Bchain[:size+1], [scopedName(side + '_' + limb + '_FK_' + str((i+1)) + '_j') for i in range(0, size+1)])
     
-    # Hiding IK Chains
+    # Creating IK Base Joint Chain from the Top, Middle, and Bottom Joints
+    baseJnts = [Bchain[0], Bchain[(size-1)//2], Bchain[size-1]]
+    newBaseIKchain = createJointsFromMatrices(baseJnts, [scopedName(side + '_' + limb + '_IK_Base_' + str((i+1)) + '_j') for i in range(0, 3)])
+    
+    # Hiding IK and FK Chains
     cmds.hide(newIKchain[0])
     cmds.hide(newBaseIKchain[0])
-
-    # Creating FK Joint Chain  
-    FKchain = cmds.duplicate(Bchain, name='FK_Chain', renameChildren=True)
-    cmds.delete(FKchain[size])
-    cmds.parent(FKchain[0], world=True)
-    newFKchain = []
-    for i in range(0, size):
-        cmds.rename(FKchain[i], side + '_' + limb + '_FK_' + str((i+1)) + '_j')
-        newFKchain.append(side + '_' + limb + '_FK_' + str((i+1)) + '_j')
     cmds.hide(newFKchain[0])
     
-    # Adding Last Joint to Chains
-    size = size + 1
-    veryBottomIKjnt = cmds.duplicate(Bchain[size-1], name=side+'_'+limb+'_IK_'+str(size)+'_j', rc=True)[0]
-    cmds.delete(cmds.listRelatives(veryBottomIKjnt))
-    cmds.parent(veryBottomIKjnt, world=True)
-    veryBottomFKjnt = cmds.duplicate(veryBottomIKjnt, name=side+'_'+limb+'_FK_'+str(size)+'_j')[0]
-    cmds.parent(veryBottomIKjnt, side+'_'+limb+'_IK_'+str(size-1)+'_j')
-    cmds.parent(veryBottomFKjnt, side+'_'+limb+'_FK_'+str(size-1)+'_j')
-    newIKchain.append(veryBottomIKjnt)
-    newFKchain.append(veryBottomFKjnt)
-    
     return newIKchain, newBaseIKchain, newFKchain, Bchain
 
 # *** Creating the Switch Controller ***
@@ -455,8 +651,8 @@ def createArmSwitchController(rad, size, side, limb, topJoint):
         switchRad = rad-2
     
     # Creating Switch and Group
-    switchCtrl = cmds.circle(nr=(0,1,0), r=switchRad, name=side + '_' + limb + '_Switch_Ctrl')[0]
-    switchCtrlGroup = cmds.group(switchCtrl, name=switchCtrl + '__Offset')
+    switchCtrl = registerNode(side + '_' + limb + '_Switch_Ctrl', cmds.circle(nr=(0,1,0), r=switchRad, name=scopedName(side + '_' + limb + '_Switch_Ctrl'))[0])
+    switchCtrlGroup = registerNode(side + '_' + limb + '_Switch_Ctrl__Offset', cmds.group(switchCtrl, name=switchCtrl + '__Offset'))
     
     # Coloring Control Based on Side
     if side == 'L':
@@ -512,7 +708,7 @@ def createArmJointControllers(rad, size, side, limb, topJoint):
         # Determining Controller Size
         if i == 0:
             FKctrl = cmds.circle(name = FKchain[i] + '_Ctrl', r=rad+3, degree=1)[0]
-        elif i == ((size-1)/2):
+        elif i == ((size-1)//2):
             FKctrl = cmds.circle(name = FKchain[i] + '_Ctrl', r=rad+3, degree=1)[0]
         elif i == size:
             FKctrl = cmds.circle(name = FKchain[i] + '_Ctrl', r=rad+3, degree=1)[0]
@@ -557,7 +753,7 @@ def createArmJointControllers(rad, size, side, limb, topJoint):
     
     # Creating IK Handle and Controls for End of IK Chain
     IKhand = cmds.ikHandle(sj=baseIKchain[0], ee=baseIKchain[-1])[0]
-    IKbottomCtrl = cmds.circle(name = side + '_IK_' + bottom + '_Ctrl', r=rad+2)[0]
+    IKbottomCtrl = registerNode(side + '_IK_' + bottom + '_Ctrl', cmds.circle(name = scopedName(side + '_IK_' + bottom + '_Ctrl'), r=rad+2)[0])
     cmds.setAttr(IKbottomCtrl+'.rotateY', 90)
     cmds.makeIdentity(IKbottomCtrl, apply=True)
     cmds.select(IKbottomCtrl+'.cv[0:7]')
@@ -570,13 +766,13 @@ def createArmJointControllers(rad, size, side, limb, topJoint):
     cmds.addAttr(IKbottomCtrl, longName='Twist', attributeType='float', defaultValue=0.0, keyable=True)
     
     # Creating Controls for Top of IK Chain
-    IKbottomCtrlGroup = cmds.group(IKbottomCtrl, name=IKbottomCtrl + '__Offset')
-    IKtopCtrl = cmds.circle(name = side + '_IK_' + top + '_Ctrl', r=rad+2)[0]
+    IKbottomCtrlGroup = registerNode(side + '_IK_' + bottom + '_Ctrl__Offset', cmds.group(IKbottomCtrl, name=IKbottomCtrl + '__Offset'))
+    IKtopCtrl = cmds.circle(name = scopedName(side + '_IK_' + top + '_Ctrl'), r=rad+2)[0]
     if side == 'L':
         cmds.color(IKtopCtrl, rgb=(0, 0, 1))
     else:
         cmds.color(IKtopCtrl, rgb=(1, 0, 0))
-    IKtopCtrlGroup = cmds.group(IKtopCtrl, name=IKtopCtrl + '__Offset')
+    IKtopCtrlGroup = registerNode(side + '_IK_' + top + '_Ctrl__Offset', cmds.group(IKtopCtrl, name=IKtopCtrl + '__Offset'))
     
     # Positioning and Implementing Base IK Bottom Control 
     cmds.parent(IKbottomCtrlGroup, IKchain[-1])
@@ -601,61 +797,50 @@ def createArmJointControllers(rad, size, side, limb, topJoint):
     
     # Parenting Base IK to IK Chain
     cmds.parentConstraint(baseIKchain[0], IKchain[0], sr=['x'], mo=True)
-    cmds.parentConstraint(baseIKchain[1], IKchain[((size-1)/2)], mo=True)
+    cmds.parentConstraint(baseIKchain[1], IKchain[((size-1)//2)], mo=True)
     cmds.parentConstraint(baseIKchain[2], IKchain[size], mo=True)
     cmds.hide(baseIKchain[0])
     
     # Creating Proper Rotation if Arm Limb
     if limb == 'Arm':
         
-        # *** UPPER ARM ROTATION ***
-        
-        # Creating Node and Connecting Base IK Shoulder
-        upperMultDivNode = cmds.shadingNode('multiplyDivide', asUtility=True)
-        cmds.connectAttr(baseIKchain[0]+'.rotateX', upperMultDivNode+'.input1X', force=True)
-        cmds.setAttr(upperMultDivNode+'.input2X', 1.0/((size-1)/2.0))
-        
-        # Outputting Multiplied Number to Upper IK Arm Rotations
-        for i in range(0, ((size-1)/2)):
-            cmds.connectAttr(upperMultDivNode+'.outputX', IKchain[i]+'.rotateX', force=True) 
-        
-        # *** LOWER ARM ROTATION ***
+        # *** WRIST TWIST EXTRACTION ***
         
         # Creating Proper Outliner Structure for Wrist
-        cmds.parent(IKchain[-1], IKchain[((size-1)/2)])
+        midIndex = (size-1)//2
+        cmds.parent(IKchain[-1], IKchain[midIndex])
         wristJnt = IKchain[-1]
-        wristExtractJnt = cmds.duplicate(wristJnt, name=side+'_'+limb+'_WristExtractor_j')[0]
-        handJnt = cmds.duplicate(wristJnt, name=side+'_'+limb+'_Hand_j')[0]
-        if side == 'L':
-            cmds.setAttr(handJnt+'.translateX', cmds.getAttr(handJnt+'.translateX')+5)
-        else:
-            cmds.setAttr(handJnt+'.translateX', cmds.getAttr(handJnt+'.translateX')-5)
-        cmds.parent(handJnt, wristJnt)
-        
-        # Setting Up Wrist Extractor Calculations
-        if side == 'L':
-            cmds.aimConstraint(handJnt, wristExtractJnt, wut='none', aim=[1.0,0.0,0.0], u=[0.0,1.0,0.0])
-        else:
-            cmds.aimConstraint(handJnt, wristExtractJnt, wut='none', aim=[-1.0,0.0,0.0], u=[0.0,1.0,0.0])
-        wristLoc = cmds.spaceLocator(name=side+'_IK_Wrist_Loc')[0]
         
-        # Setting Up Wrist Locator to Inherit Calculations
-        parentConst = cmds.parentConstraint(wristJnt, wristLoc)
-        cmds.delete(parentConst)
-        cmds.parent(wristLoc, wristJnt)
-        cmds.orientConstraint(wristJnt, wristExtractJnt, wristLoc)
-        
-        # Transferring Calculation to Forearm Joints
-        lowerMultDivNode01 = cmds.shadingNode('multiplyDivide', asUtility=True)
-        cmds.connectAttr(wristLoc+'.rotateX', lowerMultDivNode01+'.input1X', force=True)
-        cmds.setAttr(lowerMultDivNode01+'.input2X', -(10.0*(1.0/((size-1)/2.0))))
-        lowerMultDivNode02 = cmds.shadingNode('multiplyDivide', asUtility=True)
-        cmds.connectAttr(lowerMultDivNode01+'.outputX', lowerMultDivNode02+'.input1X')
-        cmds.setAttr(lowerMultDivNode02+'.input2X', 1.0/((size-1)/2.0))
-        
-        # Outputting Multiplied Number to Lower IK Arm Rotations
-        for i in range(((size-1)/2)+1, size):
-            cmds.connectAttr(lowerMultDivNode02+'.outputX', IKchain[i]+'.rotateX', force=True) 
+        # Building the Extractor Only with the Twist Subsystem, Which Is the Only Thing That Reads It
+        if not isOmitted('Twist'):
+            uuidsBefore = set(cmds.ls(uuid=True))
+            wristExtractJnt = cmds.duplicate(wristJnt, name=scopedName(side+'_'+limb+'_WristExtractor_j'))[0]
+            handJnt = cmds.duplicate(wristJnt, name=scopedName(side+'_'+limb+'_Hand_j'))[0]
+            if side == 'L':
+                cmds.setAttr(handJnt+'.translateX', cmds.getAttr(handJnt+'.translateX')+5)
+            else:
+                cmds.setAttr(handJnt+'.translateX', cmds.getAttr(handJnt+'.translateX')-5)
+            handJnt = cmds.parent(handJnt, wristJnt)[0]
+            
+            # Setting Up Wrist Extractor Calculations
+            if side == 'L':
+                cmds.aimConstraint(handJnt, wristExtractJnt, wut='none', aim=[1.0,0.0,0.0], u=[0.0,1.0,0.0])
+            else:
+                cmds.aimConstraint(handJnt, wristExtractJnt, wut='none', aim=[-1.0,0.0,0.0], u=[0.0,1.0,0.0])
+            wristLoc = cmds.spaceLocator(name=scopedName(side+'_IK_Wrist_Loc'))[0]
+            
+            # Setting Up Wrist Locator to Inherit Calculations
+            parentConst = cmds.parentConstraint(wristJnt, wristLoc)
+            cmds.delete(parentConst)
+            wristLoc = cmds.parent(wristLoc, wristJnt)[0]
+            cmds.orientConstraint(wristJnt, wristExtractJnt, wristLoc)
+            
+            # *** UPPER AND LOWER ARM ROTATION ***
+            
+            # Distributing Shoulder and Wrist Twist with One Node
+            # (Wrist Locator Only Receives Half the Twist Through Its Blended Orient Constraint)
+            createTwistDistribution(side, limb, baseIKchain[0] + '.rotateX', IKchain[0:midIndex], wristLoc + '.rotateX', IKchain[midIndex+1:size], lowerScale=-2.0)
+            recordRigSubsystem('Twist', uuidsBefore)
     
     # Connecting Controls to Visibility Attributes in Switch
     cmds.connectAttr(switchCtrl + '.FK_Visibility', FKchain[0] + '_Ctrl__Offset.visibility', f=True)
@@ -663,91 +848,126 @@ def createArmJointControllers(rad, size, side, limb, topJoint):
     cmds.connectAttr(switchCtrl + '.IK_Visibility', IKtopCtrlGroup + '.visibility', f=True)
     
     # Creating Controls for Fingers if Limb is Arm
-    if limb == 'Arm':
+    if limb == 'Arm' and not isOmitted('Fingers'):
+        uuidsBefore = set(cmds.ls(uuid=True))
         fingersGrp = createFingerCtrls(Bchain, switchCtrl, rad, size, side, topJoint)
+        recordRigSubsystem('Fingers', uuidsBefore)
     
     # Organizing Everything into Groups
-    FKgroup = cmds.group(FKchain[0] + '_Ctrl__Offset', FKchain[0], name=side + '_FK_Arm__Group')
-    IKjntGroup = cmds.group(IKchain[0], baseIKchain[0], name = side + '_IK_Arm_Joint__Group')
-    IKgroup = cmds.group(IKbottomCtrlGroup, IKtopCtrlGroup, IKhand, IKjntGroup, name=side + '_IK_Arm__Group')
+    FKgroup = registerNode(side + '_FK_Arm__Group', cmds.group(FKchain[0] + '_Ctrl__Offset', FKchain[0], name=scopedName(side + '_FK_Arm__Group')))
+    IKjntGroup = registerNode(side + '_IK_Arm_Joint__Group', cmds.group(IKchain[0], baseIKchain[0], name = scopedName(side + '_IK_Arm_Joint__Group')))
+    IKgroup = registerNode(side + '_IK_Arm__Group', cmds.group(IKbottomCtrlGroup, IKtopCtrlGroup, IKhand, IKjntGroup, name=scopedName(side + '_IK_Arm__Group')))
     
     return IKchain, baseIKchain, FKchain, Bchain, switchCtrl
 
+# *** Getting Finger Name from Base Knuckle ***
+def getFingerName(fingerJnt, side):
+    name = shortName(fingerJnt)
+    if name.startswith(side + '_'):
+        name = name[len(side) + 1:]
+    token = name.split('_')[0]
+    fName = token.rstrip('0123456789') or token
+    return fName[0].upper() + fName[1:]
+
+# *** Discovering Every Finger and Knuckle Under the Hand ***
+def getFingerChains(handJnt, side):
+    fingerChains = []
+    usedNames = []
+    for finger in cmds.listRelatives(handJnt, type='joint') or []:
+        knuckleList = cmds.listRelatives(finger, ad=True, type='joint') or []
+        knuckleList.append(finger)
+        knuckleList.reverse()
+        
+        # Leaving the End Joint of Each Finger Without a Control, as It Only Marks the Tip
+        if len(knuckleList) > 1:
+            knuckleList = knuckleList[:-1]
+        
+        # Keeping Finger Names Unique for Hands with Many Digits
+        fName = getFingerName(finger, side)
+        if fName in usedNames:
+            fName = fName + str(usedNames.count(fName) + 1)
+        usedNames.append(getFingerName(finger, side))
+        
+        isThumb = 'thumb' in fName.lower()
+        fingerChains.append((fName, isThumb, knuckleList))
+    return fingerChains
+
 # *** Creating Controls for Fingers ***
 def createFingerCtrls(Bchain, switchCtrl, rad, size, side, topJoint):
     
     # Creating Empty Group to Put Finger Controls in Later
-    fingersGrp = cmds.group(empty=True, name=side + '_Fingers_Group')
-    parentConstr = cmds.parentConstraint(Bchain[size], fingersGrp)
-    cmds.delete(parentConstr)
+    fingersGrp = registerNode(side + '_Fingers_Group', cmds.group(empty=True, name=scopedName(side + '_Fingers_Group')))
+    handPos, handRot = getWorldTransforms(getWorldMatrices([Bchain[size]]))[0]
+    cmds.xform(fingersGrp, translation=handPos, rotation=handRot, worldSpace=True)
+    
+    # Discovering Fingers and Knuckles
+    fingerChains = getFingerChains(Bchain[size], side)
     
     # Creating Attributes for SDKs
     cmds.addAttr(switchCtrl, longName='_____________', attributeType='short', defaultValue=0, keyable=True)
-    for fName in ['Thumb', 'Index', 'Middle', 'Ring', 'Pinky']:
+    for fName, isThumb, knuckleList in fingerChains:
         cmds.addAttr(switchCtrl, longName=fName + '_Curl', attributeType='float', defaultValue=0.0, keyable=True)
-    for fName in ['Index', 'Middle', 'Ring', 'Pinky']:
-        cmds.addAttr(switchCtrl, longName=fName + '_Spread', attributeType='float', defaultValue=0.0, keyable=True)
-         
-    # Creating Lists of Knuckles for Each Finger
-    fingerList = cmds.listRelatives(Bchain[size])
-    for finger in fingerList:
-        if 'thumb' in finger.lower():
-            jntNum = 3
-        else:
-            jntNum = 4
-        
-        knuckleList = cmds.listRelatives(finger, ad=True, type='joint')
-        knuckleList.append(finger)
-        knuckleList.reverse()
-        for knuckle in knuckleList:
-            knuckle.replace('_jB', '')
-        
-        for i in range(0, jntNum):
-            # Creating Control for Each Knuckle
-            if ('thumb' in finger.lower()) and (i == 0):
-                knuckleCtrl = cmds.circle(name = knuckleList[i] + '_Ctrl', r=rad/2.5, degree=1)[0]
-            else:
-                knuckleCtrl = cmds.circle(name = knuckleList[i] + '_Ctrl', r=rad/4.0, degree=1)[0]
-            
-            # Determining Color of Control Based on Side
-            if side == 'L':
-                cmds.color(knuckleCtrl, rgb=(0, 0, 1))
+    for fName, isThumb, knuckleList in fingerChains:
+        if not isThumb:
+            cmds.addAttr(switchCtrl, longName=fName + '_Spread', attributeType='float', defaultValue=0.0, keyable=True)
+    
+    # Computing Every Knuckle Control Transform in One Pass
+    allKnuckles = [knuckle for fName, isThumb, knuckleList in fingerChains for knuckle in knuckleList]
+    knuckleTransforms = dict(zip(allKnuckles, getWorldTransforms(getWorldMatrices(allKnuckles), rotOffset=(0.0, 90.0, 0.0))))
+    
+    # Creating and Positioning Controls for Each Knuckle
+    allCtrls = []
+    baseOffsets = []
+    sdkConnections = []
+    for fName, isThumb, knuckleList in fingerChains:
+        fingerCtrls = []
+        fingerOffsets = []
+        for i in range(0, len(knuckleList)):
+            ctrlName = scopedName(shortName(knuckleList[i]) + '_Ctrl')
+            if isThumb and (i == 0):
+                knuckleCtrl = cmds.circle(name = ctrlName, r=rad/2.5, degree=1, constructionHistory=False)[0]
             else:
-                cmds.color(knuckleCtrl, rgb=(1, 0, 0))        
-        
-            # Positioning Each Controller        
+                knuckleCtrl = cmds.circle(name = ctrlName, r=rad/4.0, degree=1, constructionHistory=False)[0]
             knuckleSDK = cmds.group(knuckleCtrl, name=knuckleCtrl + '__SDK')
             knuckleOffset = cmds.group(knuckleSDK, name=knuckleCtrl + '__Offset')
-            parentConst = cmds.parentConstraint(knuckleList[i], knuckleOffset)
-            cmds.delete(parentConst)
+            pos, rot = knuckleTransforms[knuckleList[i]]
+            cmds.xform(knuckleOffset, translation=pos, rotation=rot, worldSpace=True)
+            fingerCtrls.append(knuckleCtrl)
+            fingerOffsets.append(knuckleOffset)
+            
+            # Mapping SDK Groups to Attributes
+            if i != 0:
+                if isThumb:
+                    sdkConnections.append((fName + '_Curl', knuckleSDK + '.rotateY'))
+                else:
+                    sdkConnections.append((fName + '_Curl', knuckleSDK + '.rotateX'))
+                    sdkConnections.append((fName + '_Spread', knuckleSDK + '.rotateY'))
         
-            currentCtrlRot = cmds.getAttr(knuckleOffset + '.rotateY')
-            cmds.setAttr(knuckleOffset + '.rotateY', currentCtrlRot + 90)
-    
         # Creating Chain of Knuckle Controllers and Groups
-        for i in range(0, jntNum):
-            if i != 0:
-                cmds.parent(knuckleList[i] + '_Ctrl__Offset', knuckleList[i-1] + '_Ctrl')
-            
+        for i in range(1, len(knuckleList)):
+            cmds.parent(fingerOffsets[i], fingerCtrls[i-1])
+        
         # Constraining Corresponding Controls
-        for i in range(0, jntNum):
-            if i == 0:
-                cmds.parentConstraint(knuckleList[i] + '_Ctrl', knuckleList[i], mo=True)
-            else:
-                cmds.orientConstraint(knuckleList[i] + '_Ctrl', knuckleList[i], mo=True)               
-
-        # Connecting SDK Groups to Attributes           
-        for i in range(1, jntNum):
-            if jntNum == 3:
-                cmds.connectAttr(switchCtrl + '.Thumb_Curl', knuckleList[i] + '_Ctrl__SDK.rotateY',)
-            else:
-                for fName in ['Thumb', 'Index', 'Middle', 'Ring', 'Pinky']:
-                    if fName.lower() in knuckleList[i].lower():
-                        cmds.connectAttr(switchCtrl + '.' + fName + '_Curl', knuckleList[i] + '_Ctrl__SDK.rotateX')
-                        cmds.connectAttr(switchCtrl + '.' + fName + '_Spread', knuckleList[i] + '_Ctrl__SDK.rotateY')
-                        
-        # Adding Everything to Fingers Group
-        cmds.parent(knuckleList[0] + '_Ctrl__Offset', fingersGrp)
+        cmds.parentConstraint(fingerCtrls[0], knuckleList[0], mo=True)
+        for i in range(1, len(knuckleList)):
+            cmds.orientConstraint(fingerCtrls[i], knuckleList[i], mo=True)
+        allCtrls.extend(fingerCtrls)
+        baseOffsets.append(fingerOffsets[0])
+    
+    # Determining Color of Controls Based on Side
+    if allCtrls:
+        if side == 'L':
+            cmds.color(allCtrls, rgb=(0, 0, 1))
+        else:
+            cmds.color(allCtrls, rgb=(1, 0, 0))
+    
+    # Connecting SDK Groups to Attributes
+    for attr, sdkPlug in sdkConnections:
+        cmds.connectAttr(switchCtrl + '.' + attr, sdkPlug)
+    
+    # Adding Everything to Fingers Group
+    if baseOffsets:
+        cmds.parent(baseOffsets, fingersGrp)
         
     # Making Fingers Follow the Arm
     cmds.parentConstraint(cmds.listRelatives(switchCtrl, parent=True)[0], fingersGrp, mo=True)
@@ -762,9 +982,9 @@ def parentAndKeyArmJoints(rad, size, side, limb, topJoint):
         
         # Parenting Corresponding Joints
         IKconstr = cmds.parentConstraint(IKchain[i], Bchain[i], mo=True)
-        IKattr = IKconstr[0] + '.' + IKchain[i] + 'W0'
+        IKattr = IKconstr[0] + '.' + shortName(IKchain[i]) + 'W0'
         FKconstr = cmds.parentConstraint(FKchain[i], Bchain[i], mo=True)
-        FKattr = FKconstr[0] +'.' + FKchain[i] + 'W1'
+        FKattr = FKconstr[0] +'.' + shortName(FKchain[i]) + 'W1'
         
         # Setting FK SDK
         cmds.setAttr(switchCtrl + '.IK_Blend', 0)
@@ -790,8 +1010,8 @@ def createClavicleCtrl(rad, size, side, limb, clavicleJnt, topJoint):
     IKchain, FKchain, Bchain, switchCtrl = parentAndKeyArmJoints(rad, size, side, limb, topJoint)
     
     # Creating Clavicle Control and Group
-    clavicleCtrl = cmds.circle(name = side + '_Clavicle_Ctrl', r=rad)[0]
-    clavicleGrp = cmds.group(clavicleCtrl, name = side + '_Clavicle__Offset')
+    clavicleCtrl = cmds.circle(name = scopedName(side + '_Clavicle_Ctrl'), r=rad)[0]
+    clavicleGrp = registerNode(side + '_Clavicle__Offset', cmds.group(clavicleCtrl, name = scopedName(side + '_Clavicle__Offset')))
     
     # Determining Controller Color
     if side == 'L':
@@ -809,16 +1029,11 @@ def createClavicleCtrl(rad, size, side, limb, clavicleJnt, topJoint):
     newRotY = offsetRotY + 90
     cmds.setAttr(clavicleGrp + '.rotateY', newRotY)
     
-    # Getting New Clavicle Position
-    endDuplicate = cmds.duplicate(clavicleEnd)[0]
-    cmds.parent(endDuplicate, world=True)
-    clavDuplicate = cmds.duplicate(clavicleJnt)[0]
-    cmds.parent(clavDuplicate, world=True)
-    ctrlX = (cmds.getAttr(endDuplicate + '.translateX') - cmds.getAttr(clavDuplicate + '.translateX')) / 2
-    ctrlY = (cmds.getAttr(endDuplicate + '.translateY') - cmds.getAttr(clavDuplicate + '.translateY'))
-    ctrlZ = (cmds.getAttr(endDuplicate + '.translateZ') - cmds.getAttr(clavDuplicate + '.translateZ'))
-    cmds.delete(endDuplicate)
-    cmds.delete(clavDuplicate)
+    # Getting New Clavicle Position from World Positions, Without Duplicating the Arm Below
+    clavPos, endPos = [pos for pos, rot in getWorldTransforms(getWorldMatrices([clavicleJnt, clavicleEnd]))]
+    ctrlX = (endPos[0] - clavPos[0]) / 2
+    ctrlY = (endPos[1] - clavPos[1])
+    ctrlZ = (endPos[2] - clavPos[2])
     
     # Setting New Rotation
     cmds.select(clavicleCtrl + '.cv[0:7]')
@@ -827,8 +1042,8 @@ def createClavicleCtrl(rad, size, side, limb, clavicleJnt, topJoint):
     
     # Creating Constraints
     orientConst = cmds.orientConstraint(clavicleCtrl, clavicleJnt, mo=True)
-    FKparentConst = cmds.parentConstraint(clavicleCtrl, side + '_' + limb + '_FK_1_j_Ctrl__Offset', mo=True)
-    IKparentConst = cmds.parentConstraint(clavicleCtrl, side + '_IK_Shoulder_Ctrl__Offset', mo=True)
+    FKparentConst = cmds.parentConstraint(clavicleCtrl, FKchain[0] + '_Ctrl__Offset', mo=True)
+    IKparentConst = cmds.parentConstraint(clavicleCtrl, getNode(side + '_IK_Shoulder_Ctrl__Offset'), mo=True)
     
     # Returning Necessary Items
     return clavicleGrp
@@ -849,51 +1064,23 @@ def createLegChainLists(size, side, limb, topJoint):
     # Creating List of Joint Names
     jntNames = ['Hip', 'Knee', 'Ankle']
     
-    # Creating and Renaming IK Joint Chain    
-    IKchain = cmds.duplicate(Bchain, name='IK_Chain', renameChildren=True)
-    IKfootJnt = IKchain[size]
-    cmds.parent(IKfootJnt, world=True)
-    cmds.parent(IKchain[0], world=True)
-    newIKchain = []
-    baseIKchain = []
-    for i in range(0, size):
-        cmds.rename(IKchain[i], side + '_' + limb + '_IK_' + str((i+1)) + '_j')
-        newIKchain.append(side + '_' + limb + '_IK_' + str((i+1)) + '_j')
-
-    # Creating IK Base Joint Chain
-    baseIKchain = cmds.duplicate(newIKchain, name='IK_Base_', renameChildren=True)
-    for i in range(0, size):
-        if i == ((size-1)/2):
-            cmds.parent('IK_Base_' + str(((size-1)/2)), 'IK_Base_')
-        if i == (size-1):
-            cmds.parent('IK_Base_' + str((size-1)), 'IK_Base_' + str(((size-1)/2)))
-    cmds.delete('IK_Base_' + str(1))
-    cmds.delete('IK_Base_' + str(((size-1)/2)+1))
-    
-    # Renaming IK Base Joint Chain
-    newBaseIKchain = []
-    for i in range(0,3):
-        if i == 0:
-            cmds.rename('IK_Base_', side + '_' + limb + '_IK_Base_' + str((i+1)) + '_j')
-        if i == 1:
-            cmds.rename('IK_Base_' + str(((size-1)/2)), side + '_' + limb + '_IK_Base_' + str((i+1)) + '_j')
-        if i == 2:
-            cmds.rename('IK_Base_' + str((size-1)), side + '_' + limb + '_IK_Base_' + str((i+1)) + '_j')
-        newBaseIKchain.append(side + '_' + limb + '_IK_Base_' + str((i+1)) + '_j')
+    # Creating IK Joint Chain, with Foot, Ball, and Toe IK Joints Numbered After the Leg, Like the FK Chain
+    newIKchain = createJointsFromMatrices(Bchain[:size], [scopedName(side + '_' + limb + '_IK_' + str((i+1)) + '_j') for i in range(0, size)])
+    IKfootJnt = createJointsFromMatrices(Bchain[size:size+3], [scopedName(side + '_' + limb + '_IK_' + str((size+i+1)) + '_j') for i in range(0, 3)])[0]
+
+    # Creating IK Base Joint Chain from the Top, Middle, and Bottom Joints
+    baseJnts = [Bchain[0], Bchain[(size-1)//2], Bchain[size-1]]
+    newBaseIKchain = createJointsFromMatrices(baseJnts, [scopedName(side + '_' + limb + '_IK_Base_' + str((i+1)) + '_j') for i in range(0, 3)])
     
     # Hiding IK Chains
     cmds.hide(newIKchain[0])
     cmds.hide(newBaseIKchain[0])
     cmds.hide(IKfootJnt)
     
-    # Creating FK Joint Chain  
-    FKchain = cmds.duplicate(Bchain, name='FK_Chain', renameChildren=True)
-    cmds.parent(FKchain[0], world=True)
-    newFKchain = []
-    for i in range(0, size+2):
-        cmds.rename(FKchain[i], side + '_' + limb + '_FK_' + str((i+1)) + '_j')
-        newFKchain.append(side + '_' + limb + '_FK_' + str((i+1)) + '_j')
+    # Creating FK Joint Chain Down to the Toe
+    newFKchain = createJointsFromMatrices(Bchain[:size+3], [scopedName(side + '_' + limb + '_FK_' + str((i+1)) + '_j') for i in range(0, size+3)])
     cmds.hide(newFKchain[0])
+    newFKchain = newFKchain[:size+2]
     
     return newIKchain, newBaseIKchain, newFKchain, Bchain, IKfootJnt
 
@@ -908,8 +1095,8 @@ def createLegSwitchController(rad, size, side, limb, topJoint):
         switchRad = rad-2
     
     # Creating Switch and Group
-    switchCtrl = cmds.circle(nr=(0,1,0), r=switchRad, name=side + '_' + limb + '_Switch_Ctrl')[0]
-    switchCtrlGroup = cmds.group(switchCtrl, name=switchCtrl + '__Offset')
+    switchCtrl = registerNode(side + '_' + limb + '_Switch_Ctrl', cmds.circle(nr=(0,1,0), r=switchRad, name=scopedName(side + '_' + limb + '_Switch_Ctrl'))[0])
+    switchCtrlGroup = registerNode(side + '_' + limb + '_Switch_Ctrl__Offset', cmds.group(switchCtrl, name=switchCtrl + '__Offset'))
     
     # Coloring Control Based on Side
     if side == 'L':
@@ -962,7 +1149,7 @@ def createLegJointControllers(rad, size, side, limb, topJoint):
         # Determining Controller Size
         if i == 0:
             FKctrl = cmds.circle(name = FKchain[i] + '_Ctrl', r=rad+3, degree=1)[0]
-        elif i == ((size-1)/2):
+        elif i == ((size-1)//2):
             FKctrl = cmds.circle(name = FKchain[i] + '_Ctrl', r=rad+3, degree=1)[0]
         elif i == size:
             FKctrl = cmds.circle(name = FKchain[i] + '_Ctrl', r=rad+3, degree=1)[0]
@@ -1008,7 +1195,7 @@ def createLegJointControllers(rad, size, side, limb, topJoint):
     
     # Creating IK Handle and Controls for End of IK Chain
     IKhand = cmds.ikHandle(sj=baseIKchain[0], ee=baseIKchain[-1])[0]
-    IKbottomCtrl = cmds.circle(name = side + '_IK_' + bottom + '_Ctrl', r=rad+2)[0]
+    IKbottomCtrl = registerNode(side + '_IK_' + bottom + '_Ctrl', cmds.circle(name = scopedName(side + '_IK_' + bottom + '_Ctrl'), r=rad+2)[0])
     cmds.setAttr(IKbottomCtrl+'.rotateY', 90)
     cmds.makeIdentity(IKbottomCtrl, apply=True)
     cmds.select(IKbottomCtrl+'.cv[0:7]')
@@ -1021,13 +1208,13 @@ def createLegJointControllers(rad, size, side, limb, topJoint):
     cmds.addAttr(IKbottomCtrl, longName='Twist', attributeType='float', defaultValue=0.0, keyable=True)
     
     # Creating Controls for Top of IK Chain
-    IKbottomCtrlGroup = cmds.group(IKbottomCtrl, name=IKbottomCtrl + '__Offset')
-    IKtopCtrl = cmds.circle(name = side + '_IK_' + top + '_Ctrl', r=rad+2)[0]
+    IKbottomCtrlGroup = registerNode(side + '_IK_' + bottom + '_Ctrl__Offset', cmds.group(IKbottomCtrl, name=IKbottomCtrl + '__Offset'))
+    IKtopCtrl = cmds.circle(name = scopedName(side + '_IK_' + top + '_Ctrl'), r=rad+2)[0]
     if side == 'L':
         cmds.color(IKtopCtrl, rgb=(0, 0, 1))
     else:
         cmds.color(IKtopCtrl, rgb=(1, 0, 0))
-    IKtopCtrlGroup = cmds.group(IKtopCtrl, name=IKtopCtrl + '__Offset')
+    IKtopCtrlGroup = registerNode(side + '_IK_' + top + '_Ctrl__Offset', cmds.group(IKtopCtrl, name=IKtopCtrl + '__Offset'))
     
     # Positioning and Implementing Base IK Bottom Control 
     cmds.parent(IKbottomCtrlGroup, IKchain[-1])
@@ -1038,14 +1225,18 @@ def createLegJointControllers(rad, size, side, limb, topJoint):
     cmds.connectAttr(IKbottomCtrl + '.Twist', IKhand + '.twist', f=True)
     cmds.hide(IKhand)
     
-    # Creating Rotation Distribution for Upper Leg
-    upperMultDivNode = cmds.shadingNode('multiplyDivide', asUtility=True)
-    cmds.connectAttr(baseIKchain[0]+'.rotateX', upperMultDivNode+'.input1X', force=True)
-    cmds.setAttr(upperMultDivNode+'.input2X', 1.0/((size-1)/2.0))
+    # Extracting Foot Twist Relative to the Shin, Only for the Twist Subsystem
+    midIndex = (size-1)//2
+    if not isOmitted('Twist'):
+        uuidsBefore = set(cmds.ls(uuid=True))
+        ankleLoc = cmds.spaceLocator(name=scopedName(side+'_IK_Ankle_Loc'))[0]
+        ankleLoc = cmds.parent(ankleLoc, IKchain[-1], relative=True)[0]
+        cmds.orientConstraint(IKfootJnt, ankleLoc, mo=True)
+        cmds.hide(ankleLoc)
         
-    # Outputting Multiplied Number to Upper Arm Rotations
-    for i in range(0, ((size-1)/2)):
-        cmds.connectAttr(upperMultDivNode+'.outputX', IKchain[i]+'.rotateX', force=True) 
+        # Creating Rotation Distribution for Upper and Lower Leg
+        createTwistDistribution(side, limb, baseIKchain[0] + '.rotateX', IKchain[0:midIndex], ankleLoc + '.rotateX', IKchain[midIndex+1:size-1])
+        recordRigSubsystem('Twist', uuidsBefore)
     
     # Positioning and Implementing IK Top Control 
     parentConst = cmds.parentConstraint(IKchain[0], IKtopCtrlGroup)
@@ -1056,7 +1247,7 @@ def createLegJointControllers(rad, size, side, limb, topJoint):
     
     # Parenting Base IK to IK Chain
     cmds.parentConstraint(baseIKchain[0], IKchain[0], sr=['x'], mo=True)
-    cmds.parentConstraint(baseIKchain[1], IKchain[((size-1)/2)], mo=True)
+    cmds.parentConstraint(baseIKchain[1], IKchain[((size-1)//2)], mo=True)
     cmds.parentConstraint(baseIKchain[2], IKchain[size-1], mo=True)
     cmds.hide(baseIKchain[0])
     
@@ -1066,9 +1257,9 @@ def createLegJointControllers(rad, size, side, limb, topJoint):
     cmds.connectAttr(switchCtrl + '.IK_Visibility', IKtopCtrlGroup + '.visibility', f=True)
     
     # Organizing Everything into Groups
-    FKgroup = cmds.group(FKchain[0] + '_Ctrl__Offset', FKchain[0], name=side + '_FK_Leg__Group')
-    IKjntGroup = cmds.group(IKchain[0], baseIKchain[0], name=side + '_IK_Leg_Joint__Group')
-    IKgroup = cmds.group(IKbottomCtrlGroup, IKtopCtrlGroup, IKjntGroup, name=side + '_IK_Leg__Group')
+    FKgroup = registerNode(side + '_FK_Leg__Group', cmds.group(FKchain[0] + '_Ctrl__Offset', FKchain[0], name=scopedName(side + '_FK_Leg__Group')))
+    IKjntGroup = registerNode(side + '_IK_Leg_Joint__Group', cmds.group(IKchain[0], baseIKchain[0], name=scopedName(side + '_IK_Leg_Joint__Group')))
+    IKgroup = registerNode(side + '_IK_Leg__Group', cmds.group(IKbottomCtrlGroup, IKtopCtrlGroup, IKjntGroup, name=scopedName(side + '_IK_Leg__Group')))
     cmds.parent(IKhand, IKbottomCtrl)
     
     # Returning Necessary Items
@@ -1090,9 +1281,9 @@ def parentAndKeyLegJoints(rad, size, side, limb, topJoint):
         
         # Parenting Corresponding Joints
         IKconstr = cmds.parentConstraint(ikJnt, Bchain[i], mo=True)
-        IKattr = IKconstr[0] + '.' + ikJnt + 'W0'
+        IKattr = IKconstr[0] + '.' + shortName(ikJnt) + 'W0'
         FKconstr = cmds.parentConstraint(FKchain[i], Bchain[i], mo=True)
-        FKattr = FKconstr[0] +'.' + FKchain[i] + 'W1'
+        FKattr = FKconstr[0] +'.' + shortName(FKchain[i]) + 'W1'
         
         # Setting FK SDK
         cmds.setAttr(switchCtrl + '.IK_Blend', 0)
@@ -1125,17 +1316,17 @@ def createFootControls(rad, size, side, limb, heelLoc, tippyToeLoc, outerToesLoc
     # Creating Locators to Place at Ball Joint
     parentConstr = cmds.parentConstraint(IKballJnt, ballLoc)
     cmds.delete(parentConstr)
-    toesLoc  = cmds.duplicate(ballLoc, name = side + '_ToesLoc')
-    grindLoc = cmds.duplicate(toesLoc, name = side + '_GrindLoc') 
+    toesLoc  = cmds.duplicate(ballLoc, name = scopedName(side + '_ToesLoc'))
+    grindLoc = cmds.duplicate(toesLoc, name = scopedName(side + '_GrindLoc')) 
     
     # Creating Duplicates of Locators
-    heelChild = cmds.duplicate(heelLoc, name = side + '_HeelChild')
-    tippyToeChild = cmds.duplicate(tippyToeLoc, name = side + '_TippyToeChild')
-    grindChild = cmds.duplicate(grindLoc, name = side + '_GrindChild')
-    outerToesChild = cmds.duplicate(outerToesLoc, name = side + '_OuterToesChild')
-    innerToesChild = cmds.duplicate(innerToesLoc, name = side + '_InnerToesChild')
-    ballChild = cmds.duplicate(ballLoc, name = side + '_BallChild')
-    toesChild = cmds.duplicate(toesLoc, name = side + '_ToesChild')
+    heelChild = cmds.duplicate(heelLoc, name = scopedName(side + '_HeelChild'))
+    tippyToeChild = cmds.duplicate(tippyToeLoc, name = scopedName(side + '_TippyToeChild'))
+    grindChild = cmds.duplicate(grindLoc, name = scopedName(side + '_GrindChild'))
+    outerToesChild = cmds.duplicate(outerToesLoc, name = scopedName(side + '_OuterToesChild'))
+    innerToesChild = cmds.duplicate(innerToesLoc, name = scopedName(side + '_InnerToesChild'))
+    ballChild = cmds.duplicate(ballLoc, name = scopedName(side + '_BallChild'))
+    toesChild = cmds.duplicate(toesLoc, name = scopedName(side + '_ToesChild'))
     
     # Putting Children Under Parents
     cmds.parent(heelChild, heelLoc)
@@ -1147,7 +1338,7 @@ def createFootControls(rad, size, side, limb, heelLoc, tippyToeLoc, outerToesLoc
     cmds.parent(toesChild, toesLoc)
     
     # Creating Proper Chain of Locators and Joints
-    cmds.parent(heelLoc, side + '_IK_' + 'Ankle_Ctrl')
+    cmds.parent(heelLoc, getNode(side + '_IK_' + 'Ankle_Ctrl'))
     cmds.parent(tippyToeLoc, heelChild)
     cmds.parent(grindLoc, tippyToeChild)
     cmds.parent(outerToesLoc, grindChild)
@@ -1158,52 +1349,161 @@ def createFootControls(rad, size, side, limb, heelLoc, tippyToeLoc, outerToesLoc
     
     # Setting up Constraints and ikHandles
     cmds.pointConstraint(IKchain[-1], IKfootJnt, mo=True)
-    ballIK = cmds.ikHandle(name = side + '_Ball_IK_Handle', sj=IKfootJnt, ee=IKballJnt, sol='ikSCsolver')[0]
-    toesIK = cmds.ikHandle(name = side + '_Toes_IK_Handle', sj=IKballJnt, ee=IKtoesJnt, sol='ikSCsolver')[0]
+    ballIK = cmds.ikHandle(name = scopedName(side + '_Ball_IK_Handle'), sj=IKfootJnt, ee=IKballJnt, sol='ikSCsolver')[0]
+    toesIK = cmds.ikHandle(name = scopedName(side + '_Toes_IK_Handle'), sj=IKballJnt, ee=IKtoesJnt, sol='ikSCsolver')[0]
     cmds.hide(ballIK, toesIK)
     cmds.parent(ballIK, ballChild)
     cmds.parent(toesIK, toesChild)
     cmds.parent(IKfootChain[0], ballChild)
     
     # *** Adding Attributes to Foot Controller ***
-    footCtrl = side + '_IK_Ankle_Ctrl'
+    footCtrl = getNode(side + '_IK_Ankle_Ctrl')
+    if not isOmitted('FootRoll'):
+        uuidsBefore = set(cmds.ls(uuid=True))
     
-    # Heel Roll
-    cmds.addAttr(footCtrl, longName=side+'_Heel_Roll', attributeType='float', defaultValue=0.0, keyable=True)
-    cmds.connectAttr(footCtrl + '.' + side + '_Heel_Roll', heelChild[0] + '.rotateX')
+        # Heel Roll
+        cmds.addAttr(footCtrl, longName=side+'_Heel_Roll', attributeType='float', defaultValue=0.0, keyable=True)
+        cmds.connectAttr(footCtrl + '.' + side + '_Heel_Roll', heelChild[0] + '.rotateX')
     
-    # Ball Roll
-    cmds.addAttr(footCtrl, longName=side+'_Ball_Roll', attributeType='float', defaultValue=0.0, keyable=True)
-    cmds.connectAttr(footCtrl + '.' + side + '_Ball_Roll', ballChild[0] + '.rotateZ')
+        # Ball Roll
+        cmds.addAttr(footCtrl, longName=side+'_Ball_Roll', attributeType='float', defaultValue=0.0, keyable=True)
+        cmds.connectAttr(footCtrl + '.' + side + '_Ball_Roll', ballChild[0] + '.rotateZ')
     
-    # Tippy Toe
-    cmds.addAttr(footCtrl, longName=side+'_Tippy_Toe', attributeType='float', defaultValue=0.0, keyable=True)
-    cmds.connectAttr(footCtrl + '.' + side + '_Tippy_Toe', tippyToeChild[0] + '.rotateX')
+        # Tippy Toe
+        cmds.addAttr(footCtrl, longName=side+'_Tippy_Toe', attributeType='float', defaultValue=0.0, keyable=True)
+        cmds.connectAttr(footCtrl + '.' + side + '_Tippy_Toe', tippyToeChild[0] + '.rotateX')
     
-    # Grind
-    cmds.addAttr(footCtrl, longName=side+'_Grind', attributeType='float', defaultValue=0.0, keyable=True)
-    cmds.connectAttr(footCtrl + '.' + side + '_Grind', grindChild[0] + '.rotateY')
+        # Grind
+        cmds.addAttr(footCtrl, longName=side+'_Grind', attributeType='float', defaultValue=0.0, keyable=True)
+        cmds.connectAttr(footCtrl + '.' + side + '_Grind', grindChild[0] + '.rotateY')
     
-    # Inner Toe
-    cmds.addAttr(footCtrl, longName=side+'_Inner_Toe', attributeType='float', defaultValue=0.0, keyable=True)
-    cmds.connectAttr(footCtrl + '.' + side + '_Inner_Toe', innerToesChild[0] + '.rotateZ')
+        # Inner Toe
+        cmds.addAttr(footCtrl, longName=side+'_Inner_Toe', attributeType='float', defaultValue=0.0, keyable=True)
+        cmds.connectAttr(footCtrl + '.' + side + '_Inner_Toe', innerToesChild[0] + '.rotateZ')
     
-    # Outer Toe
-    cmds.addAttr(footCtrl, longName=side+'_Outer_Toe', attributeType='float', defaultValue=0.0, keyable=True)
-    cmds.connectAttr(footCtrl + '.' + side + '_Outer_Toe', outerToesChild[0] + '.rotateZ')
+        # Outer Toe
+        cmds.addAttr(footCtrl, longName=side+'_Outer_Toe', attributeType='float', defaultValue=0.0, keyable=True)
+        cmds.connectAttr(footCtrl + '.' + side + '_Outer_Toe', outerToesChild[0] + '.rotateZ')
     
-    # Toes
-    cmds.addAttr(footCtrl, longName=side+'_Toes', attributeType='float', defaultValue=0.0, keyable=True)
-    cmds.connectAttr(footCtrl + '.' + side + '_Toes', toesChild[0] + '.rotateZ')
+        # Toes
+        cmds.addAttr(footCtrl, longName=side+'_Toes', attributeType='float', defaultValue=0.0, keyable=True)
+        cmds.connectAttr(footCtrl + '.' + side + '_Toes', toesChild[0] + '.rotateZ')
+        recordRigSubsystem('FootRoll', uuidsBefore)
     
     # Hiding Locators
     cmds.hide(heelLoc)
     
     # Connecting to Rest of Body
-    cmds.parentConstraint('Pelvis_Ctrl', side + '_IK_Hip_Ctrl__Offset', mo=True)
-    cmds.parentConstraint('Pelvis_Ctrl', side + '_Leg_FK_1_j_Ctrl__Offset', mo=True)
+    cmds.parentConstraint(getNode('Pelvis_Ctrl'), getNode(side + '_IK_Hip_Ctrl__Offset'), mo=True)
+    cmds.parentConstraint(getNode('Pelvis_Ctrl'), FKchain[0] + '_Ctrl__Offset', mo=True)
 
     
+# *** Finding Both Leg Joints Under the Pelvis ***
+def getLegJoints(rootJnt):
+    for child in cmds.listRelatives(rootJnt):
+        if 'Pelvis' in shortName(child) or 'pelvis' in shortName(child):
+            pelvisJnt = child
+    legJnts = {}
+    for child in cmds.listRelatives(pelvisJnt):
+        if 'L_' in shortName(child):
+            legJnts['L'] = child
+        if 'R_' in shortName(child):
+            legJnts['R'] = child
+    return legJnts
+
+# *** Finding Foot Pivots from Mesh Vertices Around the Foot ***
+def findFootPivots(points, footPos, ballPos, toePos, centerPos):
+    numpy = getNumpy()
+    
+    # Getting Forward and Outward Directions of the Foot Along the Ground, from the Ball if the Toe Is Right Above or Below the Ankle
+    for tipPos in [toePos, ballPos]:
+        fwd = [tipPos[0] - footPos[0], 0.0, tipPos[2] - footPos[2]]
+        footLength = math.sqrt((fwd[0] * fwd[0]) + (fwd[2] * fwd[2]))
+        if footLength > 1e-6:
+            break
+    else:
+        cmds.error("The toe and ball joints are right above or below the ankle at " + str(footPos) + ", so the foot has no forward direction.")
+    fwd = [fwd[0] / footLength, 0.0, fwd[2] / footLength]
+    outward = [fwd[2], 0.0, -fwd[0]]
+    if ((footPos[0] - centerPos[0]) * outward[0]) + ((footPos[2] - centerPos[2]) * outward[2]) < 0:
+        outward = [-outward[0], 0.0, -outward[2]]
+    
+    # Keeping Vertices Below the Ankle and Near the Foot, Measured Along and Across It
+    if numpy is not None:
+        pts = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+        rel = pts - numpy.array(footPos)
+        along = rel.dot(numpy.array(fwd))
+        across = rel.dot(numpy.array(outward))
+        near = (pts[:, 1] <= footPos[1]) & (numpy.abs(across) <= footLength) & (along >= -footLength) & (along <= footLength * 2.0)
+        candidates = list(zip(along[near].tolist(), across[near].tolist(), pts[near, 1].tolist()))
+    else:
+        candidates = []
+        for v in range(0, len(points) // 3):
+            x, y, z = points[v*3:v*3+3]
+            along = ((x - footPos[0]) * fwd[0]) + ((z - footPos[2]) * fwd[2])
+            across = ((x - footPos[0]) * outward[0]) + ((z - footPos[2]) * outward[2])
+            if y <= footPos[1] and abs(across) <= footLength and -footLength <= along <= footLength * 2.0:
+                candidates.append((along, across, y))
+    if not candidates:
+        cmds.error("No mesh vertices found around the foot at " + str(footPos) + ".")
+    
+    # Taking Extremes of the Foot for Heel, Toe Tip, and Sides of the Ball
+    groundY = min(c[2] for c in candidates)
+    ballAlong = ((ballPos[0] - footPos[0]) * fwd[0]) + ((ballPos[2] - footPos[2]) * fwd[2])
+    ballBand = [c for c in candidates if abs(c[0] - ballAlong) <= footLength * 0.15] or candidates
+    def place(along, across):
+        return [footPos[0] + (fwd[0] * along) + (outward[0] * across), groundY, footPos[2] + (fwd[2] * along) + (outward[2] * across)]
+    ballAcross = ((ballPos[0] - footPos[0]) * outward[0]) + ((ballPos[2] - footPos[2]) * outward[2])
+    return {
+        'Ball': [ballPos[0], groundY, ballPos[2]],
+        'Heel': place(min(c[0] for c in candidates), ballAcross),
+        'TippyToe': place(max(c[0] for c in candidates), ballAcross),
+        'OuterToes': place(ballAlong, max(c[1] for c in ballBand)),
+        'InnerToes': place(ballAlong, min(c[1] for c in ballBand)),
+    }
+
+# *** Placing Foot Locators of Both Sides from One Read of the Mesh ***
+def placeFootLocators(mesh, rootJnt, prefix=''):
+    points = cmds.xform(mesh + '.vtx[*]', query=True, translation=True, worldSpace=True)
+    centerPos = getWorldTransforms(getWorldMatrices([rootJnt]))[0][0]
+    placed = {}
+    for side, legJnt in sorted(getLegJoints(rootJnt).items()):
+        
+        # Getting Foot, Ball, and Toe Joints at the End of the Leg
+        legChain = getJointChain(legJnt)
+        footPos, ballPos, toePos = [pos for pos, rot in getWorldTransforms(getWorldMatrices(legChain[-3:]))]
+        pivots = findFootPivots(points, footPos, ballPos, toePos, centerPos)
+        
+        # Creating Any Missing Locators and Moving Them into Place
+        for preset in ['Ball', 'Heel', 'TippyToe', 'OuterToes', 'InnerToes']:
+            loc = prefix + side + '_' + preset + 'Loc'
+            if not cmds.objExists(loc):
+                loc = cmds.spaceLocator(name=loc)[0]
+            cmds.xform(loc, translation=pivots[preset], worldSpace=True)
+            placed[side + '_' + preset + 'Loc'] = loc
+    return placed
+    
+# *** Adding a Level of Detail Switch That Freezes Optional Subsystems ***
+def createLODSwitch(masterCtrl):
+    cmds.addAttr(masterCtrl, longName='LOD', attributeType='enum', enumName='Full:Medium:Low', keyable=True)
+    for subsystem in sorted(lodLevels):
+        
+        # Freezing Only Computing Nodes, So Transforms Above Other Parts of the Rig Keep Updating
+        nodes = cmds.ls(rigRegistry['subsystems'].get(subsystem, []))
+        freezeNodes = cmds.ls(nodes, type='constraint') + [node for node in nodes if not cmds.ls(node, dag=True)]
+        if not freezeNodes:
+            continue
+        
+        # Turning Frozen On Once LOD Reaches the Subsystem's Level
+        condition = cmds.createNode('condition', name=scopedName(subsystem + '_LOD_Condition'))
+        cmds.connectAttr(masterCtrl + '.LOD', condition + '.firstTerm')
+        cmds.setAttr(condition + '.secondTerm', lodLevels[subsystem])
+        cmds.setAttr(condition + '.operation', 3)
+        cmds.setAttr(condition + '.colorIfTrueR', 1)
+        cmds.setAttr(condition + '.colorIfFalseR', 0)
+        for node in freezeNodes:
+            cmds.connectAttr(condition + '.outColorR', node + '.frozen', force=True)
+
 # *** Doing Final Organization for Rig ***
 def finalOrg(mesh, rootJnt, spineCurve, rigName):
     
@@ -1212,7 +1512,7 @@ def finalOrg(mesh, rootJnt, spineCurve, rigName):
     xMin = bbox[2]
     xMax = bbox[5]
     masterRad = xMin - xMax
-    masterCtrl = cmds.circle(name="Master_Ctrl", r=masterRad*1.5)[0]
+    masterCtrl = registerNode('Master_Ctrl', cmds.circle(name=scopedName("Master_Ctrl"), r=masterRad*1.5)[0])
     
     # * Rotating Master Control Into Place *
     cmds.select(masterCtrl + '.cv[0:7]')
@@ -1220,46 +1520,313 @@ def finalOrg(mesh, rootJnt, spineCurve, rigName):
     cmds.select(clear=True)
     
     # * Creating Final Groups *
-    finalRig = cmds.group(masterCtrl, mesh, name=rigName)
-    spineGrp = cmds.group('Spine_IKhandle', spineCurve, name='IK_Spine_Group')
-    neckGrp = cmds.group(em=True, name='IK_Neck_Group')
-    cmds.parent('Neck_IKhandle', 'neckCurve', neckGrp)
-    switchGrp = cmds.group('L_Arm_Switch_Ctrl__Offset', 'R_Arm_Switch_Ctrl__Offset', 'L_Leg_Switch_Ctrl__Offset', 'R_Leg_Switch_Ctrl__Offset', name='Switch_Group')
+    finalRig = registerNode('Rig', cmds.group(masterCtrl, mesh, name=rigName))
+    spineGrp = cmds.group(getNode('Spine_IKhandle'), spineCurve, name=scopedName('IK_Spine_Group'))
+    neckGrp = cmds.group(em=True, name=scopedName('IK_Neck_Group'))
+    cmds.parent(getNode('Neck_IKhandle'), getNode('neckCurve'), neckGrp)
+    switchGrp = cmds.group([getNode(side + '_' + limb + '_Switch_Ctrl__Offset') for limb in ['Arm', 'Leg'] for side in 'LR'], name=scopedName('Switch_Group'))
     
     # * Grouping Rig Properly *
     cmds.parent(spineGrp, neckGrp, finalRig)
-    cmds.parent('Root__Offset', 'Aim__Offset', rootJnt, 'IK_Spine_1_j', 'IK_Neck1_j', switchGrp, masterCtrl)
-    cmds.parent('L_FK_Arm__Group', 'L_IK_Arm__Group', 'R_FK_Arm__Group', 'R_IK_Arm__Group', masterCtrl)
-    cmds.parent('L_FK_Leg__Group', 'L_IK_Leg__Group', 'R_FK_Leg__Group', 'R_IK_Leg__Group', masterCtrl)
-    cmds.parent('L_Fingers_Group', 'R_Fingers_Group', masterCtrl)
+    cmds.parent(getNode('Root__Offset'), getNode('Aim__Offset'), rootJnt, getNode('IK_Spine_1_j'), getNode('IK_Neck1_j'), switchGrp, masterCtrl)
+    cmds.parent(getNode('L_FK_Arm__Group'), getNode('L_IK_Arm__Group'), getNode('R_FK_Arm__Group'), getNode('R_IK_Arm__Group'), masterCtrl)
+    cmds.parent(getNode('L_FK_Leg__Group'), getNode('L_IK_Leg__Group'), getNode('R_FK_Leg__Group'), getNode('R_IK_Leg__Group'), masterCtrl)
+    if not isOmitted('Fingers'):
+        cmds.parent(getNode('L_Fingers_Group'), getNode('R_Fingers_Group'), masterCtrl)
     
-    # * Root Follower *
+    # * Level of Detail Switch *
+    createLODSwitch(masterCtrl)
     
-    # Creating Root Follower Groups
-    L_Arm_RtFollow = cmds.group(em=True, name='L_IK_Arm_RootFollower')
-    parentConst = cmds.parentConstraint('Root_Ctrl', L_Arm_RtFollow)
-    cmds.delete(parentConst)
-    L_Leg_RtFollow = cmds.duplicate(L_Arm_RtFollow, name='L_IK_Leg_RootFollower')
-    R_Arm_RtFollow = cmds.duplicate(L_Arm_RtFollow, name='R_IK_Arm_RootFollower')
-    R_Leg_RtFollow = cmds.duplicate(L_Arm_RtFollow, name='R_IK_Leg_RootFollower')
+    # * IK Joints Following Root *
+    for side in 'LR':
+        for limb in ['Arm', 'Leg']:
+            createMatrixFollow(getNode(side + '_IK_' + limb + '_Joint__Group'), getNode('Root_Ctrl'))
     
-    # Adding Joints Under Groups
-    cmds.parent('L_IK_Arm_Joint__Group', L_Arm_RtFollow)
-    cmds.parent('L_IK_Leg_Joint__Group', L_Leg_RtFollow)
-    cmds.parent('R_IK_Arm_Joint__Group', R_Arm_RtFollow)
-    cmds.parent('R_IK_Leg_Joint__Group', R_Leg_RtFollow)
+    # * Space Switching for IK Controls and Aim *
+    for ctrl, grp, spaces in spaceTargets:
+        for side in (['L_', 'R_'] if ctrl.startswith('IK') else ['']):
+            createSpaceSwitch(getNode(side + ctrl), getNode(side + grp), [(label, getNode(target)) for label, target in spaces])
     
-    # Parenting Root Follow Groups to Root
-    cmds.parentConstraint('Root_Ctrl', L_Arm_RtFollow, mo=True)
-    cmds.parentConstraint('Root_Ctrl', L_Leg_RtFollow, mo=True)
-    cmds.parentConstraint('Root_Ctrl', R_Arm_RtFollow, mo=True)
-    cmds.parentConstraint('Root_Ctrl', R_Leg_RtFollow, mo=True)
     
-    # Moving Root Follow Groups Under Proper Group
-    cmds.parent(L_Arm_RtFollow, 'L_IK_Arm__Group')
-    cmds.parent(L_Leg_RtFollow, 'L_IK_Leg__Group')
-    cmds.parent(R_Arm_RtFollow, 'R_IK_Arm__Group')
-    cmds.parent('R_IK_Leg_RootFollower', 'R_IK_Leg__Group')
+# **** SPACE SWITCHING ****
+
+
+# Controls with Space Switching, Their Offset Groups, and the Spaces They Can Follow, World First: The Aim Cannot Follow the Head It Aims
+spaceTargets = [
+    ('IK_Wrist_Ctrl', 'IK_Wrist_Ctrl__Offset', [('World', 'Master_Ctrl'), ('Root', 'Root_Ctrl'), ('Chest', 'Chest_Ctrl'), ('Head', 'Head_Ctrl')]),
+    ('IK_Ankle_Ctrl', 'IK_Ankle_Ctrl__Offset', [('World', 'Master_Ctrl'), ('Root', 'Root_Ctrl'), ('Pelvis', 'Pelvis_Ctrl')]),
+    ('Aim_Ctrl', 'Aim__Offset', [('World', 'Master_Ctrl'), ('Root', 'Root_Ctrl'), ('Chest', 'Chest_Ctrl')]),
+]
+
+# *** Getting the Offset That Keeps a Node Where It Is When Following a Target ***
+def getFollowOffset(node, target):
+    nodeMatrix, targetMatrix = getWorldMatrices([node, target])
+    localMatrix = om.MMatrix(cmds.getAttr(node + '.matrix'))
+    return localMatrix.inverse() * nodeMatrix * targetMatrix.inverse()
+
+# *** Driving the Offset Parent Matrix of a Node from a Matrix, Relative to Its Parent ***
+def connectOffsetParentMatrix(node, matrixPlug, offsetPlug):
+    multMatrix = cmds.createNode('multMatrix', name=shortName(node) + '_Follow_Matrix')
+    cmds.connectAttr(offsetPlug, multMatrix + '.matrixIn[0]')
+    cmds.connectAttr(matrixPlug, multMatrix + '.matrixIn[1]')
+    cmds.connectAttr(cmds.listRelatives(node, parent=True, fullPath=True)[0] + '.worldInverseMatrix[0]', multMatrix + '.matrixIn[2]')
+    cmds.connectAttr(multMatrix + '.matrixSum', node + '.offsetParentMatrix')
+    return multMatrix
+
+# *** Making a Node Follow a Target Without a Constraint or Extra Group ***
+def createMatrixFollow(node, target):
+    cmds.addAttr(node, longName='Follow_Offset', dataType='matrix')
+    cmds.setAttr(node + '.Follow_Offset', *list(getFollowOffset(node, target)), type='matrix')
+    return connectOffsetParentMatrix(node, target + '.worldMatrix[0]', node + '.Follow_Offset')
+
+# *** Adding a Space Enum to a Control That Picks Which Target Its Offset Group Follows ***
+def createSpaceSwitch(ctrl, grp, spaces):
+    cmds.addAttr(ctrl, longName='Space', attributeType='enum', enumName=':'.join([label for label, target in spaces]), keyable=True)
+    cmds.addAttr(grp, longName='Space_Offset', dataType='matrix', multi=True)
+    
+    # Choosing the Target Matrix and Its Offset by the Enum, So Each Control Needs Only Three Nodes
+    spaceChoice = cmds.createNode('choice', name=shortName(ctrl) + '_Space_Choice')
+    offsetChoice = cmds.createNode('choice', name=shortName(ctrl) + '_Space_Offset_Choice')
+    for i in range(0, len(spaces)):
+        cmds.setAttr(grp + '.Space_Offset[' + str(i) + ']', *list(getFollowOffset(grp, spaces[i][1])), type='matrix')
+        cmds.connectAttr(grp + '.Space_Offset[' + str(i) + ']', offsetChoice + '.input[' + str(i) + ']')
+        cmds.connectAttr(spaces[i][1] + '.worldMatrix[0]', spaceChoice + '.input[' + str(i) + ']')
+    cmds.connectAttr(ctrl + '.Space', spaceChoice + '.selector')
+    cmds.connectAttr(ctrl + '.Space', offsetChoice + '.selector')
+    return connectOffsetParentMatrix(grp, spaceChoice + '.output', offsetChoice + '.output')
+
+
+# **** CONTROL REGISTRY ****
+
+
+# Limb of the Controls Each Build Stage Creates
+stageLimbs = {'Spine': 'Spine', 'Neck': 'Neck', 'Arms': 'Arm', 'Legs': 'Leg', 'Final': 'Master'}
+
+# *** Getting the Side of a Control from Its Name ***
+def getControlSide(name):
+    if name.startswith('L_') or name.startswith('R_'):
+        return name[0]
+    return 'C'
+
+# *** Getting the Default Value of Every Keyable Channel of a Control, as Built ***
+def getControlDefaults(ctrl):
+    defaults = {}
+    for attr in cmds.listAttr(ctrl, keyable=True, unlocked=True, scalar=True) or []:
+        # Skipping Divider Attributes That Only Separate Others in the Channel Box
+        if attr.strip('_'):
+            defaults[attr] = cmds.getAttr(ctrl + '.' + attr)
+    return defaults
+
+# *** Registering Every Control on the Master Controller, So Tools Find Them in One Lookup ***
+def registerControls(masterCtrl):
+    fingerUuids = set(rigRegistry['subsystems'].get('Fingers', []))
+    controls = []
+    for stage in ['Spine', 'Neck', 'Arms', 'Legs', 'Final']:
+        for uuid in rigRegistry['stages'].get(stage, []):
+            node = cmds.ls(uuid)
+            
+            # Keeping Only Curve Transforms Named as Controls, Not Their Offset and SDK Groups
+            if not node or not node[0].endswith('_Ctrl') or not cmds.listRelatives(node[0], shapes=True, type='nurbsCurve'):
+                continue
+            name = shortName(node[0])
+            if rigRegistry['prefix'] and name.startswith(rigRegistry['prefix']):
+                name = name[len(rigRegistry['prefix']):]
+            limb = 'Fingers' if uuid in fingerUuids else stageLimbs[stage]
+            controls.append((node[0], {'name': name, 'side': getControlSide(name), 'limb': limb, 'stage': stage, 'defaults': getControlDefaults(node[0])}))
+    
+    # Connecting Each Control by Message, So Renames Do Not Break the Registry
+    cmds.addAttr(masterCtrl, longName='controls', attributeType='message', multi=True)
+    cmds.addAttr(masterCtrl, longName='controlInfo', dataType='string')
+    for i in range(0, len(controls)):
+        cmds.connectAttr(controls[i][0] + '.message', masterCtrl + '.controls[' + str(i) + ']')
+    cmds.setAttr(masterCtrl + '.controlInfo', json.dumps([info for ctrl, info in controls], sort_keys=True), type='string')
+    return dict((info['name'], info) for ctrl, info in controls)
+
+
+# **** VERIFYING THE BUILD ****
+
+
+# Largest Position Drift, in Scene Units, and Rotation Drift, in Degrees, a Bind Joint Can Have After Building
+verifyTolerances = {'position': 1e-3, 'rotation': 0.01}
+
+# Foot Roll Attributes of Each IK Ankle Control, After the Side Letter
+footRollAttrs = ['Heel_Roll', 'Ball_Roll', 'Tippy_Toe', 'Toes', 'Grind', 'Inner_Toe', 'Outer_Toe']
+
+# *** Capturing the Bind Skeleton Before Building, by UUID So Reparenting Does Not Matter ***
+def captureBindPose(rootJnt):
+    joints = [rootJnt] + (cmds.listRelatives(rootJnt, allDescendents=True, type='joint', fullPath=True) or [])
+    uuids = [cmds.ls(jnt, uuid=True)[0] for jnt in joints]
+    return {'uuids': uuids, 'names': [shortName(jnt) for jnt in joints], 'matrices': [list(matrix) for matrix in getWorldMatrices(joints)]}
+
+# *** Measuring Position and Rotation Drift Between Two Lists of World Matrices, All Joints at Once with NumPy ***
+def getMatrixDrift(before, after):
+    numpy = getNumpy()
+    if numpy is not None:
+        before = numpy.array(before).reshape(-1, 4, 4)
+        after = numpy.array(after).reshape(-1, 4, 4)
+        positions = numpy.linalg.norm(after[:, 3, :3] - before[:, 3, :3], axis=1)
+        
+        # The Angle Between Two Rotations Comes from the Trace of One Times the Other's Inverse
+        cosines = (numpy.einsum('nij,nij->n', before[:, :3, :3], after[:, :3, :3]) - 1.0) / 2.0
+        rotations = numpy.degrees(numpy.arccos(numpy.clip(cosines, -1.0, 1.0)))
+        return positions.tolist(), rotations.tolist()
+    positions = []
+    rotations = []
+    for matrixA, matrixB in zip(before, after):
+        positions.append(math.sqrt(sum([(matrixB[12 + i] - matrixA[12 + i]) ** 2 for i in range(0, 3)])))
+        cosine = (sum([matrixA[(row * 4) + col] * matrixB[(row * 4) + col] for row in range(0, 3) for col in range(0, 3)]) - 1.0) / 2.0
+        rotations.append(math.degrees(math.acos(min(max(cosine, -1.0), 1.0))))
+    return positions, rotations
+
+# *** Getting the Built Pose of a Rig, with Finger and Foot Roll Attributes at Zero and IK_Blend at One Value ***
+def getVerifyPose(channels, blend):
+    values = []
+    for name, default in zip(channels['names'], channels['defaults']):
+        ctrl, attr = name.split('.', 1)
+        if attr == 'IK_Blend':
+            default = blend
+        elif attr.endswith('_Curl') or attr.endswith('_Spread'):
+            default = 0.0
+        elif ctrl.endswith('_IK_Ankle_Ctrl') and [roll for roll in footRollAttrs if attr.endswith('_' + roll)]:
+            default = 0.0
+        values.append(default)
+    return {'channels': list(channels['names']), 'values': values}
+
+# *** Checking a Built Rig Leaves the Bind Skeleton Where It Was, in FK and in IK, and Reporting Each Joint's Drift ***
+def verifyRig(masterCtrl, bindPose, tolerances=None):
+    import poseLibrary
+    if tolerances is None:
+        tolerances = verifyTolerances
+    joints = [cmds.ls(uuid, long=True)[0] for uuid in bindPose['uuids']]
+    channels = poseLibrary.getChannels(masterCtrl)
+    currentPose = poseLibrary.capturePose(masterCtrl, channels=channels)
+    
+    # Posing Every Limb in FK, Then in IK, Reading the Whole Skeleton Once for Each
+    drift = {}
+    try:
+        for label, blend in [('FK', 0.0), ('IK', 1.0)]:
+            poseLibrary.applyPose(masterCtrl, getVerifyPose(channels, blend), channels=channels)
+            drift[label] = getMatrixDrift(bindPose['matrices'], [list(matrix) for matrix in getWorldMatrices(joints)])
+    finally:
+        poseLibrary.applyPose(masterCtrl, currentPose, channels=channels)
+    
+    # Listing Every Joint with Its Worst Drift, and Those Past the Tolerances
+    report = {'tolerances': dict(tolerances), 'joints': [], 'failed': []}
+    for i in range(0, len(joints)):
+        entry = {'joint': bindPose['names'][i]}
+        for label in ['FK', 'IK']:
+            entry[label] = {'position': drift[label][0][i], 'rotation': drift[label][1][i]}
+        entry['position'] = max(entry['FK']['position'], entry['IK']['position'])
+        entry['rotation'] = max(entry['FK']['rotation'], entry['IK']['rotation'])
+        report['joints'].append(entry)
+        if entry['position'] > tolerances['position'] or entry['rotation'] > tolerances['rotation']:
+            report['failed'].append(entry['joint'])
+    if report['failed']:
+        worst = sorted(report['joints'], key=lambda entry: -entry['position'])[0]
+        cmds.warning('%d bind joints of %s moved after building, worst %s by %.4f units. See the verification report.' % (len(report['failed']), shortName(masterCtrl), worst['joint'], worst['position']))
+    return report
+
+
+# **** SKINNING MESH ****
+
+
+# *** Getting Bone Segments of Each Bind Joint, from the Joint to Each Child Joint ***
+def getBoneSegments(joints):
+    positions = {}
+    for jnt, matrix in zip(joints, getWorldMatrices(joints)):
+        positions[jnt] = [matrix.getElement(3, 0), matrix.getElement(3, 1), matrix.getElement(3, 2)]
+    jointSet = set(joints)
+    segments = []
+    owners = []
+    for i in range(0, len(joints)):
+        children = [child for child in (cmds.listRelatives(joints[i], children=True, type='joint', fullPath=True) or []) if child in jointSet]
+        
+        # End Joints Get a Segment of Zero Length at Their Position
+        for child in children or [joints[i]]:
+            segments.append((positions[joints[i]], positions[child]))
+            owners.append(i)
+    return segments, owners
+
+# *** Computing Skin Weights with NumPy, a Chunk of Vertices at a Time ***
+def computeSkinWeightsNumpy(points, segments, owners, influenceCount, maxInfluences, falloff, chunkSize):
+    numpy = getNumpy()
+    points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+    starts = numpy.array([seg[0] for seg in segments], dtype=numpy.float64)
+    bones = numpy.array([seg[1] for seg in segments], dtype=numpy.float64) - starts
+    boneLengths = numpy.maximum((bones * bones).sum(axis=1), 1e-12)
+    ownerStarts = numpy.flatnonzero(numpy.r_[True, numpy.diff(owners) != 0])
+    weights = numpy.zeros((len(points), influenceCount))
+    for first in range(0, len(points), chunkSize):
+        chunk = points[first:first + chunkSize]
+        
+        # Projecting Every Vertex onto Every Bone Segment
+        offsets = chunk[:, None, :] - starts[None, :, :]
+        t = numpy.clip((offsets * bones[None, :, :]).sum(axis=2) / boneLengths, 0.0, 1.0)
+        closest = offsets - (t[:, :, None] * bones[None, :, :])
+        distances = numpy.minimum.reduceat((closest * closest).sum(axis=2), ownerStarts, axis=1)
+        
+        # Keeping Only the Closest Influences and Normalizing
+        chunkWeights = 1.0 / numpy.power(distances + 1e-6, falloff / 2.0)
+        if maxInfluences < influenceCount:
+            dropped = numpy.argpartition(chunkWeights, influenceCount - maxInfluences, axis=1)[:, :influenceCount - maxInfluences]
+            numpy.put_along_axis(chunkWeights, dropped, 0.0, axis=1)
+        weights[first:first + chunkSize] = chunkWeights / chunkWeights.sum(axis=1)[:, None]
+    return weights.ravel()
+
+# *** Computing Skin Weights in Plain Python When NumPy Is Not Available ***
+def computeSkinWeightsPython(points, segments, owners, influenceCount, maxInfluences, falloff):
+    weights = []
+    for v in range(0, len(points) // 3):
+        p = points[v*3:v*3+3]
+        distances = [None] * influenceCount
+        for (a, b), owner in zip(segments, owners):
+            bone = [b[i] - a[i] for i in range(0, 3)]
+            offset = [p[i] - a[i] for i in range(0, 3)]
+            t = sum(offset[i] * bone[i] for i in range(0, 3)) / max(sum(x * x for x in bone), 1e-12)
+            t = min(max(t, 0.0), 1.0)
+            d = sum((offset[i] - (t * bone[i])) ** 2 for i in range(0, 3))
+            if distances[owner] is None or d < distances[owner]:
+                distances[owner] = d
+        row = [1.0 / ((d + 1e-6) ** (falloff / 2.0)) for d in distances]
+        kept = set(sorted(range(0, influenceCount), key=lambda j: -row[j])[:maxInfluences])
+        row = [row[j] if j in kept else 0.0 for j in range(0, influenceCount)]
+        total = sum(row)
+        weights += [w / total for w in row]
+    return weights
+
+# *** Binding the Mesh to the Bind Skeleton and Writing Every Weight at Once ***
+def bindMesh(mesh, rootJnt, maxInfluences=4, falloff=4.0, chunkSize=20000):
+    numpy = getNumpy()
+    joints = [rootJnt] + list(reversed(cmds.listRelatives(rootJnt, allDescendents=True, type='joint', fullPath=True) or []))
+    joints = cmds.ls(joints, long=True)
+    skinCluster = registerNode('Skin_Cluster', cmds.skinCluster(joints, mesh, toSelectedBones=True, maximumInfluences=maxInfluences, name=scopedName('Skin_Cluster'))[0])
+    
+    # Reading Every Vertex Position in One Call
+    points = cmds.xform(mesh + '.vtx[*]', query=True, translation=True, worldSpace=True)
+    segments, owners = getBoneSegments(joints)
+    if numpy is not None:
+        weights = computeSkinWeightsNumpy(points, segments, owners, len(joints), maxInfluences, falloff, chunkSize).tolist()
+    else:
+        weights = computeSkinWeightsPython(points, segments, owners, len(joints), maxInfluences, falloff)
+    
+    # Matching Joints to Influence Indices
+    selList = om.MSelectionList()
+    selList.add(skinCluster)
+    selList.add(mesh)
+    skinFn = omAnim.MFnSkinCluster(selList.getDependNode(0))
+    meshPath = selList.getDagPath(1)
+    meshPath.extendToShape()
+    influenceIndices = {}
+    for path in skinFn.influenceObjects():
+        influenceIndices[path.fullPathName()] = skinFn.indexForInfluenceObject(path)
+    influences = om.MIntArray([influenceIndices[jnt] for jnt in joints])
+    
+    # Writing Weights for Every Vertex at Once
+    compFn = om.MFnSingleIndexedComponent()
+    components = compFn.create(om.MFn.kMeshVertComponent)
+    compFn.setCompleteData(len(points) // 3)
+    skinFn.setWeights(meshPath, components, influences, om.MDoubleArray(weights), False)
+    return skinCluster
     
     
 # ***** CREATING UI AND FUNCTIONS TO RUN AUTORIG *****
@@ -1273,13 +1840,17 @@ def showRigWindow():
     
     # Creating and Formatting Main Column
     cmds.windowPref(name, remove=True)
-    cmds.window(name, title="Biped Auto Rig", widthHeight=(285,375))
+    cmds.window(name, title="Biped Auto Rig", widthHeight=(285,475))
     column = cmds.columnLayout(columnAttach=('left', 5), rowSpacing=10)
     cmds.text(label = "GARDEN CLUB STUDIOS: AUTO RIG")
     
     # Setting Up Rig Name Text Field
     cmds.text(label = "Rig Name:")
     cmds.textField("rigName")
+    
+    # Setting Up Name Prefix Text Field for Multiple Characters
+    cmds.text(label = "Name Prefix:")
+    cmds.textField("rigPrefix")
 
     # Setting Up Joint Amount
     cmds.text("Spine Control Radius:")
@@ -1297,25 +1868,40 @@ def showRigWindow():
     cmds.text("Leg Control Radius:")
     cmds.intField("legRad", value=1)
     
+    # Setting Up Automatic Skin Binding
+    cmds.checkBox("bindSkin", label="Bind Mesh to Skeleton", value=False)
+    cmds.checkBox("placeFootPivots", label="Place Foot Locators from Mesh", value=False)
+    
     # Creating Create and Close Buttons
-    cmds.text("* Create Left Foot Locators Before Apply *")
+    cmds.text("* Create Left Foot Locators Before Apply, or Place Them from Mesh *")
     cmds.text("* Select Root, Spine Curve, and Mesh Before Apply *")
     cmds.columnLayout(adjustableColumn=True)
     cmds.rowLayout(numberOfColumns=3)
     cmds.button(label="Create Locators", command=createLocators)
     cmds.button(label="Apply", command=onApply)
-    cmds.button(label="Close", command="cmds.deleteUI('{}')".format(name))
+    cmds.button(label="Close", command=lambda *args: cmds.deleteUI(name))
     
     # Finally Displaying Window
     cmds.showWindow()
     
 # Locator Creation Function
 def createLocators(*args):
+    prefix = ''
+    if cmds.textField("rigPrefix", exists=True):
+        prefix = cmds.textField("rigPrefix", query=True, text=True)
+    createFootLocators(prefix)
+
+# Creating Left Foot Locators for a Rig Prefix
+def createFootLocators(prefix=''):
+    locators = []
     for preset in ['Ball', 'Heel', 'TippyToe', 'OuterToes', 'InnerToes']:
-        cmds.spaceLocator(name= 'L_' + preset + 'Loc')
+        locators.append(cmds.spaceLocator(name= prefix + 'L_' + preset + 'Loc')[0])
+    return locators
 
 # Function to Create Rig
 def onApply(*args):
+    import rigValidator
+    
     # ** Getting Items from User Selection **
     userSelectList = checkSelection()
     rootJnt = userSelectList[0]
@@ -1328,27 +1914,97 @@ def onApply(*args):
     neckRad = cmds.intField("neckRad", query=True, value=True)
     armRad = cmds.intField("armRad", query=True, value=True)
     legRad = cmds.intField("legRad", query=True, value=True)
-    print rigName
+    prefix = cmds.textField("rigPrefix", query=True, text=True)
+    bindSkin = cmds.checkBox("bindSkin", query=True, value=True)
+    placeFootPivots = cmds.checkBox("placeFootPivots", query=True, value=True)
+    print(rigName)
+    
+    # ** Checking the Character Before Building **
+    problems = rigValidator.validateSkeleton(getSkeleton(rootJnt, spineCurve, mesh), rootJnt, spineCurve, prefix, placeFootPivots)
+    if problems:
+        cmds.error('The character cannot be rigged:\n' + '\n'.join(problems))
+    
+    # ** Building Rig **
+    buildRig(rootJnt, spineCurve, mesh, rigName, spineRad, neckRad, armRad, legRad, prefix, bindSkin, placeFootPivots)
+
+# Function to Create Many Rigs in One Pass, Each Given as buildRig Keyword Arguments
+def buildRigs(characters):
+    import progressReport
+    
+    # ** Turning Off Undo While Building, and Reporting Progress of Every Stage of Every Character **
+    undoState = cmds.undoInfo(query=True, state=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+    job = progressReport.startProgress('Building Rigs', sum([getRigBuildSteps(**character) for character in characters]))
+    try:
+        registries = []
+        for character in characters:
+            registry = buildRig(progress=job, **character)
+            if registry is None:
+                break
+            registries.append(registry)
+    finally:
+        progressReport.endProgress(job)
+        cmds.undoInfo(stateWithoutFlush=undoState)
+    return registries
+
+# Function to Count the Progress Steps of One Rig Build
+def getRigBuildSteps(bindSkin=False, verify=True, **kwargs):
+    return rigBuildSteps - (0 if bindSkin else 1) - (0 if verify else 1)
+
+# Function to Create Rig Without the UI, for Batch Scripts and Other Tools
+def buildRig(rootJnt, spineCurve, mesh, rigName, spineRad=1, neckRad=1, armRad=1, legRad=1, prefix='', bindSkin=False, placeFootPivots=False, omit=(), progress=None, verify=True):
+    import progressReport
+    
+    # ** Reporting Progress on Its Own Job Unless buildRigs() Shares One **
+    ownJob = progress is None
+    if ownJob:
+        progress = progressReport.startProgress('Building Rig', getRigBuildSteps(bindSkin, verify))
+    try:
+        return buildRigStages(rootJnt, spineCurve, mesh, rigName, spineRad, neckRad, armRad, legRad, prefix, bindSkin, placeFootPivots, omit, progress, verify)
+    finally:
+        if ownJob:
+            progressReport.endProgress(progress)
+
+# Function to Build Each Stage of the Rig, Stopping and Cleaning Up If Cancelled Between Stages
+def buildRigStages(rootJnt, spineCurve, mesh, rigName, spineRad, neckRad, armRad, legRad, prefix, bindSkin, placeFootPivots, omit, progress, verify=True):
+    
+    # ** Scoping Every Created Node to the Prefix and Choosing Subsystems to Leave Out **
+    startRigRegistry(prefix, omit, progress)
+    stageUuids = set(cmds.ls(uuid=True))
+    
+    # ** Capturing the Bind Skeleton to Verify the Build Against **
+    bindPose = captureBindPose(rootJnt) if verify else None
+    
+    # ** Placing Locators of Both Sides from the Mesh **
+    if placeFootPivots:
+        placeFootLocators(mesh, rootJnt, prefix)
     
     # ** Getting Locators Mirrored Onto Right Side **
-    for preset in ['Ball', 'Heel', 'TippyToe', 'OuterToes', 'InnerToes']:
-        leftLoc = ('L_' + preset + 'Loc')
-        rightLoc = cmds.duplicate(leftLoc, name= ('R_' + preset + 'Loc'))[0]
-        currentX = cmds.getAttr(leftLoc + '.translateX')
-        cmds.setAttr(rightLoc + '.translateX', (currentX * -1))
+    else:
+        for preset in ['Ball', 'Heel', 'TippyToe', 'OuterToes', 'InnerToes']:
+            leftLoc = scopedName('L_' + preset + 'Loc')
+            rightLoc = cmds.duplicate(leftLoc, name= scopedName('R_' + preset + 'Loc'))[0]
+            currentX = cmds.getAttr(leftLoc + '.translateX')
+            cmds.setAttr(rightLoc + '.translateX', (currentX * -1))
+    stageUuids = recordRigStage('Locators', stageUuids)
+    if isRigBuildCancelled():
+        return cancelRigBuild(rootJnt, spineCurve)
 
     # ** Creating Chest **
     chestBchain = setSpineAdvancedTwist(spineRad, rootJnt, spineCurve)
+    stageUuids = recordRigStage('Spine', stageUuids)
+    if isRigBuildCancelled():
+        return cancelRigBuild(rootJnt, spineCurve)
 
     # ** Getting Neck and Clavicle Joints **
-    chestJnt = chestBchain[4]
+    chestJnt = chestBchain[-1]
     chestList = cmds.listRelatives(chestJnt)
     for child in chestList:
-        if ('Neck' in child) or ('neck' in child):
+        if ('Neck' in shortName(child)) or ('neck' in shortName(child)):
             neckJnt = child
-        if (('Clavicle' in child) or ('clavicle' in child)) and ('L' in child):
+        if (('Clavicle' in shortName(child)) or ('clavicle' in shortName(child))) and ('L' in shortName(child)):
             LclavicleJnt = child
-        if (('Clavicle' in child) or ('clavicle' in child)) and ('R' in child):
+        if (('Clavicle' in shortName(child)) or ('clavicle' in shortName(child))) and ('R' in shortName(child)):
             RclavicleJnt = child
 
     # ** Getting Arm Joints **
@@ -1358,34 +2014,57 @@ def onApply(*args):
     # ** Creating Head and Neck Rig **
     neckOffset, chestCtrl = createHeadAim(neckRad, neckJnt, chestBchain, mesh)
     cmds.parent(neckOffset, chestCtrl)
+    stageUuids = recordRigStage('Neck', stageUuids)
+    if isRigBuildCancelled():
+        return cancelRigBuild(rootJnt, spineCurve)
 
     # ** Creating Arm Rig **
     LclavicleGrp = createClavicleCtrl(armRad, 11, 'L', 'Arm', LclavicleJnt, LarmJnt)
     RclavicleGrp = createClavicleCtrl(armRad, 11, 'R', 'Arm', RclavicleJnt, RarmJnt)
-    cmds.parent(LclavicleGrp, 'Chest_Ctrl')
-    cmds.parent(RclavicleGrp, 'Chest_Ctrl')
+    cmds.parent(LclavicleGrp, getNode('Chest_Ctrl'))
+    cmds.parent(RclavicleGrp, getNode('Chest_Ctrl'))
+    stageUuids = recordRigStage('Arms', stageUuids)
+    if isRigBuildCancelled():
+        return cancelRigBuild(rootJnt, spineCurve)
 
     # ** Getting Joints for Leg Rig **
-    rootList = cmds.listRelatives(rootJnt)
-    for child in rootList:
-        if 'Pelvis' in child or 'pelvis' in child:
-            pelvisJnt = child
-    pelvisList = cmds.listRelatives(pelvisJnt)
-    for child in pelvisList:
-        if 'L_' in child:
-            LfootJnt = child
-        if 'R_' in child:
-            RfootJnt = child
+    legJnts = getLegJoints(rootJnt)
 
     # ** Creating Leg Rig **
-    createFootControls(legRad, 9, 'L', 'Leg', 'L_HeelLoc', 'L_TippyToeLoc', 'L_OuterToesLoc', 'L_InnerToesLoc', 'L_BallLoc', LfootJnt)
-    createFootControls(legRad, 9, 'R', 'Leg', 'R_HeelLoc', 'R_TippyToeLoc', 'R_OuterToesLoc', 'R_InnerToesLoc', 'R_BallLoc', RfootJnt)
+    for side, footJnt in [('L', legJnts['L']), ('R', legJnts['R'])]:
+        footLocs = [scopedName(side + '_' + preset + 'Loc') for preset in ['Heel', 'TippyToe', 'OuterToes', 'InnerToes', 'Ball']]
+        createFootControls(legRad, 9, side, 'Leg', footLocs[0], footLocs[1], footLocs[2], footLocs[3], footLocs[4], footJnt)
     cmds.hide(rootJnt, spineCurve)
+    stageUuids = recordRigStage('Legs', stageUuids)
+    if isRigBuildCancelled():
+        return cancelRigBuild(rootJnt, spineCurve)
+    
+    # ** Binding Mesh to Bind Skeleton **
+    if bindSkin:
+        bindMesh(mesh, rootJnt)
+        stageUuids = recordRigStage('Skin', stageUuids)
+        if isRigBuildCancelled():
+            return cancelRigBuild(rootJnt, spineCurve)
 
     # ** Doing Final Organization **
     finalOrg(mesh, rootJnt, spineCurve, rigName)
+    stageUuids = recordRigStage('Final', stageUuids)
+    
+    # ** Registering Every Control with Its Side, Limb, Stage, and Defaults **
+    controls = registerControls(getNode('Master_Ctrl'))
+    
+    # ** Verifying the Bind Skeleton Did Not Move, in FK and in IK **
+    verification = None
+    if verify:
+        verification = verifyRig(getNode('Master_Ctrl'), bindPose)
+        recordRigStage('Verify', stageUuids)
+    
+    # ** Returning Names of Every Registered Node and Control, and UUIDs of the Nodes Each Stage and Subsystem Created **
+    return {'prefix': prefix, 'nodes': dict(rigRegistry['nodes']), 'stages': dict(rigRegistry['stages']), 'subsystems': dict(rigRegistry['subsystems']), 'controls': controls, 'verification': verification}
 
 
 # ***** FINALLY CREATING AUTORIG *****
 
-showRigWindow()
+# Showing Window Only When Run from the Script Editor, Not When Imported
+if __name__ == '__main__':
+    showRigWindow()
@@ -0,0 +1,358 @@
+"""
+
+What Can This Program Do?
+- This program compiles a rig built by bipedAutoRig.py into the flat node list crowdEvaluator.py poses without Maya, for crowds.
+- It compiles:
+    1. The root, spine, pelvis, neck, and clavicle controls, in their hierarchy
+    2. The FK controls and joints of every limb, following the clavicles or the pelvis
+    3. The IK controls of every limb, with their Space attribute, and the two bone rotate plane chain with its Twist attribute
+    4. The upper and lower twist distribution of every limb, with the shares of the twist node the rig was built with
+    5. The foot roll pivots of both feet, rolled by the attributes on the ankle controls
+    6. The IK/FK blend of every bind joint of the limbs, by IK_Blend
+- Every offset is measured from the rig itself at its built pose, so the compiled rig matches the Maya rig there exactly.
+- The compiled rig is saved as one binary file, as a header and one block of offset matrices.
+
+Notes for Use:
+- saveCrowdRig(compileRig(masterCtrl), path) compiles a rig and saves it for crowdEvaluator.loadCrowdRig().
+- compareWithMaya(masterCtrl, path) poses a compiled rig like the Maya rig is posed right now, and gives the distance between each bind joint in Maya and in the compiled rig.
+- Channels are named by control and attribute without the rig prefix, like poses and animation caches, so one compiled rig poses any character built with the same skeleton.
+- Spine and neck joints between the root, chest, and head keep their built pose, since the spline IK is not compiled. Fingers and the head aim are not compiled either.
+- LOD is not compiled, so crowds are posed as if every subsystem is on.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import array
+import json
+import struct
+
+from maya import cmds
+import maya.api.OpenMaya as om
+
+import animCache
+import bipedAutoRig
+import crowdEvaluator
+import ikfkMatch
+import poseLibrary
+import spaceSwitch
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Foot Roll Pivots of Each Side Below the Ankle Control: Pivot, Its Parent, and the Rotate Channel Each Foot Attribute Drives
+footPivots = [
+    ('HeelLoc', 'IK_Ankle_Ctrl', None, None),
+    ('HeelChild', 'HeelLoc', 'rotateX', 'Heel_Roll'),
+    ('TippyToeLoc', 'HeelChild', None, None),
+    ('TippyToeChild', 'TippyToeLoc', 'rotateX', 'Tippy_Toe'),
+    ('GrindLoc', 'TippyToeChild', None, None),
+    ('GrindChild', 'GrindLoc', 'rotateY', 'Grind'),
+    ('OuterToesLoc', 'GrindChild', None, None),
+    ('OuterToesChild', 'OuterToesLoc', 'rotateZ', 'Outer_Toe'),
+    ('InnerToesLoc', 'OuterToesChild', None, None),
+    ('InnerToesChild', 'InnerToesLoc', 'rotateZ', 'Inner_Toe'),
+    ('BallLoc', 'InnerToesChild', None, None),
+    ('BallChild', 'BallLoc', 'rotateZ', 'Ball_Roll'),
+    ('ToesLoc', 'InnerToesChild', None, None),
+    ('ToesChild', 'ToesLoc', 'rotateZ', 'Toes'),
+]
+
+# Channels of a Control Node, in the Order of Its Channel Slots
+controlAttrs = ['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ']
+
+# Twist the IK Controls Are Measured At, in Their Own Units
+measureTwist = 10.0
+
+
+# **** BUILDING THE NODE LIST ****
+
+
+# *** Starting an Empty Compiled Rig for a Master Controller ***
+def newProgram(masterCtrl, channels):
+    prefix = bipedAutoRig.shortName(masterCtrl)[:-len('Master_Ctrl')]
+    return {
+        'prefix': prefix, 'master': cmds.ls(masterCtrl, long=True)[0], 'index': {}, 'rest': {},
+        'controlNames': dict((cmds.ls(attr.split('.')[0], long=True)[0], name.split('.')[0]) for name, attr in zip(channels['names'], channels['attrs'])),
+        'channelDefaults': dict(zip(channels['names'], channels['defaults'])),
+        'nodes': [], 'kinds': [], 'parents': [], 'offsets': [], 'columns': [], 'values': [], 'rotateOrders': [], 'scales': [], 'matrices': [],
+        'channels': [], 'defaults': [], 'channelIndex': {}, 'joints': [], 'jointNames': [], 'jointPaths': [],
+    }
+
+# *** Getting the Full Path of a Node, Which Keys Every Node of a Compiled Rig ***
+def longName(node):
+    return cmds.ls(node, long=True)[0]
+
+# *** Getting the World Matrix of a Node at the Built Pose, Measuring It Once ***
+def getRest(program, node):
+    node = longName(node)
+    if node not in program['rest']:
+        program['rest'][node] = bipedAutoRig.getWorldMatrices([node])[0]
+    return program['rest'][node]
+
+# *** Getting the Offset That Keeps a Node Where It Is Under a Parent, the Master Controller When There Is None ***
+def getOffset(program, node, parent):
+    return getRest(program, node) * getRest(program, parent or program['master']).inverse()
+
+# *** Getting the Column of a Channel, Adding It the First Time ***
+def getChannel(program, name):
+    if name not in program['channelIndex']:
+        program['channelIndex'][name] = len(program['channels'])
+        program['channels'].append(name)
+        program['defaults'].append(float(program['channelDefaults'].get(name, 0.0)))
+    return program['channelIndex'][name]
+
+# *** Adding a Node with Its Parents, Offsets, and Channels, Padding Unused Slots ***
+def addNode(program, node, kind, parents=(), offsets=(), channels=None, values=None, rotateOrder=0, scale=0.0):
+    node = longName(node)
+    parentIndices = [-1 if parent is None else program['index'][longName(parent)] for parent in parents]
+    program['index'][node] = len(program['nodes'])
+    program['nodes'].append(bipedAutoRig.shortName(node))
+    program['kinds'].append(kind)
+    program['parents'] += parentIndices + ([-2] * (crowdEvaluator.maxParents - len(parentIndices)))
+    for i in range(0, crowdEvaluator.maxParents):
+        program['matrices'] += list(offsets[i]) if i < len(offsets) else list(om.MMatrix())
+    channels = channels or [None] * crowdEvaluator.channelSlots
+    program['columns'] += [-1 if channel is None else getChannel(program, channel) for channel in channels]
+    program['values'] += [float(value) for value in (values or [0.0] * crowdEvaluator.channelSlots)]
+    program['rotateOrders'].append(int(rotateOrder))
+    program['scales'].append(float(scale))
+    return program['index'][node]
+
+# *** Adding a Node That Follows Another with a Constant Offset ***
+def addFollow(program, node, parent):
+    return addNode(program, node, crowdEvaluator.STATIC, [parent], [getOffset(program, node, parent)])
+
+# *** Adding a Node Rotated by One Node and Placed by Another ***
+def addOrient(program, node, orientParent, pointParent):
+    return addNode(program, node, crowdEvaluator.ORIENT, [orientParent, pointParent], [getOffset(program, node, orientParent), getOffset(program, node, pointParent)])
+
+# *** Adding a Control, or a Foot Pivot, Moved by Its Channels Under Each of Its Spaces ***
+def addControl(program, node, spaces, channelMap=None):
+    name = program['controlNames'].get(longName(node))
+    if channelMap is None:
+        channelMap = dict((attr, name + '.' + attr) for attr in controlAttrs + ['Space'] if name and (name + '.' + attr) in program['channelDefaults'])
+    channels = [channelMap.get(attr) for attr in controlAttrs] + [channelMap.get('Space') if len(spaces) > 1 else None]
+    values = [cmds.getAttr(node + '.' + attr) for attr in controlAttrs] + [0.0]
+
+    # Taking the Control's Own Channels Out of Each Offset, So Only Its Offset Group and Space Remain
+    localInverse = om.MMatrix(cmds.getAttr(node + '.matrix')).inverse()
+    offsets = [localInverse * getOffset(program, node, space) for space in spaces]
+    return addNode(program, node, crowdEvaluator.CONTROL, spaces, offsets, channels, values, cmds.getAttr(node + '.rotateOrder'))
+
+# *** Getting the Nodes a Target Drives Through Constraints of One Type ***
+def getConstrainedNodes(target, constraintType):
+    target = longName(target)
+    nodes = []
+    for constraint in set(cmds.listConnections(target, source=False, destination=True, type=constraintType) or []):
+        driven = cmds.listRelatives(constraint, parent=True, fullPath=True)
+        if driven and driven[0] != target and driven[0] not in nodes:
+            nodes.append(driven[0])
+    return nodes
+
+
+# **** COMPILING THE BODY ****
+
+
+# *** Getting the Bind Skeleton in Hierarchy Order, Parents Before Children ***
+def getBindJoints(rootJnt):
+    joints = [longName(rootJnt)]
+    for jnt in joints:
+        joints += cmds.listRelatives(jnt, children=True, type='joint', fullPath=True) or []
+    return joints
+
+# *** Finding the Root of the Bind Skeleton Under the Master Controller ***
+def findBindRoot(program):
+    for jnt in cmds.listRelatives(program['master'], children=True, type='joint', fullPath=True) or []:
+        if not bipedAutoRig.shortName(jnt)[len(program['prefix']):].startswith('IK_'):
+            return jnt
+    cmds.error('No bind skeleton was found under ' + program['master'] + '.')
+
+# *** Compiling the Root, Spine, Pelvis, Neck, and Clavicle Controls Under Their Nearest Compiled Parent ***
+def compileBody(program):
+    p = program['prefix']
+    names = ['Root_Ctrl', 'Pelvis_Ctrl', 'L_Clavicle_Ctrl', 'R_Clavicle_Ctrl']
+    names += [name for name in set(program['controlNames'].values()) if name in ['baseSpine_Ctrl', 'Chest_Ctrl', 'Neck_Ctrl', 'Head_Ctrl'] or name.startswith('midSpine') or name.startswith('midNeck')]
+
+    # Ordering by Depth, So Every Parent Is Compiled Before Its Children
+    ctrls = sorted([longName(p + name) for name in set(names) if cmds.objExists(p + name)], key=lambda ctrl: (ctrl.count('|'), ctrl))
+    for ctrl in ctrls:
+        parent = ctrl.rsplit('|', 1)[0]
+        while parent and parent not in program['index']:
+            parent = parent.rsplit('|', 1)[0]
+        addControl(program, ctrl, [parent or None])
+    return ctrls
+
+# *** Compiling the Foot Roll Pivots of One Side Under Its Ankle Control ***
+def compileFoot(program, side):
+    p = program['prefix']
+    ankleName = side + '_IK_Ankle_Ctrl'
+    for pivot, parent, attr, footAttr in footPivots:
+        channelMap = {}
+        if attr and cmds.attributeQuery(side + '_' + footAttr, node=p + ankleName, exists=True):
+            channelMap[attr] = ankleName + '.' + side + '_' + footAttr
+        addControl(program, p + side + '_' + pivot, [p + side + '_' + parent], channelMap)
+
+# *** Measuring the IK Handle Twist, in Radians, That One Unit of the Twist Attribute Gives ***
+def measureTwistScale(ctrl, baseChain):
+    start, mid, end = [ikfkMatch.getPosition(matrix) for matrix in bipedAutoRig.getWorldMatrices(baseChain)]
+    previous = cmds.getAttr(ctrl + '.Twist')
+    cmds.setAttr(ctrl + '.Twist', previous + measureTwist)
+    try:
+        twisted = ikfkMatch.getPosition(bipedAutoRig.getWorldMatrices([baseChain[1]])[0])
+    finally:
+        cmds.setAttr(ctrl + '.Twist', previous)
+    return ikfkMatch.getTwistAngle(start, end, mid, twisted) / measureTwist
+
+
+# **** COMPILING LIMBS ****
+
+
+# *** Compiling the Controls, IK, FK, and Twist of One Limb, Returning the Drivers of Its Bind Joints ***
+def compileLimb(program, side, limb):
+    p = program['prefix']
+    nodes = ikfkMatch.getLimbNodes(side, limb, p)
+    FKctrls, FKjnts, IKjnts = nodes['FKctrls'], nodes['FKjnts'], nodes['IKjnts']
+    size = len(FKctrls) - (1 if limb == 'Arm' else 2)
+    midIndex = (size - 1) // 2
+    endIndex = size if limb == 'Arm' else size - 1
+    limbParent = p + side + '_Clavicle_Ctrl' if limb == 'Arm' else p + 'Pelvis_Ctrl'
+
+    # ** FK and IK Controls, with the Spaces of the Bottom Control **
+    for i in range(0, len(FKctrls)):
+        addControl(program, FKctrls[i], [FKctrls[i-1] if i else limbParent])
+    addControl(program, nodes['topCtrl'], [limbParent])
+    grp, targets = spaceSwitch.getSpaceTargets(nodes['bottomCtrl'])
+    spaces = [None if longName(target) == program['master'] else target for target in targets] or [None]
+    addControl(program, nodes['bottomCtrl'], spaces)
+    if limb == 'Leg':
+        compileFoot(program, side)
+
+    # ** Two Bone Chain, Solved from the Top Control to the IK Handle, in the Space of the Joint Group **
+    jointGroup = p + side + '_IK_' + limb + '_Joint__Group'
+    addFollow(program, jointGroup, p + 'Root_Ctrl')
+    baseChain = [p + side + '_' + limb + '_IK_Base_' + str(i + 1) + '_j' for i in range(0, 3)]
+    handle = cmds.listConnections(baseChain[0] + '.message', type='ikHandle')[0]
+    handleParent = nodes['bottomCtrl'] if limb == 'Arm' else p + side + '_BallChild'
+    ikParents = [nodes['topCtrl'], handleParent, jointGroup]
+    ikOffsets = [getOffset(program, baseChain[0], nodes['topCtrl']), getOffset(program, handle, handleParent)]
+    if limb == 'Arm':
+        ikParents.append(nodes['bottomCtrl'])
+        ikOffsets.append(getOffset(program, baseChain[2], nodes['bottomCtrl']))
+    twistChannel = bipedAutoRig.shortName(nodes['bottomCtrl'])[len(p):] + '.Twist'
+    addNode(program, baseChain[0], crowdEvaluator.IK, ikParents, ikOffsets, [None] * 6 + [twistChannel], scale=measureTwistScale(nodes['bottomCtrl'], baseChain))
+    restChain = [getOffset(program, jnt, jointGroup) for jnt in baseChain]
+    addNode(program, baseChain[1], crowdEvaluator.IK_OUTPUT, offsets=restChain)
+    addNode(program, baseChain[2], crowdEvaluator.IK_OUTPUT)
+
+    # ** IK Chain Following the Base Chain, with the Leg's Foot and Ball Following the Foot Pivots **
+    twistNode = p + side + '_' + limb + '_Twist_MultDiv'
+    upperShare = cmds.getAttr(twistNode + '.input2X') if cmds.objExists(twistNode) else 0.0
+    lowerShare = cmds.getAttr(twistNode + '.input2Y') if cmds.objExists(twistNode) else 0.0
+    addFollow(program, IKjnts[midIndex], baseChain[1])
+    addFollow(program, IKjnts[endIndex], baseChain[2])
+    if limb == 'Arm':
+        # The Wrist Locator Gets Minus Half the Wrist Twist Through Its Blended Orient Constraint
+        lowerSource, lowerParent, lowerShare = IKjnts[size], IKjnts[midIndex], lowerShare * -0.5
+    else:
+        addOrient(program, IKjnts[size], p + side + '_BallChild', IKjnts[size-1])
+        addOrient(program, IKjnts[size+1], p + side + '_ToesChild', IKjnts[size])
+        lowerSource, lowerParent = IKjnts[size], IKjnts[size-1]
+
+    # ** Twist Joints: the Top One Swaps the Base Chain's Own Roll for Its Share, Since Its Constraint Skips X **
+    for i in range(0, midIndex):
+        parent = baseChain[0] if i == 0 else IKjnts[i-1]
+        sourceRest = getOffset(program, baseChain[0], jointGroup).inverse()
+        addNode(program, IKjnts[i], crowdEvaluator.TWIST, [parent, baseChain[0], jointGroup], [getOffset(program, IKjnts[i], parent), sourceRest], scale=upperShare - (1.0 if i == 0 else 0.0))
+    for i in range(midIndex + 1, endIndex):
+        sourceRest = getOffset(program, lowerSource, lowerParent).inverse()
+        addNode(program, IKjnts[i], crowdEvaluator.TWIST, [IKjnts[i-1], lowerSource, lowerParent], [getOffset(program, IKjnts[i], IKjnts[i-1]), sourceRest], scale=lowerShare)
+
+    # ** FK Chain Following Its Controls **
+    addFollow(program, FKjnts[0], FKctrls[0])
+    for i in range(1, len(FKjnts)):
+        addOrient(program, FKjnts[i], FKctrls[i], FKjnts[i-1])
+
+    # ** Bind Joints Blending Each IK Joint with Its FK Joint **
+    drivers = {}
+    blendChannel = side + '_' + limb + '_Switch_Ctrl.IK_Blend'
+    for i in range(0, len(FKjnts)):
+        for bindJnt in getConstrainedNodes(FKjnts[i], 'parentConstraint'):
+            drivers[bindJnt] = (IKjnts[i], FKjnts[i], blendChannel)
+    return drivers
+
+
+# **** COMPILING AND SAVING RIGS ****
+
+
+# *** Compiling a Rig at Its Built Pose, Then Putting Back the Pose It Had ***
+def compileRig(masterCtrl, rootJnt=None):
+    channels = poseLibrary.getChannels(masterCtrl)
+    pose = poseLibrary.capturePose(masterCtrl, channels=channels)
+    poseLibrary.applyPose(masterCtrl, poseLibrary.getDefaultPose(masterCtrl, channels=channels), channels=channels)
+    try:
+        program = newProgram(masterCtrl, channels)
+        if rootJnt is None:
+            rootJnt = findBindRoot(program)
+        bindJoints = getBindJoints(rootJnt)
+        bindSet = set(bindJoints)
+
+        # ** Controls Drive the Root, Pelvis, Chest, Head, and Clavicles Directly **
+        drivers = {}
+        for ctrl in compileBody(program):
+            for constraintType in ['parentConstraint', 'orientConstraint']:
+                for jnt in getConstrainedNodes(ctrl, constraintType):
+                    if jnt in bindSet:
+                        drivers[jnt] = ctrl
+        for side in ['L', 'R']:
+            for limb in ['Arm', 'Leg']:
+                drivers.update(compileLimb(program, side, limb))
+
+        # ** Bind Joints, Blended, Following a Control, or Keeping Their Pose Under Their Parent **
+        for jnt in bindJoints:
+            driver = drivers.get(jnt)
+            if isinstance(driver, tuple):
+                IKjnt, FKjnt, blendChannel = driver
+                addNode(program, jnt, crowdEvaluator.BLEND, [IKjnt, FKjnt], [getOffset(program, jnt, IKjnt), getOffset(program, jnt, FKjnt)], [None] * 6 + [blendChannel])
+            else:
+                parents = cmds.listRelatives(jnt, parent=True, type='joint', fullPath=True)
+                addFollow(program, jnt, driver or (parents[0] if parents else None))
+            program['joints'].append(program['index'][jnt])
+            program['jointNames'].append(bipedAutoRig.shortName(jnt))
+            program['jointPaths'].append(jnt)
+    finally:
+        poseLibrary.applyPose(masterCtrl, pose, channels=channels)
+    return program
+
+# *** Saving a Compiled Rig as a JSON Header, Then Every Offset Matrix as Float64 ***
+def saveCrowdRig(program, path):
+    keys = ['nodes', 'kinds', 'parents', 'columns', 'values', 'rotateOrders', 'scales', 'channels', 'defaults', 'joints', 'jointNames', 'jointPaths']
+    headerBytes = json.dumps(dict((key, program[key]) for key in keys)).encode('utf-8')
+
+    # Padding the Header So the Matrices Start on 8 Byte Boundaries
+    magic = crowdEvaluator.crowdMagic
+    headerBytes += b' ' * (-(len(magic) + 4 + len(headerBytes)) % 8)
+    with open(path, 'wb') as rigFile:
+        rigFile.write(magic + struct.pack('<I', len(headerBytes)) + headerBytes)
+        rigFile.write(animCache.toBytes(program['matrices']))
+    return {'path': path, 'nodes': len(program['nodes']), 'joints': len(program['joints']), 'channels': len(program['channels'])}
+
+
+# **** CHECKING COMPILED RIGS ****
+
+
+# *** Measuring How Far Each Bind Joint of a Compiled Rig Is from the Maya Rig in Its Current Pose ***
+def compareWithMaya(masterCtrl, path):
+    rig = crowdEvaluator.loadCrowdRig(path)
+    channels = poseLibrary.getChannels(masterCtrl)
+    pose = dict((name, plug.asDouble()) for name, plug in zip(channels['names'], channels['plugs']))
+    root = crowdEvaluator.numpy.array(list(bipedAutoRig.getWorldMatrices([masterCtrl])[0])).reshape(4, 4)
+    worlds = crowdEvaluator.evaluatePoses(rig, pose, root)
+    drift = {}
+    for i, matrix in enumerate(bipedAutoRig.getWorldMatrices(rig['jointPaths'])):
+        mayaPos = crowdEvaluator.numpy.array([matrix.getElement(3, axis) for axis in range(0, 3)])
+        drift[rig['jointNames'][i]] = float(crowdEvaluator.numpy.linalg.norm(worlds[i, 3, :3] - mayaPos))
+    return drift
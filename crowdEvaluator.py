@@ -0,0 +1,385 @@
+"""
+
+What Can This Program Do?
+- This program poses crowds of characters rigged by bipedAutoRig.py without Maya, from a rig compiled by crowdCompiler.py.
+- It computes the world matrix of every bind joint for many agents at many frames at once, with NumPy, instead of evaluating a Maya rig per agent.
+- The compiled rig is a flat list of nodes in evaluation order, each one of a few kinds:
+    1. Static nodes follow another node with a constant offset, like constraints with maintain offset and plain parenting
+    2. Control nodes follow another node through their translate and rotate channels, choosing their parent by a Space channel when they have one
+    3. Orient nodes take their rotation from one node and their position from another, like FK joints under orient constraints
+    4. Blend nodes mix two nodes by a weight channel, like bind joints blending their IK and FK joints by IK_Blend
+    5. Twist nodes roll about their X axis by a share of the X rotation of another joint, like the twist distribution of the limbs
+    6. IK nodes solve a two bone rotate plane chain to a target, with a Twist channel, filling the two nodes after them as well
+- Foot roll pivots are control nodes whose rotate channels are the foot roll attributes of the ankle control.
+
+Notes for Running:
+- rig = loadCrowdRig(path) reads a file saved by crowdCompiler.saveCrowdRig().
+- evaluatePoses(rig, channels, roots) takes channels named by control and attribute, like 'L_Arm_Switch_Ctrl.IK_Blend', as arrays of values for every agent and frame, and returns world matrices shaped (agents, frames, joints, 4, 4).
+- Channel arrays only need to broadcast to one shape, so a channel the same for every agent can be given per frame only, and channels left out keep their built values.
+- roots holds the world matrix of each agent's Master_Ctrl, and defaults to the origin.
+- Matrices follow Maya's row vector convention, with the position in the last row.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import json
+import struct
+
+# The Evaluator Needs NumPy, but Importing This Module Without It Still Lets Maya Compile Rigs
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Header That Marks a Compiled Crowd Rig File
+crowdMagic = b'RIGCRWD1'
+
+# Kinds of Compiled Nodes
+STATIC = 0
+CONTROL = 1
+ORIENT = 2
+BLEND = 3
+TWIST = 4
+IK = 5
+IK_OUTPUT = 6
+
+# Most Parents, Offset Matrices, and Channels a Node Can Have
+maxParents = 4
+channelSlots = 7
+
+# Axis Orders of Maya's Rotate Order Enum
+rotateOrders = ['xyz', 'yzx', 'zxy', 'xzy', 'yxz', 'zyx']
+
+
+# **** READING COMPILED RIGS ****
+
+
+# *** Checking NumPy Is Available Before Evaluating ***
+def checkNumpy():
+    if numpy is None:
+        raise ImportError('crowdEvaluator needs NumPy to evaluate poses.')
+
+# *** Turning the Lists of a Compiled Rig into Arrays ***
+def toArrays(rig):
+    checkNumpy()
+    arrays = dict(rig)
+    arrays['kinds'] = numpy.array(rig['kinds'], dtype=numpy.int32)
+    arrays['parents'] = numpy.array(rig['parents'], dtype=numpy.int32).reshape(-1, maxParents)
+    arrays['columns'] = numpy.array(rig['columns'], dtype=numpy.int32).reshape(-1, channelSlots)
+    arrays['values'] = numpy.array(rig['values'], dtype=numpy.float64).reshape(-1, channelSlots)
+    arrays['rotateOrders'] = numpy.array(rig['rotateOrders'], dtype=numpy.int32)
+    arrays['scales'] = numpy.array(rig['scales'], dtype=numpy.float64)
+    arrays['defaults'] = numpy.array(rig['defaults'], dtype=numpy.float64)
+    arrays['matrices'] = numpy.array(rig['matrices'], dtype=numpy.float64).reshape(-1, maxParents, 4, 4)
+    arrays['joints'] = numpy.array(rig['joints'], dtype=numpy.int32)
+    arrays['channelIndex'] = dict((rig['channels'][i], i) for i in range(0, len(rig['channels'])))
+    return arrays
+
+# *** Reading a Compiled Rig File: a JSON Header, Then Every Offset Matrix as Float64 ***
+def loadCrowdRig(path):
+    checkNumpy()
+    with open(path, 'rb') as rigFile:
+        data = rigFile.read()
+    if data[:len(crowdMagic)] != crowdMagic:
+        raise ValueError(path + ' is not a compiled crowd rig.')
+    headerSize = struct.unpack('<I', data[len(crowdMagic):len(crowdMagic) + 4])[0]
+    dataStart = len(crowdMagic) + 4 + headerSize
+    rig = json.loads(data[len(crowdMagic) + 4:dataStart].decode('utf-8'))
+    rig['matrices'] = numpy.frombuffer(data, dtype='<f8', offset=dataStart)
+    return toArrays(rig)
+
+
+# **** MATRIX MATH ****
+
+
+# *** Building Rotation Matrices from Euler Angles in Degrees, for One Rotate Order ***
+def eulerToMatrices(angles, rotateOrder=0):
+    radians = numpy.radians(angles)
+    cos = numpy.cos(radians)
+    sin = numpy.sin(radians)
+    count = len(angles)
+    axes = {}
+    for i, axis in enumerate('xyz'):
+        matrix = numpy.zeros((count, 3, 3))
+        a, b = [j for j in range(0, 3) if j != i]
+        matrix[:, i, i] = 1.0
+        matrix[:, a, a] = cos[:, i]
+        matrix[:, b, b] = cos[:, i]
+        # Row Vector Matrices, So the Sine Signs Are Transposed from the Usual Column Vector Form
+        sign = -1.0 if axis == 'y' else 1.0
+        matrix[:, a, b] = sign * sin[:, i]
+        matrix[:, b, a] = -sign * sin[:, i]
+        axes[axis] = matrix
+    order = rotateOrders[rotateOrder]
+    return numpy.matmul(numpy.matmul(axes[order[0]], axes[order[1]]), axes[order[2]])
+
+# *** Building Local Matrices from Translate and Rotate Values ***
+def composeMatrices(values, rotateOrder=0):
+    matrices = numpy.zeros((len(values), 4, 4))
+    matrices[:, :3, :3] = eulerToMatrices(values[:, 3:6], rotateOrder)
+    matrices[:, 3, :3] = values[:, 0:3]
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+# *** Building Matrices That Roll About the X Axis by Angles in Radians ***
+def rollMatrices(angles):
+    matrices = numpy.zeros((len(angles), 4, 4))
+    matrices[:, 0, 0] = 1.0
+    matrices[:, 1, 1] = numpy.cos(angles)
+    matrices[:, 1, 2] = numpy.sin(angles)
+    matrices[:, 2, 1] = -numpy.sin(angles)
+    matrices[:, 2, 2] = numpy.cos(angles)
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+# *** Inverting Matrices Without Scale or Shear ***
+def invertRigid(matrices):
+    inverse = numpy.zeros(matrices.shape)
+    rotation = numpy.swapaxes(matrices[..., :3, :3], -1, -2)
+    inverse[..., :3, :3] = rotation
+    inverse[..., 3, :3] = -numpy.einsum('...i,...ij->...j', matrices[..., 3, :3], rotation)
+    inverse[..., 3, 3] = 1.0
+    return inverse
+
+# *** Getting the X Angle of Rotation Matrices in the xyz Rotate Order ***
+def getRollAngles(matrices):
+    return numpy.arctan2(matrices[:, 1, 2], matrices[:, 2, 2])
+
+# *** Converting Rotation Matrices to Quaternions, Picking the Most Stable Formula for Each ***
+def matricesToQuaternions(m):
+    trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+    cases = numpy.argmax(numpy.stack([trace, m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]], axis=1), axis=1)
+    quats = numpy.zeros((len(m), 4))
+    roots = [
+        1.0 + trace,
+        1.0 + m[:, 0, 0] - m[:, 1, 1] - m[:, 2, 2],
+        1.0 - m[:, 0, 0] + m[:, 1, 1] - m[:, 2, 2],
+        1.0 - m[:, 0, 0] - m[:, 1, 1] + m[:, 2, 2],
+    ]
+    pairs = [m[:, 1, 2] - m[:, 2, 1], m[:, 2, 0] - m[:, 0, 2], m[:, 0, 1] - m[:, 1, 0], m[:, 0, 1] + m[:, 1, 0], m[:, 0, 2] + m[:, 2, 0], m[:, 1, 2] + m[:, 2, 1]]
+    # Each Case Lists the W, X, Y, and Z Numerators, with None for the Component Taken from the Root
+    formulas = [
+        [None, pairs[0], pairs[1], pairs[2]],
+        [pairs[0], None, pairs[3], pairs[4]],
+        [pairs[1], pairs[3], None, pairs[5]],
+        [pairs[2], pairs[4], pairs[5], None],
+    ]
+    for case in range(0, 4):
+        rows = cases == case
+        if not numpy.any(rows):
+            continue
+        root = numpy.sqrt(numpy.maximum(roots[case][rows], 1e-12))
+        for j in range(0, 4):
+            quats[rows, j] = 0.5 * root if formulas[case][j] is None else formulas[case][j][rows] / (2.0 * root)
+    return quats
+
+# *** Converting Quaternions Back to Rotation Matrices ***
+def quaternionsToMatrices(q):
+    w, x, y, z = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    m = numpy.zeros((len(q), 3, 3))
+    m[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    m[:, 0, 1] = 2.0 * (x * y + z * w)
+    m[:, 0, 2] = 2.0 * (x * z - y * w)
+    m[:, 1, 0] = 2.0 * (x * y - z * w)
+    m[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    m[:, 1, 2] = 2.0 * (y * z + x * w)
+    m[:, 2, 0] = 2.0 * (x * z + y * w)
+    m[:, 2, 1] = 2.0 * (y * z - x * w)
+    m[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return m
+
+# *** Blending Two Sets of Matrices by Weights, Rotations Along the Shortest Path ***
+def blendMatrices(matricesA, matricesB, weights):
+    quatsA = matricesToQuaternions(matricesA[:, :3, :3])
+    quatsB = matricesToQuaternions(matricesB[:, :3, :3])
+    quatsB *= numpy.where(numpy.sum(quatsA * quatsB, axis=1) < 0.0, -1.0, 1.0)[:, None]
+    quats = (weights[:, None] * quatsA) + ((1.0 - weights[:, None]) * quatsB)
+    quats /= numpy.linalg.norm(quats, axis=1)[:, None]
+    blended = numpy.zeros(matricesA.shape)
+    blended[:, :3, :3] = quaternionsToMatrices(quats)
+    blended[:, 3, :3] = (weights[:, None] * matricesA[:, 3, :3]) + ((1.0 - weights[:, None]) * matricesB[:, 3, :3])
+    blended[:, 3, 3] = 1.0
+    return blended
+
+# *** Normalizing Rows of Vectors, Leaving Zero Vectors at Zero ***
+def normalize(vectors):
+    lengths = numpy.linalg.norm(vectors, axis=-1)
+    return vectors / numpy.maximum(lengths, 1e-12)[..., None]
+
+# *** Building Orthonormal Frames Whose Rows Are a Bone Direction, a Plane Normal, and Their Cross Product ***
+def getBoneFrames(directions, poles):
+    first = normalize(directions)
+    second = normalize(numpy.cross(first, poles))
+    frames = numpy.stack([first, second, numpy.cross(first, second)], axis=1)
+    return frames
+
+
+# **** SOLVING IK ****
+
+
+# *** Solving a Two Bone Rotate Plane Chain, Returning the Upper, Lower, and End World Matrices ***
+def solveTwoBone(startPos, targetPos, poleSpace, restMatrices, twistAngles, endRotations):
+    # ** Placing the Rest Chain in the Pole Space of Each Pose **
+    restUpper, restLower, restEnd = [numpy.matmul(matrix, poleSpace) for matrix in restMatrices]
+    restStart, restMid, restStop = [matrix[:, 3, :3] for matrix in [restUpper, restLower, restEnd]]
+    upperLength = numpy.linalg.norm(restMatrices[1][3, :3] - restMatrices[0][3, :3])
+    lowerLength = numpy.linalg.norm(restMatrices[2][3, :3] - restMatrices[1][3, :3])
+
+    # ** Getting the Pole Vector, the Direction the Mid Joint Points Away from the Chain at Rest **
+    restAxis = normalize(restStop - restStart)
+    restPole = restMid - restStart
+    restPole = restPole - (restAxis * numpy.sum(restPole * restAxis, axis=1)[:, None])
+
+    # ** Reaching for the Target Within the Chain's Length **
+    chord = targetPos - startPos
+    axis = normalize(chord)
+    distance = numpy.clip(numpy.linalg.norm(chord, axis=1), abs(upperLength - lowerLength) + 1e-6, upperLength + lowerLength - 1e-6)
+
+    # ** Turning the Pole Perpendicular to the Chord, Then Around It by the Twist **
+    pole = normalize(restPole - (axis * numpy.sum(restPole * axis, axis=1)[:, None]))
+    pole = (pole * numpy.cos(twistAngles)[:, None]) + (numpy.cross(axis, pole) * numpy.sin(twistAngles)[:, None])
+
+    # ** Placing the Mid and End Joints by the Law of Cosines **
+    along = ((upperLength ** 2) - (lowerLength ** 2) + (distance ** 2)) / (2.0 * distance)
+    height = numpy.sqrt(numpy.maximum((upperLength ** 2) - (along ** 2), 0.0))
+    midPos = startPos + (axis * along[:, None]) + (pole * height[:, None])
+    endPos = startPos + (axis * distance[:, None])
+
+    # ** Rotating Each Bone from Its Rest Frame to Its Solved Frame **
+    results = []
+    for restMatrix, restDir, solvedDir, pos in [(restUpper, restMid - restStart, midPos - startPos, startPos), (restLower, restStop - restMid, endPos - midPos, midPos)]:
+        change = numpy.matmul(numpy.swapaxes(getBoneFrames(restDir, restPole), 1, 2), getBoneFrames(solvedDir, pole))
+        matrix = numpy.zeros(restMatrix.shape)
+        matrix[:, :3, :3] = numpy.matmul(restMatrix[:, :3, :3], change)
+        matrix[:, 3, :3] = pos
+        matrix[:, 3, 3] = 1.0
+        results.append(matrix)
+
+    # ** Orienting the End by Its Orient Target, or Keeping It Rigid Under the Lower Bone **
+    end = numpy.zeros(restEnd.shape)
+    if endRotations is None:
+        endRotations = numpy.matmul(restMatrices[2][:3, :3], numpy.linalg.inv(restMatrices[1][:3, :3]))
+        endRotations = numpy.matmul(endRotations, results[1][:, :3, :3])
+    end[:, :3, :3] = endRotations
+    end[:, 3, :3] = endPos
+    end[:, 3, 3] = 1.0
+    results.append(end)
+    return results
+
+
+# **** EVALUATING POSES ****
+
+
+# *** Getting the Shape All Channel Arrays and Root Matrices Broadcast To ***
+def getPoseShape(channels, roots):
+    shapes = [numpy.shape(values) for values in channels.values()]
+    if roots is not None:
+        shapes.append(numpy.shape(roots)[:-2])
+    shape = ()
+    for other in shapes:
+        shape = numpy.broadcast(numpy.empty(shape, dtype=bool), numpy.empty(other, dtype=bool)).shape
+    return shape
+
+# *** Evaluating Every Node of a Compiled Rig for a Chunk of Poses ***
+def evaluateChunk(rig, inputs, roots):
+    count = len(inputs)
+    kinds = rig['kinds']
+    parents = rig['parents']
+    matrices = rig['matrices']
+    worlds = numpy.empty((len(kinds), count, 4, 4))
+
+    def getParent(index):
+        return roots if index < 0 else worlds[index]
+
+    def getValues(node):
+        columns = rig['columns'][node]
+        values = inputs[:, numpy.maximum(columns, 0)]
+        return numpy.where(columns >= 0, values, rig['values'][node])
+
+    for node in range(0, len(kinds)):
+        kind = kinds[node]
+
+        # ** Following a Parent with an Offset **
+        if kind == STATIC:
+            worlds[node] = numpy.matmul(matrices[node, 0], getParent(parents[node, 0]))
+
+        # ** Moving by Channels Under a Parent, or Under the Parent Picked by the Space Channel **
+        elif kind == CONTROL:
+            values = getValues(node)
+            local = composeMatrices(values[:, :6], rig['rotateOrders'][node])
+            if rig['columns'][node, 6] < 0:
+                worlds[node] = numpy.matmul(local, numpy.matmul(matrices[node, 0], getParent(parents[node, 0])))
+                continue
+            spaceCount = max(int(numpy.sum(parents[node] != -2)), 1)
+            spaces = numpy.clip(numpy.round(values[:, 6]).astype(numpy.int32), 0, spaceCount - 1)
+            for space in range(0, spaceCount):
+                rows = spaces == space
+                if numpy.any(rows):
+                    worlds[node, rows] = numpy.matmul(local[rows], numpy.matmul(matrices[node, space], getParent(parents[node, space])[rows]))
+
+        # ** Taking Rotation from One Node and Position from Another **
+        elif kind == ORIENT:
+            oriented = numpy.matmul(matrices[node, 0], getParent(parents[node, 0]))
+            placed = numpy.matmul(matrices[node, 1], getParent(parents[node, 1]))
+            oriented[:, 3, :3] = placed[:, 3, :3]
+            worlds[node] = oriented
+
+        # ** Blending Two Nodes by a Weight Channel **
+        elif kind == BLEND:
+            weights = numpy.clip(getValues(node)[:, 6], 0.0, 1.0)
+            worlds[node] = blendMatrices(numpy.matmul(matrices[node, 0], getParent(parents[node, 0])), numpy.matmul(matrices[node, 1], getParent(parents[node, 1])), weights)
+
+        # ** Rolling by a Share of Another Joint's X Rotation from Rest **
+        elif kind == TWIST:
+            sourceLocal = numpy.matmul(worlds[parents[node, 1]], invertRigid(getParent(parents[node, 2])))
+            angles = getRollAngles(numpy.matmul(sourceLocal, matrices[node, 1])[:, :3, :3]) * rig['scales'][node]
+            worlds[node] = numpy.matmul(rollMatrices(angles), numpy.matmul(matrices[node, 0], getParent(parents[node, 0])))
+
+        # ** Solving the Two Bone Chain into This Node and the Two After It **
+        elif kind == IK:
+            startPos = numpy.matmul(matrices[node, 0], getParent(parents[node, 0]))[:, 3, :3]
+            targetPos = numpy.matmul(matrices[node, 1], getParent(parents[node, 1]))[:, 3, :3]
+            twistAngles = getValues(node)[:, 6] * rig['scales'][node]
+            endRotations = None
+            if parents[node, 3] != -2:
+                endRotations = numpy.matmul(matrices[node, 2], getParent(parents[node, 3]))[:, :3, :3]
+            restMatrices = [matrices[node + 1, 0], matrices[node + 1, 1], matrices[node + 1, 2]]
+            worlds[node], worlds[node + 1], worlds[node + 2] = solveTwoBone(startPos, targetPos, getParent(parents[node, 2]), restMatrices, twistAngles, endRotations)
+    return worlds
+
+# *** Evaluating the Bind Joint World Matrices of Many Agents at Many Frames ***
+def evaluatePoses(rig, channels=None, roots=None, chunkSize=1024):
+    checkNumpy()
+    channels = dict((name, values) for name, values in (channels or {}).items() if name in rig['channelIndex'])
+    shape = getPoseShape(channels, roots)
+    poseCount = int(numpy.prod(shape)) if shape else 1
+
+    # ** Flattening Every Input to One Row per Pose, Without Copying Until a Chunk Needs It **
+    columns = [None] * len(rig['defaults'])
+    for name, values in channels.items():
+        columns[rig['channelIndex'][name]] = numpy.broadcast_to(numpy.asarray(values, dtype=numpy.float64), shape).reshape(-1)
+    if roots is not None:
+        roots = numpy.broadcast_to(numpy.asarray(roots, dtype=numpy.float64), shape + (4, 4)).reshape(-1, 4, 4)
+
+    # ** Evaluating in Chunks, So Memory Stays Small for Any Crowd Size **
+    result = numpy.empty((poseCount, len(rig['joints']), 4, 4))
+    for first in range(0, poseCount, chunkSize):
+        last = min(first + chunkSize, poseCount)
+        inputs = numpy.empty((last - first, max(len(columns), 1)))
+        for i in range(0, len(columns)):
+            inputs[:, i] = rig['defaults'][i] if columns[i] is None else columns[i][first:last]
+        chunkRoots = numpy.tile(numpy.eye(4), (last - first, 1, 1)) if roots is None else roots[first:last]
+        worlds = evaluateChunk(rig, inputs, chunkRoots)
+        result[first:last] = numpy.swapaxes(worlds[rig['joints']], 0, 1)
+    return result.reshape(shape + (len(rig['joints']), 4, 4))
+
+# *** Getting the World Positions of Evaluated Joints ***
+def getPositions(worlds):
+    return worlds[..., 3, :3]
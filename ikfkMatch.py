@@ -0,0 +1,247 @@
+"""
+
+What Can This Program Do?
+- This program matches the FK controls of a limb to its IK pose, or the IK controls to its FK pose, over a frame range.
+- It works on the arms and legs of rigs built by bipedAutoRig.py, so a shot can switch IK_Blend mid-shot without a pop.
+- Every frame is sampled through the dependency graph without changing the current time.
+- Each channel gets all of its keys in one edit of its animation curve.
+- Matching IK to FK also solves the IK Twist attribute so the elbow or knee points the same way as in FK.
+
+Notes for Use:
+- matchAndBake('L', 'Arm', 'FK', 1, 120) keys the left FK arm controls to follow the IK arm from frame 1 to 120, then keys IK_Blend to FK.
+- Pass the name prefix the rig was built with when several characters share a scene.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import math
+
+from maya import cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as omAnim
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Control Names and Joint Numbers of Each Limb: Mid Is the Elbow or Knee, End Follows the IK Control
+limbInfo = {
+    'Arm': {'top': 'Shoulder', 'bottom': 'Wrist', 'mid': 6, 'end': 12},
+    'Leg': {'top': 'Hip', 'bottom': 'Ankle', 'mid': 5, 'end': 9},
+}
+
+
+# **** SAMPLING THE GRAPH ****
+
+
+# *** Getting a Plug of Each Node, Using the First Element of Array Attributes ***
+def getPlugs(nodes, attr):
+    selList = om.MSelectionList()
+    for node in nodes:
+        selList.add(node)
+    plugs = []
+    for i in range(0, len(nodes)):
+        plug = om.MFnDependencyNode(selList.getDependNode(i)).findPlug(attr, False)
+        if plug.isArray:
+            plug = plug.elementByLogicalIndex(0)
+        plugs.append(plug)
+    return plugs
+
+# *** Reading Plugs at a Frame Without Changing the Current Time ***
+def readPlugsAtFrame(plugs, frame, asMatrix=True):
+    context = om.MDGContext(om.MTime(frame, om.MTime.uiUnit()))
+    values = []
+
+    # Maya 2022 and Later Make a Context Current, Earlier Versions Take It as an Argument
+    if hasattr(context, 'makeCurrent'):
+        previous = context.makeCurrent()
+        try:
+            for plug in plugs:
+                values.append(om.MFnMatrixData(plug.asMObject()).matrix() if asMatrix else plug.asDouble())
+        finally:
+            previous.makeCurrent()
+    else:
+        for plug in plugs:
+            values.append(om.MFnMatrixData(plug.asMObject(context)).matrix() if asMatrix else plug.asDouble(context))
+    return values
+
+# *** Sampling Plugs at Every Frame of a Range ***
+def samplePlugs(plugs, frames, asMatrix=True):
+    return [readPlugsAtFrame(plugs, frame, asMatrix) for frame in frames]
+
+# *** Getting the World Position of a World Matrix ***
+def getPosition(matrix):
+    return om.MVector(matrix.getElement(3, 0), matrix.getElement(3, 1), matrix.getElement(3, 2))
+
+
+# **** WRITING KEYS ****
+
+
+# *** Getting the Animation Curve of a Channel, Creating One If Needed ***
+def getAnimCurve(node, attr):
+    plug = getPlugs([node], attr)[0]
+    curveFn = omAnim.MFnAnimCurve()
+    curves = omAnim.MAnimUtil.findAnimation(plug)
+    if curves:
+        curveFn.setObject(curves[0])
+    else:
+        curveFn.create(plug)
+    return curveFn
+
+# *** Writing All Keys of One Channel in One Edit, Replacing Keys in the Range ***
+def writeKeys(node, attr, frames, values):
+    if not frames:
+        return
+    
+    # Clearing Only the Keys in the Range First, Since a Curve Left Without Keys Is Deleted
+    cmds.cutKey(node, attribute=attr, time=(min(frames), max(frames)), clear=True)
+    curveFn = getAnimCurve(node, attr)
+    times = om.MTimeArray([om.MTime(frame, om.MTime.uiUnit()) for frame in frames])
+    curveFn.addKeys(times, om.MDoubleArray(values), omAnim.MFnAnimCurve.kTangentAuto, omAnim.MFnAnimCurve.kTangentAuto, True)
+
+# *** Writing Rotation Keys from Matrices, Keeping Euler Angles Continuous ***
+def writeRotationKeys(ctrl, frames, localMatrices):
+    rotateOrder = cmds.getAttr(ctrl + '.rotateOrder')
+    channels = [[], [], []]
+    previous = None
+    for matrix in localMatrices:
+        euler = om.MTransformationMatrix(matrix).rotation().reorder(rotateOrder)
+        if previous is not None:
+            euler = euler.closestSolution(previous)
+        previous = euler
+        for i in range(0, 3):
+            channels[i].append(euler[i])
+    for axis, values in zip('XYZ', channels):
+        if cmds.getAttr(ctrl + '.rotate' + axis, settable=True):
+            writeKeys(ctrl, 'rotate' + axis, frames, values)
+
+# *** Writing Translation Keys from Positions ***
+def writeTranslationKeys(ctrl, frames, positions):
+    for i, axis in enumerate('XYZ'):
+        if cmds.getAttr(ctrl + '.translate' + axis, settable=True):
+            writeKeys(ctrl, 'translate' + axis, frames, [pos[i] for pos in positions])
+
+
+# **** MATCHING ****
+
+
+# *** Getting the Names of Every Node Needed to Match a Limb ***
+def getLimbNodes(side, limb, prefix=''):
+    info = limbInfo[limb]
+    nodes = {
+        'switch': prefix + side + '_' + limb + '_Switch_Ctrl',
+        'topCtrl': prefix + side + '_IK_' + info['top'] + '_Ctrl',
+        'bottomCtrl': prefix + side + '_IK_' + info['bottom'] + '_Ctrl',
+        'FKctrls': [],
+    }
+    i = 1
+    while cmds.objExists(prefix + side + '_' + limb + '_FK_' + str(i) + '_j_Ctrl'):
+        nodes['FKctrls'].append(prefix + side + '_' + limb + '_FK_' + str(i) + '_j_Ctrl')
+        i += 1
+    nodes['FKjnts'] = [prefix + side + '_' + limb + '_FK_' + str(i + 1) + '_j' for i in range(0, len(nodes['FKctrls']))]
+    nodes['IKjnts'] = [prefix + side + '_' + limb + '_IK_' + str(i + 1) + '_j' for i in range(0, len(nodes['FKctrls']))]
+    return nodes
+
+# *** Keying FK Controls to Follow the IK Chain ***
+def matchFKToIK(nodes, frames):
+    FKctrls = nodes['FKctrls']
+    FKjnts = nodes['FKjnts']
+    IKjnts = nodes['IKjnts']
+    offsetGrps = [ctrl + '__Offset' for ctrl in FKctrls]
+
+    # Measuring Constant Offsets Between Each Control, Its Offset Group, and Its Joint Once
+    ctrlWorlds = [plug.asMObject() for plug in getPlugs(FKctrls, 'worldMatrix')]
+    jntWorlds = [plug.asMObject() for plug in getPlugs(FKjnts, 'worldMatrix')]
+    jointToCtrl = [om.MFnMatrixData(c).matrix() * om.MFnMatrixData(j).matrix().inverse() for c, j in zip(ctrlWorlds, jntWorlds)]
+    groupLocals = [om.MFnMatrixData(plug.asMObject()).matrix() for plug in getPlugs(offsetGrps, 'matrix')]
+
+    # Sampling the IK Chain and the Parent of the FK Chain at Every Frame
+    IKsamples = samplePlugs(getPlugs(IKjnts, 'worldMatrix'), frames)
+    topParents = samplePlugs(getPlugs([offsetGrps[0]], 'worldMatrix'), frames)
+
+    # Solving Each Control from the Top Down, Using the Solved Parent Control
+    localMatrices = [[] for ctrl in FKctrls]
+    for f in range(0, len(frames)):
+        parentWorld = topParents[f][0]
+        for i in range(0, len(FKctrls)):
+            if i > 0:
+                parentWorld = groupLocals[i] * ctrlWorld
+            ctrlWorld = jointToCtrl[i] * IKsamples[f][i]
+            localMatrices[i].append(ctrlWorld * parentWorld.inverse())
+    for ctrl, matrices in zip(FKctrls, localMatrices):
+        writeRotationKeys(ctrl, frames, matrices)
+
+# *** Measuring How Far the Mid Joint Points Away from Its Target Around the Limb Axis ***
+def getTwistAngle(startPos, endPos, midPos, targetMidPos):
+    axis = (endPos - startPos).normalize()
+    current = (midPos - startPos)
+    target = (targetMidPos - startPos)
+    current = current - (axis * (current * axis))
+    target = target - (axis * (target * axis))
+    if current.length() < 1e-6 or target.length() < 1e-6:
+        return 0.0
+    return math.atan2((current ^ target) * axis, current * target)
+
+# *** Keying IK Controls to Follow the FK Chain ***
+def matchIKToFK(nodes, frames, limb):
+    info = limbInfo[limb]
+    topCtrl = nodes['topCtrl']
+    bottomCtrl = nodes['bottomCtrl']
+    startIK, midIK, endIK = [nodes['IKjnts'][0], nodes['IKjnts'][info['mid'] - 1], nodes['IKjnts'][info['end'] - 1]]
+    startFK, midFK, endFK = [nodes['FKjnts'][0], nodes['FKjnts'][info['mid'] - 1], nodes['FKjnts'][info['end'] - 1]]
+
+    # Measuring Constant Offsets Between the IK Controls and the Joints They Move Once
+    bottomWorld, endWorld, topWorld, startWorld = [om.MFnMatrixData(plug.asMObject()).matrix() for plug in getPlugs([bottomCtrl, endIK, topCtrl, startIK], 'worldMatrix')]
+    jointToCtrl = bottomWorld * endWorld.inverse()
+    topOffset = getPosition(topWorld) - getPosition(startWorld)
+
+    # Sampling the FK Chain and the IK Control Parents at Every Frame
+    samples = samplePlugs(getPlugs([startFK, endFK, bottomCtrl + '__Offset', topCtrl + '__Offset'], 'worldMatrix'), frames)
+    bottomLocals = []
+    topPositions = []
+    for startFKWorld, endFKWorld, bottomParent, topParent in samples:
+        bottomLocals.append(jointToCtrl * endFKWorld * bottomParent.inverse())
+        topPoint = om.MPoint(getPosition(startFKWorld) + topOffset) * topParent.inverse()
+        topPositions.append([topPoint.x, topPoint.y, topPoint.z])
+    writeRotationKeys(bottomCtrl, frames, bottomLocals)
+    writeTranslationKeys(bottomCtrl, frames, [[m.getElement(3, 0), m.getElement(3, 1), m.getElement(3, 2)] for m in bottomLocals])
+    writeTranslationKeys(topCtrl, frames, topPositions)
+
+    # Solving Twist from the Newly Keyed IK Pose, in the Units the IK Handle Receives It
+    twistFactor = 1.0
+    twistTargets = cmds.listConnections(bottomCtrl + '.Twist', source=False, destination=True, type='unitConversion') or []
+    if twistTargets:
+        twistFactor = cmds.getAttr(twistTargets[0] + '.conversionFactor')
+    twistPlugs = getPlugs([startIK, endIK, midIK, midFK], 'worldMatrix')
+    currentTwist = [values[0] for values in samplePlugs(getPlugs([bottomCtrl], 'Twist'), frames, asMatrix=False)]
+    angles = [getTwistAngle(*[getPosition(m) for m in matrices]) for matrices in samplePlugs(twistPlugs, frames)]
+
+    # Checking the Twist Direction on the First Frame and Flipping It If the Error Grows
+    writeKeys(bottomCtrl, 'Twist', frames, [twist + (angle / twistFactor) for twist, angle in zip(currentTwist, angles)])
+    residual = getTwistAngle(*[getPosition(m) for m in readPlugsAtFrame(twistPlugs, frames[0])])
+    if abs(residual) > abs(angles[0]):
+        writeKeys(bottomCtrl, 'Twist', frames, [twist - (angle / twistFactor) for twist, angle in zip(currentTwist, angles)])
+
+# *** Matching a Limb to Its Other Mode Over a Frame Range and Keying the Switch ***
+def matchAndBake(side, limb, target, startFrame, endFrame, prefix=''):
+    nodes = getLimbNodes(side, limb, prefix)
+    frames = list(range(int(startFrame), int(endFrame) + 1))
+    if target == 'FK':
+        matchFKToIK(nodes, frames)
+        blend = 0.0
+    elif target == 'IK':
+        matchIKToFK(nodes, frames, limb)
+        blend = 1.0
+    else:
+        cmds.error("Target must be 'IK' or 'FK'.")
+    writeKeys(nodes['switch'], 'IK_Blend', frames, [blend] * len(frames))
+    return frames
+
+# *** Matching Every Limb of a Rig at Once ***
+def matchAndBakeAll(target, startFrame, endFrame, prefix=''):
+    for side in ['L', 'R']:
+        for limb in ['Arm', 'Leg']:
+            matchAndBake(side, limb, target, startFrame, endFrame, prefix)
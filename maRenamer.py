@@ -0,0 +1,208 @@
+"""
+
+What Can This Program Do?
+- This program renames nodes in Maya ASCII (.ma) files without opening them in Maya, so it runs on render farm machines without a Maya license.
+- It applies the same kinds of renames as objectRenamer.py, from a rename plan:
+    1. replace: swaps an old string for a new string in node names, like batchReplace()
+    2. regex: swaps matches of a regular expression for a replacement in node names
+    3. suffix: adds a suffix to transforms based on the type of their shape, like addSuffix(), skipping names that already end in it
+- Renames are applied the same way to node declarations, parents, connections, selections, reference nodes, and reference edits.
+- Files are read and written line by line, so memory stays small no matter how large the file is, and many files are processed at once across a pool of processes.
+
+Notes for Running:
+- python maRenamer.py plan.json outputFolder scene1.ma scene2.ma ... renames every scene into the output folder.
+- The plan is a JSON file like {"replace": [["old", "new"]], "regex": [["^L_", "Left_"]], "suffix": true}.
+- Only nodes created in the file itself are renamed. Nodes from referenced files and names inside scripts and expressions are left alone.
+- Nodes sharing a short name under different parents all get the same new name.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import io
+import json
+import multiprocessing
+import os
+import re
+import sys
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Suffixes Added to Transforms by the Type of Their Shape, Matching objectRenamer.addSuffix()
+typeSuffixes = [
+    ('mesh', '__MESH'),
+    ('nurbsCurve', '__NURB'),
+    ('Light', '__LIGHT'),
+    ('locator', '__LOC'),
+]
+
+# Commands Whose Quoted Arguments Name Nodes
+nodeCommands = set(['createNode', 'connectAttr', 'disconnectAttr', 'parent', 'select', 'relationship', 'lockNode'])
+
+# Quoted Strings, Allowing Escaped Quotes Inside
+quotedPattern = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+# DAG Node Types That Can Be Declared Under a Transform Without Being Its Shape
+transformTypes = set(['transform', 'joint', 'ikHandle', 'ikEffector'])
+
+# Name and Parent Flags of a Node Declaration
+createPattern = re.compile(r'^createNode\s+(\w+).*?-n\s+"([^"]+)"(?:.*?-p\s+"([^"]+)")?')
+
+
+# **** PLANNING RENAMES ****
+
+
+# *** Finding the Full Path of a Parent Written as a Short Name or Partial Path, Taking the Latest Declared Match ***
+def resolveParent(parent, paths):
+    if parent.startswith('|'):
+        return parent
+    for fullPath in reversed(paths.get(parent.split('|')[-1], [])):
+        if ('|' + fullPath).endswith('|' + parent):
+            return fullPath
+    return '|' + parent
+
+# *** Reading Every Node Declared in a File, with Its Type, the Full Paths of Its Short Name, and the Type of Each Transform's Shape ***
+def scanNodes(path):
+    nodeTypes = {}
+    shapeTypes = {}
+    paths = {}
+    with io.open(path, 'r', encoding='latin-1', newline='') as maFile:
+        for line in maFile:
+            if not line.startswith('createNode'):
+                continue
+            match = createPattern.match(line)
+            if not match:
+                continue
+            nodeType, name, parent = match.groups()
+            nodeTypes[name] = nodeType
+            parentPath = resolveParent(parent, paths) if parent else ''
+            paths.setdefault(name, []).append(parentPath + '|' + name)
+            
+            # Keeping the First Shape Under Each Transform, Not Child Transforms or Constraints Declared After It
+            if parent and nodeType not in transformTypes and not nodeType.endswith('Constraint') and parentPath not in shapeTypes:
+                shapeTypes[parentPath] = nodeType
+    return nodeTypes, shapeTypes, paths
+
+# *** Getting the Suffix for a Transform Based on the Type of Its Shape, from the First of Its Paths That Has One ***
+def getSuffix(name, nodeTypes, shapeTypes, paths):
+    if nodeTypes.get(name) != 'transform':
+        return ''
+    for fullPath in paths.get(name, []):
+        shapeType = shapeTypes.get(fullPath)
+        if shapeType is None:
+            continue
+        for typeName, suffix in typeSuffixes:
+            if (shapeType == typeName) or (typeName == 'Light' and typeName in shapeType):
+                return suffix
+    return ''
+
+# *** Building the Old to New Name Map of a File from a Rename Plan ***
+def planRenames(path, plan):
+    nodeTypes, shapeTypes, paths = scanNodes(path)
+    renames = {}
+    for name in nodeTypes:
+        # Leaving Nodes in Namespaces Alone, Since They Come from Other Files
+        if ':' in name:
+            continue
+        newName = name
+        for old, new in plan.get('replace', []):
+            newName = newName.replace(old, new)
+        for pattern, repl in plan.get('regex', []):
+            newName = re.sub(pattern, repl, newName)
+        if plan.get('suffix') and ('Shape' not in name):
+            suffix = getSuffix(name, nodeTypes, shapeTypes, paths)
+            if suffix and not newName.endswith(suffix):
+                newName += suffix
+        if newName != name:
+            renames[name] = newName
+    return renames
+
+
+# **** RENAMING ****
+
+
+# *** Renaming the Node Names in a Quoted Name, Path, or Plug, Keeping the Attribute ***
+def renameToken(token, renames):
+    path, dot, attr = token.partition('.')
+    parts = path.split('|')
+    return '|'.join([renames.get(part, part) for part in parts]) + dot + attr
+
+# *** Renaming Every Quoted Argument of a Line ***
+def renameQuoted(line, renames, flag=None):
+    def replace(match):
+        # Only Renaming the Argument After a Flag, When One Is Given
+        if flag and not line[:match.start()].rstrip().endswith(flag):
+            return match.group(0)
+        return '"' + renameToken(match.group(1), renames) + '"'
+    return quotedPattern.sub(replace, line)
+
+# *** Renaming One File, Streaming Lines from the Input to the Output ***
+def renameFile(path, plan, outPath=None):
+    renames = planRenames(path, plan)
+    if outPath is None:
+        outPath = path
+    tempPath = outPath + '.renaming'
+    command = ''
+    referenceEdits = False
+    lineCount = 0
+
+    # Reading and Writing as Latin-1, So Every Byte Round Trips Unchanged
+    with io.open(path, 'r', encoding='latin-1', newline='') as inFile:
+        with io.open(tempPath, 'w', encoding='latin-1', newline='') as outFile:
+            for line in inFile:
+                lineCount += 1
+
+                # Starting a New Command When the Last One Ended
+                if not command:
+                    command = line.split(None, 1)[0] if line.strip() else ''
+                    referenceEdits = command == 'setAttr' and '"dataReferenceEdits"' in line
+                if renames:
+                    if command in nodeCommands or referenceEdits:
+                        line = renameQuoted(line, renames)
+                    elif command == 'file':
+                        line = renameQuoted(line, renames, '-rfn')
+                if line.rstrip().endswith(';'):
+                    command = ''
+                    referenceEdits = False
+                outFile.write(line)
+
+    # Replacing the Output Only Once It Is Fully Written
+    if os.path.exists(outPath) and sys.platform.startswith('win'):
+        os.remove(outPath)
+    os.rename(tempPath, outPath)
+    return {'path': path, 'outPath': outPath, 'renamed': len(renames), 'lines': lineCount}
+
+# *** Renaming One File from a Tuple of Arguments, for the Process Pool ***
+def renameFileJob(args):
+    return renameFile(*args)
+
+# *** Renaming Many Files in Parallel, into an Output Folder or in Place ***
+def renameFiles(paths, plan, outFolder=None, processes=None):
+    jobs = []
+    for path in paths:
+        outPath = os.path.join(outFolder, os.path.basename(path)) if outFolder else None
+        jobs.append((path, plan, outPath))
+    if len(jobs) < 2 or processes == 1:
+        return [renameFileJob(job) for job in jobs]
+    pool = multiprocessing.Pool(processes)
+    try:
+        return pool.map(renameFileJob, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+# ***** RENAMING FILES FROM THE COMMAND LINE *****
+
+if __name__ == '__main__':
+    with open(sys.argv[1]) as planFile:
+        renamePlan = json.load(planFile)
+    outputFolder = sys.argv[2]
+    if not os.path.isdir(outputFolder):
+        os.makedirs(outputFolder)
+    for result in renameFiles(sys.argv[3:], renamePlan, outputFolder):
+        print('%s: renamed %d nodes in %d lines' % (result['outPath'], result['renamed'], result['lines']))
@@ -0,0 +1,149 @@
+"""
+
+What Can This Program Do?
+- This program reads the bind skeleton, curves, locators, and meshes of Maya ASCII (.ma) files without Maya, and checks them with rigValidator.py.
+- It tells which character files bipedAutoRig.py can rig before an overnight batch starts, on any machine with Python.
+- Files are read line by line, so memory stays small no matter how large the file is, and many files are checked at once across a pool of processes.
+- Each joint keeps its name, parent, children, translate, and joint orient, in the same skeleton description bipedAutoRig.getSkeleton() gives in Maya.
+
+Notes for Running:
+- python maSkeleton.py scene1.ma scene2.ma ... prints every problem found in each scene.
+- Add --prefix=name_ to check the foot locators of a prefixed build, and --placeFootPivots when the locators will be placed from the mesh.
+- Joints inside referenced files are not read, since they are not in the .ma file itself.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import io
+import multiprocessing
+import re
+import sys
+
+import rigValidator
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Name and Parent Flags of a Node Declaration
+createPattern = re.compile(r'^createNode\s+(\w+).*?-n\s+"([^"]+)"(?:.*?-p\s+"([^"]+)")?')
+
+# Joint Attributes Kept in the Skeleton Description, by Their Short Names in .ma Files
+jointAttrs = {'.t': 'translate', '.jo': 'jointOrient'}
+
+
+# **** READING FILES ****
+
+
+# *** Getting the CV Count from the Numbers of a nurbsCurve Value: Degree, Spans, Form, Rational, Dimension, Knots, Then CVs ***
+def getCVCount(values):
+    knotCount = int(values[5])
+    return int(values[6 + knotCount])
+
+# *** Reading the Skeleton Description of One File ***
+def readSkeleton(path):
+    skeleton = rigValidator.newSkeleton()
+    nodeType = name = parent = None
+    curveValues = None
+    with io.open(path, 'r', encoding='latin-1') as maFile:
+        for line in maFile:
+
+            # ** Collecting a Curve Value That Spans Lines Until Its Semicolon **
+            if curveValues is not None:
+                curveValues += line.replace(';', ' ').split()
+                if ';' in line:
+                    skeleton['curves'][parent] = getCVCount(curveValues)
+                    curveValues = None
+                continue
+
+            # ** Starting a New Node **
+            if line.startswith('createNode'):
+                match = createPattern.match(line)
+                nodeType = name = parent = None
+                if not match:
+                    continue
+                nodeType, name, parent = match.groups()
+                parent = parent.split('|')[-1] if parent else None
+                if nodeType == 'joint':
+                    rigValidator.addJoint(skeleton, name, parent if parent in skeleton['joints'] else None)
+                elif nodeType == 'locator' and parent:
+                    skeleton['locators'].append(parent)
+                elif nodeType == 'mesh' and parent and parent not in skeleton['meshes']:
+                    skeleton['meshes'].append(parent)
+                continue
+
+            # ** Ending the Current Node at the Next Command That Is Not Indented Under It **
+            if not line[:1].isspace():
+                nodeType = None
+                continue
+            if nodeType is None or not line.lstrip().startswith('setAttr'):
+                continue
+
+            # ** Reading Joint Transforms and Curve Shapes of the Current Node **
+            fields = line.split()
+            if nodeType == 'joint':
+                for shortAttr, attr in jointAttrs.items():
+                    if ('"' + shortAttr + '"') in fields and '"double3"' in fields:
+                        numbers = fields[fields.index('"double3"') + 1:][:3]
+                        skeleton['joints'][name][attr] = [float(value.rstrip(';')) for value in numbers]
+            elif nodeType == 'nurbsCurve' and parent and '".cc"' in fields:
+                curveStart = fields.index('"nurbsCurve"') + 1 if '"nurbsCurve"' in fields else len(fields)
+                curveValues = ' '.join(fields[curveStart:]).replace(';', ' ').split()
+                if ';' in line:
+                    skeleton['curves'][parent] = getCVCount(curveValues)
+                    curveValues = None
+    return skeleton
+
+
+# **** CHECKING FILES ****
+
+
+# *** Checking One File, for the Process Pool ***
+def checkFile(args):
+    path, prefix, placeFootPivots = args
+    try:
+        problems = rigValidator.validateSkeleton(readSkeleton(path), prefix=prefix, placeFootPivots=placeFootPivots)
+    except (IOError, OSError, ValueError, IndexError) as error:
+        problems = ['The file could not be read: ' + str(error)]
+    return path, problems
+
+# *** Checking Many Files in Parallel ***
+def checkFiles(paths, prefix='', placeFootPivots=False, processes=None):
+    jobs = [(path, prefix, placeFootPivots) for path in paths]
+    if len(jobs) < 2 or processes == 1:
+        return [checkFile(job) for job in jobs]
+    pool = multiprocessing.Pool(processes)
+    try:
+        return pool.map(checkFile, jobs, chunksize=8)
+    finally:
+        pool.close()
+        pool.join()
+
+
+# ***** CHECKING FILES FROM THE COMMAND LINE *****
+
+if __name__ == '__main__':
+    filePrefix = ''
+    footPivots = False
+    scenePaths = []
+    for arg in sys.argv[1:]:
+        if arg.startswith('--prefix='):
+            filePrefix = arg.split('=', 1)[1]
+        elif arg == '--placeFootPivots':
+            footPivots = True
+        else:
+            scenePaths.append(arg)
+    failed = 0
+    for scenePath, sceneProblems in checkFiles(scenePaths, filePrefix, footPivots):
+        if sceneProblems:
+            failed += 1
+            print(scenePath + ': FAILED')
+            for problem in sceneProblems:
+                print('    ' + problem)
+        else:
+            print(scenePath + ': OK')
+    print('%d of %d files can be rigged.' % (len(scenePaths) - failed, len(scenePaths)))
+    sys.exit(1 if failed else 0)
@@ -3,17 +3,30 @@
 What Can This Program Do?
 - This program copies all transforms on the controllers of the left side of a facial rig to the right side.
 - The results is a mirrored expression on a character's face.
+- It can also be imported and run with mirrorExpression().
 
 """
 
-for ctrl in ['_TopLip_Ctrl', '_BottomLip_Ctrl', '_CornerMouth_Ctrl', '_Cheek_Ctrl', '_Nostril_Ctrl', '_InnerEyebrow_Ctrl', '_MidEyebrow_Ctrl', '_OuterEyebrow_Ctrl', '_EyebrowArea_Ctrl', '_UpperEye_Ctrl', '_LowerEye_Ctrl']:
-    if 'Eye_' in ctrl:
-        transforms = ['.translate']
-        axes = 'Y'
-    else:
-        transforms = ['.translate', '.rotate']
-        axes = 'XYZ'
-    for transform in transforms:
-        for axis in axes:
-            current = cmds.getAttr('L' + ctrl + transform + axis)
-            cmds.setAttr('R' + ctrl + transform + axis, current)
+# Import Maya Commands
+from maya import cmds
+
+# Facial Controllers Shared by Both Sides
+faceCtrls = ['_TopLip_Ctrl', '_BottomLip_Ctrl', '_CornerMouth_Ctrl', '_Cheek_Ctrl', '_Nostril_Ctrl', '_InnerEyebrow_Ctrl', '_MidEyebrow_Ctrl', '_OuterEyebrow_Ctrl', '_EyebrowArea_Ctrl', '_UpperEye_Ctrl', '_LowerEye_Ctrl']
+
+# Copying Left Side Transforms to Right Side
+def mirrorExpression(sourceSide='L', targetSide='R'):
+    for ctrl in faceCtrls:
+        if 'Eye_' in ctrl:
+            transforms = ['.translate']
+            axes = 'Y'
+        else:
+            transforms = ['.translate', '.rotate']
+            axes = 'XYZ'
+        for transform in transforms:
+            for axis in axes:
+                current = cmds.getAttr(sourceSide + ctrl + transform + axis)
+                cmds.setAttr(targetSide + ctrl + transform + axis, current)
+
+# Running When Executed from the Script Editor
+if __name__ == '__main__':
+    mirrorExpression()
@@ -12,12 +12,21 @@ The addSuffix function adds a suffix to the name of all the following objects in
     3. Lights: __LIGHT
     4. Locators: __LOC
 
+Long runs show progress on the progress bar (or in the log in batch mode), and pressing Esc cancels and undoes the renames.
+Objects whose names already end in their suffix are skipped, so running addSuffix again never gives names like pCube1__MESH__MESH.
+
+The startLiveSuffix function adds the same suffixes to new objects as they are created, so large scenes never need a full pass.
+New shapes are collected by node-added callbacks and renamed together when Maya is idle. The stopLiveSuffix function turns it off.
+
 All other functions are help functions that assist batchRename, batchReplace, and addSuffix.
 
 """
 
 # Importing Modules
 from maya import cmds
+import maya.api.OpenMaya as om
+
+import progressReport
 
 # Gets List of Selected Objects
 def checkSelection():
@@ -48,20 +57,93 @@ def batchReplace(oldPhrase, newPhrase):
 			newName = obj.replace(oldPhrase, newPhrase)
 			cmds.rename(obj, newName)
 
-# Adds Suffix to Object Name Based on Type
-def addSuffix():
+# Gets Suffix for an Object Based on Type
+def getSuffix(obj):
+    objType = checkType(obj)
+    if (objType == "mesh"):
+        return "__MESH"
+    elif (objType == "nurbsCurve"):
+        return "__NURB"
+    elif (objType != None) and ("Light" in objType):
+        return "__LIGHT"
+    elif (objType == "locator"):
+        return "__LOC"
+    return ""
+
+# Adds Suffix to Object Name Based on Type, in Cancellable Chunks
+def addSuffix(chunkSize=500):
     cmds.select(all=True, hierarchy=True)
     objList = checkSelection()
     cmds.select(clear=True)
+    
+    # Planning Renames by UUID, So Renaming Parents Does Not Break Child Names
+    renames = []
     for obj in objList:
         if ("Shape" not in obj) and (checkType(obj) != None):
-            if (checkType(obj) == "mesh"):
-                cmds.rename(obj, obj + "__MESH")
-            elif (checkType(obj) == "nurbsCurve"):
-                cmds.rename(obj, obj + "__NURB")
-            elif ("Light" in checkType(obj)):
-                cmds.rename(obj, obj + "__LIGHT")
-            elif (checkType(obj) == "locator"):
-                cmds.rename(obj, obj + "__LOC")
-            else:
-                cmds.rename(obj, obj)
+            suffix = getSuffix(obj)
+            if suffix and not obj.endswith(suffix):
+                renames.append((cmds.ls(obj, uuid=True)[0], obj.split("|")[-1], suffix))
+    
+    # Renaming Each Chunk and Remembering Old Names for Rollback
+    renamed = []
+    def renameChunk(chunk):
+        for uuid, oldName, suffix in chunk:
+            cmds.rename(cmds.ls(uuid, long=True)[0], oldName + suffix)
+            renamed.append((uuid, oldName))
+    def rollback():
+        for uuid, oldName in reversed(renamed):
+            cmds.rename(cmds.ls(uuid, long=True)[0], oldName)
+    return progressReport.runChunkedJob("Adding Suffixes", renames, renameChunk, chunkSize, rollback)
+
+# Shape Types That Get a Suffix, Including Every Type of Light
+liveSuffixTypes = ["mesh", "nurbsCurve", "light", "locator"]
+
+# Callbacks of the Live Mode and New Shapes Waiting for Maya to Be Idle
+liveSuffix = {"callbacks": [], "pending": [], "scheduled": False}
+
+# Collects a New Shape and Schedules One Rename Pass for Every Shape Created Before Maya Is Idle
+def onShapeAdded(node, clientData):
+    liveSuffix["pending"].append(om.MObjectHandle(node))
+    if not liveSuffix["scheduled"]:
+        liveSuffix["scheduled"] = True
+        cmds.evalDeferred(renamePending, lowestPriority=True)
+
+# Adds Suffixes to the Transforms of Every Collected Shape, Skipping Referenced, Locked, and Already Suffixed Ones
+def renamePending():
+    handles = liveSuffix["pending"]
+    liveSuffix["pending"] = []
+    liveSuffix["scheduled"] = False
+    
+    # Finding Each Transform Once, After Its Shapes Are Parented
+    transforms = {}
+    for handle in handles:
+        if not handle.isValid() or om.MFnDagNode(handle.object()).parentCount() == 0:
+            continue
+        parent = om.MFnDagNode(om.MFnDagNode(handle.object()).parent(0))
+        if parent.object().hasFn(om.MFn.kWorld) or parent.isFromReferencedFile or parent.isLocked:
+            continue
+        transforms[om.MObjectHandle(parent.object()).hashCode()] = parent.fullPathName()
+    
+    # Renaming Children Before Parents in One Undo Chunk, So Paths Stay Valid and One Undo Takes Back the Batch
+    cmds.undoInfo(openChunk=True)
+    try:
+        for obj in sorted(transforms.values(), reverse=True):
+            suffix = getSuffix(obj)
+            if suffix and not obj.endswith(suffix):
+                cmds.rename(obj, obj.split("|")[-1] + suffix)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+# Starts Adding Suffixes to New Objects as They Are Created
+def startLiveSuffix():
+    if liveSuffix["callbacks"]:
+        return
+    for nodeType in liveSuffixTypes:
+        liveSuffix["callbacks"].append(om.MDGMessage.addNodeAddedCallback(onShapeAdded, nodeType))
+
+# Stops Adding Suffixes to New Objects
+def stopLiveSuffix():
+    if liveSuffix["callbacks"]:
+        om.MMessage.removeCallbacks(liveSuffix["callbacks"])
+    liveSuffix["callbacks"] = []
+    liveSuffix["pending"] = []
@@ -0,0 +1,244 @@
+"""
+
+What Can This Program Do?
+- This program captures, stores, blends, and applies poses of rigs from bipedAutoRig.py.
+- A pose holds the value of every keyable channel of every control, in one array of numbers, with channels named by control and attribute.
+- Poses are applied in one batched write, so scrubbing through a library stays interactive on dense rigs.
+- resetControls() puts every control, or only one side, limb, or stage, back to the values it was built with, including custom attributes like IK_Blend and foot rolls.
+- Poses can be blended with the current pose of the rig or with each other.
+- A pose library is saved as one binary file holding every pose, and poses from other rig versions apply to the channels both rigs share.
+
+Notes for Running:
+- Batched writes are not undoable, which keeps scrubbing fast. Passing undoable=True writes through Maya commands in one undo chunk instead.
+- Locked channels, and channels driven by anything other than keys, are skipped.
+- Poses hold values in Maya's internal units, radians and centimeters, whatever units the scene works in. Defaults registered on the rig are converted to match.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import array
+import json
+import math
+import struct
+import sys
+
+from maya import cmds
+import maya.api.OpenMaya as om
+
+import rigControls
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Header That Marks a Pose Library File
+libraryMagic = b'RIGPOSE1'
+
+
+# **** RIG CHANNELS ****
+
+
+# *** Getting the Name, Node Plug, and Default Value of Every Channel of a Rig's Controls ***
+def getChannels(masterCtrl, side=None, limb=None, stage=None):
+    channels = {'names': [], 'attrs': [], 'defaults': array.array('d')}
+    for name, info in sorted(rigControls.getControlInfo(masterCtrl).items()):
+        if (side and info['side'] != side) or (limb and info['limb'] != limb) or (stage and info['stage'] != stage):
+            continue
+        for attr in sorted(info['defaults']):
+            channels['names'].append(name + '.' + attr)
+            channels['attrs'].append(info['node'] + '.' + attr)
+            channels['defaults'].append(float(info['defaults'][attr]))
+    channels['plugs'] = getPlugs(channels['attrs'])
+    
+    # Dropping Registered Channels the Rig No Longer Has, Like Attributes Pruned by rigLinter.py
+    if None in channels['plugs']:
+        kept = [i for i in range(0, len(channels['plugs'])) if channels['plugs'][i] is not None]
+        channels['names'] = [channels['names'][i] for i in kept]
+        channels['attrs'] = [channels['attrs'][i] for i in kept]
+        channels['defaults'] = array.array('d', [channels['defaults'][i] for i in kept])
+        channels['plugs'] = [channels['plugs'][i] for i in kept]
+    
+    # Converting Defaults, Registered in UI Units, to the Internal Units Plugs Hold
+    for i in range(0, len(channels['plugs'])):
+        channels['defaults'][i] = toInternal(channels['defaults'][i], getUnitType(channels['plugs'][i]))
+    channels['writable'] = [isWritable(plug) for plug in channels['plugs']]
+    channels['index'] = dict((channels['names'][i], i) for i in range(0, len(channels['names'])))
+    return channels
+
+# *** Getting Plugs for a List of Attributes in One Selection List, with None for Attributes That Do Not Exist ***
+def getPlugs(attrs):
+    selList = om.MSelectionList()
+    found = []
+    for attr in attrs:
+        try:
+            selList.add(attr)
+            found.append(True)
+        except RuntimeError:
+            found.append(False)
+    plugs = iter([selList.getPlug(i) for i in range(0, selList.length())])
+    return [next(plugs) if exists else None for exists in found]
+
+# *** Getting Whether a Plug Holds an Angle, a Distance, or a Plain Number ***
+def getUnitType(plug):
+    attribute = plug.attribute()
+    if attribute.hasFn(om.MFn.kUnitAttribute):
+        return om.MFnUnitAttribute(attribute).unitType()
+    return None
+
+# *** Converting a Value from UI Units, as Commands Use Them, to Internal Units, as Plugs Hold Them ***
+def toInternal(value, unitType):
+    if unitType == om.MFnUnitAttribute.kAngle:
+        return om.MAngle.uiToInternal(value)
+    elif unitType == om.MFnUnitAttribute.kDistance:
+        return om.MDistance.uiToInternal(value)
+    return value
+
+# *** Converting a Value from Internal Units to UI Units ***
+def toUI(value, unitType):
+    if unitType == om.MFnUnitAttribute.kAngle:
+        return om.MAngle.internalToUI(value)
+    elif unitType == om.MFnUnitAttribute.kDistance:
+        return om.MDistance.internalToUI(value)
+    return value
+
+# *** Checking Whether a Plug Can Be Written, Not Locked or Driven by Anything but Keys ***
+def isWritable(plug):
+    if plug.isLocked:
+        return False
+    return not plug.isDestination or plug.source().node().hasFn(om.MFn.kAnimCurve)
+
+
+# **** CAPTURING AND BLENDING POSES ****
+
+
+# *** Capturing the Current Value of Every Channel of a Rig as a Pose ***
+def capturePose(masterCtrl, side=None, limb=None, stage=None, channels=None):
+    if channels is None:
+        channels = getChannels(masterCtrl, side, limb, stage)
+    return {'channels': list(channels['names']), 'values': array.array('d', [plug.asDouble() for plug in channels['plugs']])}
+
+# *** Getting the Default Pose of a Rig ***
+def getDefaultPose(masterCtrl, side=None, limb=None, stage=None, channels=None):
+    if channels is None:
+        channels = getChannels(masterCtrl, side, limb, stage)
+    return {'channels': list(channels['names']), 'values': array.array('d', channels['defaults'])}
+
+# *** Blending Two Poses, Keeping Channels Only One of Them Has as They Are ***
+def blendPoses(poseA, poseB, weight):
+    indexB = dict((poseB['channels'][i], i) for i in range(0, len(poseB['channels'])))
+    channels = list(poseA['channels'])
+    values = array.array('d', poseA['values'])
+    for i in range(0, len(channels)):
+        j = indexB.pop(channels[i], None)
+        if j is None or math.isnan(poseB['values'][j]):
+            continue
+        if math.isnan(values[i]):
+            values[i] = poseB['values'][j]
+        else:
+            values[i] += (poseB['values'][j] - values[i]) * weight
+    for name in sorted(indexB, key=lambda name: indexB[name]):
+        channels.append(name)
+        values.append(poseB['values'][indexB[name]])
+    return {'channels': channels, 'values': values}
+
+
+# **** APPLYING POSES ****
+
+
+# *** Writing Values in Internal Units to Plugs, in One Batched Modifier or One Undo Chunk ***
+def writePlugs(plugs, attrs, values, undoable=False):
+    if undoable:
+        cmds.undoInfo(openChunk=True)
+        try:
+            # Commands Take UI Units, So Angles and Distances Are Converted Back
+            for plug, attr, value in zip(plugs, attrs, values):
+                cmds.setAttr(attr, toUI(value, getUnitType(plug)))
+        finally:
+            cmds.undoInfo(closeChunk=True)
+        return len(values)
+    modifier = om.MDGModifier()
+    for plug, value in zip(plugs, values):
+        attribute = plug.attribute()
+        if attribute.hasFn(om.MFn.kEnumAttribute):
+            modifier.newPlugValueShort(plug, int(round(value)))
+        elif attribute.hasFn(om.MFn.kNumericAttribute) and om.MFnNumericAttribute(attribute).numericType() == om.MFnNumericData.kBoolean:
+            modifier.newPlugValueBool(plug, value >= 0.5)
+        else:
+            modifier.newPlugValueDouble(plug, value)
+    modifier.doIt()
+    return len(values)
+
+# *** Applying a Pose to a Rig, Blended with Its Current Pose by Weight ***
+def applyPose(masterCtrl, pose, weight=1.0, channels=None, undoable=False):
+    if channels is None:
+        channels = getChannels(masterCtrl)
+    plugs = []
+    attrs = []
+    values = []
+    for name, value in zip(pose['channels'], pose['values']):
+        i = channels['index'].get(name)
+        if i is None or math.isnan(value) or not channels['writable'][i]:
+            continue
+        plug = channels['plugs'][i]
+        if weight < 1.0:
+            value = plug.asDouble() + ((value - plug.asDouble()) * weight)
+        plugs.append(plug)
+        attrs.append(channels['attrs'][i])
+        values.append(value)
+    return writePlugs(plugs, attrs, values, undoable)
+
+# *** Resetting Controls of a Rig to the Values They Were Built With ***
+def resetControls(masterCtrl, side=None, limb=None, stage=None, weight=1.0, undoable=True):
+    channels = getChannels(masterCtrl, side, limb, stage)
+    return applyPose(masterCtrl, getDefaultPose(masterCtrl, channels=channels), weight, channels, undoable)
+
+
+# **** POSE LIBRARY FILES ****
+
+
+# *** Saving Poses to One Binary File, as a Header and One Row of Values per Pose ***
+def savePoseLibrary(path, poses):
+    channels = []
+    index = {}
+    for name in sorted(poses):
+        for channel in poses[name]['channels']:
+            if channel not in index:
+                index[channel] = len(channels)
+                channels.append(channel)
+    
+    # Filling Channels a Pose Does Not Have with NaN, So Applying It Leaves Them Alone
+    header = json.dumps({'channels': channels, 'poses': sorted(poses)}).encode('utf-8')
+    with open(path, 'wb') as libraryFile:
+        libraryFile.write(libraryMagic + struct.pack('<I', len(header)) + header)
+        for name in sorted(poses):
+            row = array.array('d', [float('nan')] * len(channels))
+            for channel, value in zip(poses[name]['channels'], poses[name]['values']):
+                row[index[channel]] = value
+            if sys.byteorder != 'little':
+                row.byteswap()
+            libraryFile.write(row.tobytes() if hasattr(row, 'tobytes') else row.tostring())
+    return path
+
+# *** Loading Every Pose from a Binary Pose Library File ***
+def loadPoseLibrary(path):
+    with open(path, 'rb') as libraryFile:
+        if libraryFile.read(len(libraryMagic)) != libraryMagic:
+            raise ValueError(path + ' is not a pose library.')
+        headerSize = struct.unpack('<I', libraryFile.read(4))[0]
+        header = json.loads(libraryFile.read(headerSize).decode('utf-8'))
+        values = array.array('d')
+        values.fromfile(libraryFile, len(header['channels']) * len(header['poses']))
+    if sys.byteorder != 'little':
+        values.byteswap()
+    
+    # Keeping Only the Channels Each Pose Has
+    poses = {}
+    count = len(header['channels'])
+    for p in range(0, len(header['poses'])):
+        row = values[p*count:(p+1)*count]
+        kept = [i for i in range(0, count) if not math.isnan(row[i])]
+        poses[header['poses'][p]] = {'channels': [header['channels'][i] for i in kept], 'values': array.array('d', [row[i] for i in kept])}
+    return poses
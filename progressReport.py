@@ -0,0 +1,84 @@
+"""
+
+What Can This Program Do?
+- This program reports the progress of long jobs, like rig builds and scene-wide renames, and lets them be cancelled.
+- In the Maya UI, progress is shown on the main progress bar, and pressing Esc cancels the job between chunks.
+- In batch mode, progress is printed as a log instead.
+- Every chunk records how many items it handled, how long it took, and its throughput in items per second.
+- runChunkedJob() splits a list of items into chunks, runs a function on each chunk, and calls a rollback function if the job is cancelled.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import timeit
+
+from maya import cmds
+from maya import mel
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# *** Starting a Job, Showing the Progress Bar When There Is a UI ***
+def startProgress(title, total):
+    now = timeit.default_timer()
+    job = {'title': title, 'total': total, 'done': 0, 'cancelled': False, 'startTime': now, 'chunkStart': now, 'chunks': [], 'bar': None}
+    if not cmds.about(batch=True):
+        job['bar'] = mel.eval('$tmp = $gMainProgressBar')
+        cmds.progressBar(job['bar'], edit=True, beginProgress=True, isInterruptable=True, status=title, maxValue=max(total, 1))
+    else:
+        print(title + ': starting ' + str(total) + ' items')
+    return job
+
+# *** Recording a Finished Chunk and Showing or Logging Its Throughput ***
+def stepProgress(job, amount=1, status=''):
+    now = timeit.default_timer()
+    seconds = now - job['chunkStart']
+    chunk = {'status': status, 'items': amount, 'seconds': seconds, 'rate': amount / seconds if seconds else 0.0}
+    job['chunks'].append(chunk)
+    job['chunkStart'] = now
+    job['done'] += amount
+    message = '%s: %s %d/%d (%.1f per second)' % (job['title'], status, job['done'], job['total'], chunk['rate'])
+    if job['bar']:
+        cmds.progressBar(job['bar'], edit=True, step=amount, status=message)
+    else:
+        print(message)
+    return chunk
+
+# *** Checking Whether the Job Was Cancelled, by Esc in the UI or by cancelProgress() ***
+def isCancelled(job):
+    if job['bar'] and cmds.progressBar(job['bar'], query=True, isCancelled=True):
+        job['cancelled'] = True
+    return job['cancelled']
+
+# *** Cancelling a Job from a Script ***
+def cancelProgress(job):
+    job['cancelled'] = True
+
+# *** Ending a Job and Recording Its Total Time ***
+def endProgress(job):
+    job['seconds'] = timeit.default_timer() - job['startTime']
+    if job['bar']:
+        cmds.progressBar(job['bar'], edit=True, endProgress=True)
+    result = 'cancelled' if job['cancelled'] else 'finished'
+    print('%s: %s %d/%d in %.2f seconds' % (job['title'], result, job['done'], job['total'], job['seconds']))
+    return job
+
+# *** Running a Function over Items in Chunks, Rolling Back If Cancelled ***
+def runChunkedJob(title, items, work, chunkSize=100, rollback=None):
+    job = startProgress(title, len(items))
+    try:
+        for first in range(0, len(items), chunkSize):
+            if isCancelled(job):
+                if rollback:
+                    rollback()
+                break
+            chunk = items[first:first + chunkSize]
+            work(chunk)
+            stepProgress(job, len(chunk), 'chunk ' + str((first // chunkSize) + 1))
+    finally:
+        endProgress(job)
+    return job
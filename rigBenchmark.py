@@ -0,0 +1,236 @@
+"""
+
+What Can This Program Do?
+- This program measures how fast rigs from bipedAutoRig.py play back, so changes to the rig can be judged by animator frame rate.
+- It builds the rig on synthetic characters and crowds of several sizes from skeletonGenerator.py.
+- Cases can set the rig LOD or leave subsystems out of the build, to measure what each saves per frame.
+- It keys the IK/FK blend, finger curls, and foot roll attributes of every limb over a frame range.
+- It times the evaluation of every frame in each evaluation manager mode (DG and parallel by default).
+- The results can be printed, saved as a JSON report, and compared against an earlier report.
+
+Notes for Running:
+- Running the script with mayapy runs every default case and saves the report to the path given as the first argument.
+- Each frame is timed by changing the current time and pulling the world matrix of every bind joint, the same work a viewport needs to draw the skin.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import json
+import sys
+import timeit
+
+from maya import cmds
+import maya.api.OpenMaya as om
+
+import bipedAutoRig
+import skeletonGenerator
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Default Cases to Benchmark, Each a skeletonGenerator Preset and How Many Characters to Build
+defaultCases = [
+    {'label': 'Small', 'preset': 'Small', 'count': 1},
+    {'label': 'Medium', 'preset': 'Medium', 'count': 1},
+    {'label': 'Large', 'preset': 'Large', 'count': 1},
+    {'label': 'Huge', 'preset': 'Huge', 'count': 1},
+    {'label': 'Crowd', 'preset': 'Small', 'count': 25},
+    {'label': 'Crowd LOD', 'preset': 'Small', 'count': 25, 'lod': 2},
+    {'label': 'Crowd Omit', 'preset': 'Small', 'count': 25, 'omit': ['Fingers', 'Twist', 'FootRoll']},
+]
+
+# Evaluation Manager Modes to Time: 'off' Is the DG
+defaultModes = ['off', 'parallel']
+
+
+# **** ANIMATING THE RIG ****
+
+
+# *** Keying an Attribute from Rest, to a Pose, and Back ***
+def keyAttribute(node, attr, startFrame, endFrame, restValue, poseValue):
+    midFrame = (startFrame + endFrame) / 2.0
+    cmds.setKeyframe(node, attribute=attr, time=startFrame, value=restValue)
+    cmds.setKeyframe(node, attribute=attr, time=midFrame, value=poseValue)
+    cmds.setKeyframe(node, attribute=attr, time=endFrame, value=restValue)
+
+# *** Keying IK/FK Blend, Finger Curls, and Foot Rolls of Every Limb ***
+def animateRig(registry, startFrame, endFrame):
+    nodes = registry['nodes']
+    keyCount = 0
+    for side in ['L', 'R']:
+
+        # ** Blending Each Limb from IK to FK and Back **
+        for limb in ['Arm', 'Leg']:
+            switchCtrl = nodes[side + '_' + limb + '_Switch_Ctrl']
+            keyAttribute(switchCtrl, 'IK_Blend', startFrame, endFrame, 1.0, 0.0)
+            keyCount += 1
+
+        # ** Curling Every Finger **
+        armSwitchCtrl = nodes[side + '_Arm_Switch_Ctrl']
+        for attr in cmds.listAttr(armSwitchCtrl, userDefined=True) or []:
+            if attr.endswith('_Curl'):
+                keyAttribute(armSwitchCtrl, attr, startFrame, endFrame, 0.0, 60.0)
+                keyCount += 1
+
+        # ** Rolling the Foot, Unless Foot Roll Was Left Out **
+        ankleCtrl = nodes[side + '_IK_Ankle_Ctrl']
+        for preset in ['Heel_Roll', 'Ball_Roll', 'Tippy_Toe', 'Toes']:
+            if cmds.attributeQuery(side + '_' + preset, node=ankleCtrl, exists=True):
+                keyAttribute(ankleCtrl, side + '_' + preset, startFrame, endFrame, 0.0, 30.0)
+                keyCount += 1
+    return keyCount
+
+
+# **** TIMING PLAYBACK ****
+
+
+# *** Getting World Matrix Plugs of Joints for Pulling Evaluation ***
+def getWorldMatrixPlugs(joints):
+    selList = om.MSelectionList()
+    for jnt in joints:
+        selList.add(jnt)
+    plugs = []
+    for i in range(0, selList.length()):
+        fnNode = om.MFnDependencyNode(selList.getDependNode(i))
+        plugs.append(fnNode.findPlug('worldMatrix', False).elementByLogicalIndex(0))
+    return plugs
+
+# *** Evaluating Every Frame in a Range and Timing Each One ***
+def timeFrames(plugs, startFrame, endFrame):
+    frameTimes = []
+    for frame in range(int(startFrame), int(endFrame) + 1):
+        start = timeit.default_timer()
+        cmds.currentTime(frame, update=True)
+        for plug in plugs:
+            plug.asMObject()
+        frameTimes.append(timeit.default_timer() - start)
+    return frameTimes
+
+# *** Timing Playback in One Evaluation Manager Mode ***
+def timePlayback(plugs, startFrame, endFrame, mode):
+    previousMode = cmds.evaluationManager(query=True, mode=True)[0]
+    cmds.evaluationManager(mode=mode)
+    try:
+        # ** Playing Once First, So Graph Building and Caching Are Not Counted **
+        timeFrames(plugs, startFrame, endFrame)
+        frameTimes = sorted(timeFrames(plugs, startFrame, endFrame))
+    finally:
+        cmds.evaluationManager(mode=previousMode)
+    meanTime = sum(frameTimes) / len(frameTimes)
+    return {
+        'msPerFrame': meanTime * 1000.0,
+        'medianMs': frameTimes[len(frameTimes) // 2] * 1000.0,
+        'worstMs': frameTimes[-1] * 1000.0,
+        'fps': 1.0 / meanTime if meanTime else 0.0,
+    }
+
+
+# **** RUNNING BENCHMARKS ****
+
+
+# *** Building, Animating, and Timing the Characters of One Case ***
+def benchmarkCase(case, startFrame=1, endFrame=120, modes=None):
+    if modes is None:
+        modes = defaultModes
+
+    # ** Creating the Characters in an Empty Scene **
+    cmds.file(new=True, force=True)
+    characters = skeletonGenerator.createCrowd(case.get('count', 1), case.get('preset', 'Small'), seed=case.get('seed', 0))
+    for character in characters:
+        character['omit'] = case.get('omit', ())
+    bindJoints = []
+    for character in characters:
+        bindJoints += [character['rootJnt']] + (cmds.listRelatives(character['rootJnt'], allDescendents=True, type='joint') or [])
+    nodesBefore = len(cmds.ls())
+
+    # ** Building the Rigs **
+    start = timeit.default_timer()
+    registries = bipedAutoRig.buildRigs(characters)
+    buildTime = timeit.default_timer() - start
+
+    # ** Setting Level of Detail, Then Animating and Timing Playback **
+    keyCount = 0
+    for registry in registries:
+        cmds.setAttr(registry['nodes']['Master_Ctrl'] + '.LOD', case.get('lod', 0))
+        keyCount += animateRig(registry, startFrame, endFrame)
+    plugs = getWorldMatrixPlugs(bindJoints)
+    result = {
+        'label': case.get('label', 'Case'),
+        'characters': len(characters),
+        'bindJoints': len(bindJoints),
+        'rigNodes': len(cmds.ls()) - nodesBefore,
+        'keyedAttributes': keyCount,
+        'buildSeconds': buildTime,
+        'frames': int(endFrame) - int(startFrame) + 1,
+        'modes': {},
+    }
+    for mode in modes:
+        result['modes'][mode] = timePlayback(plugs, startFrame, endFrame, mode)
+    return result
+
+# *** Running Every Case and Saving the Report ***
+def runBenchmarks(cases=None, startFrame=1, endFrame=120, modes=None, reportPath=None):
+    if cases is None:
+        cases = defaultCases
+    results = [benchmarkCase(case, startFrame, endFrame, modes) for case in cases]
+    printReport(results)
+    if reportPath:
+        saveReport(results, reportPath)
+    return results
+
+
+# **** REPORTS ****
+
+
+# *** Printing a Table of Results ***
+def printReport(results):
+    print('%-10s %8s %8s %9s  %-10s %10s %10s %10s %8s' % ('Case', 'Joints', 'Nodes', 'Build s', 'Mode', 'ms/frame', 'median ms', 'worst ms', 'fps'))
+    for result in results:
+        for mode in sorted(result['modes']):
+            timing = result['modes'][mode]
+            print('%-10s %8d %8d %9.2f  %-10s %10.3f %10.3f %10.3f %8.1f' % (result['label'], result['bindJoints'], result['rigNodes'], result['buildSeconds'],
+                mode, timing['msPerFrame'], timing['medianMs'], timing['worstMs'], timing['fps']))
+
+# *** Saving Results with the Maya Version as JSON ***
+def saveReport(results, path):
+    report = {'mayaVersion': cmds.about(version=True), 'results': results}
+    with open(path, 'w') as reportFile:
+        json.dump(report, reportFile, indent=4, sort_keys=True)
+    return path
+
+# *** Comparing Playback Cost of a New Report Against an Earlier One ***
+def compareReports(basePath, newPath):
+    with open(basePath) as baseFile:
+        baseResults = dict((result['label'], result) for result in json.load(baseFile)['results'])
+    with open(newPath) as newFile:
+        newResults = json.load(newFile)['results']
+    changes = []
+    print('%-10s %-10s %10s %10s %9s' % ('Case', 'Mode', 'base ms', 'new ms', 'change'))
+    for result in newResults:
+        baseResult = baseResults.get(result['label'])
+        if not baseResult:
+            continue
+        for mode in sorted(result['modes']):
+            if mode not in baseResult['modes']:
+                continue
+            baseMs = baseResult['modes'][mode]['msPerFrame']
+            newMs = result['modes'][mode]['msPerFrame']
+            change = ((newMs - baseMs) / baseMs) * 100.0 if baseMs else 0.0
+            changes.append((result['label'], mode, baseMs, newMs, change))
+            print('%-10s %-10s %10.3f %10.3f %+8.1f%%' % (result['label'], mode, baseMs, newMs, change))
+    return changes
+
+
+# ***** RUNNING BENCHMARKS FROM MAYAPY *****
+
+if __name__ == '__main__':
+    import maya.standalone
+    maya.standalone.initialize()
+    reportPath = None
+    if len(sys.argv) > 1:
+        reportPath = sys.argv[1]
+    runBenchmarks(reportPath=reportPath)
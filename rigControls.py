@@ -0,0 +1,108 @@
+"""
+
+What Can This Program Do?
+- This program finds the controls of rigs from bipedAutoRig.py without searching the scene for names ending in _Ctrl.
+- Every rig registers its controls on its master controller, with the side, limb, build stage, and default values of each one.
+- Controls can be listed, selected, and keyed for a whole rig at once, or only for one side, limb, or stage.
+- Any node of a rig can be used to find the master controller of that rig, so tools work from the current selection.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import json
+
+from maya import cmds
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# **** FINDING RIGS ****
+
+
+# *** Getting the Master Controller of Every Rig in the Scene ***
+def findRigs():
+    return cmds.ls('*.controlInfo', objectsOnly=True, recursive=True) or []
+
+# *** Getting the Master Controller of the Rig a Node Belongs To ***
+def getMasterCtrl(node):
+    while node:
+        if cmds.attributeQuery('controlInfo', node=node, exists=True):
+            return node
+        parents = cmds.listRelatives(node, parent=True, fullPath=True)
+        node = parents[0] if parents else None
+    return None
+
+
+# **** QUERYING CONTROLS ****
+
+
+# *** Getting the Registry of a Rig, with the Current Name of Each Control ***
+def getControlInfo(masterCtrl):
+    infoList = json.loads(cmds.getAttr(masterCtrl + '.controlInfo'))
+    connections = cmds.listConnections(masterCtrl + '.controls', source=True, destination=False, connections=True) or []
+    controls = {}
+    for i in range(0, len(connections), 2):
+        index = int(connections[i].split('[')[-1].rstrip(']'))
+        info = dict(infoList[index])
+        info['node'] = connections[i + 1]
+        controls[info['name']] = info
+    return controls
+
+# *** Getting Controls of a Rig, Filtered by Side, Limb, or Stage ***
+def getControls(masterCtrl, side=None, limb=None, stage=None):
+    controls = []
+    for name, info in sorted(getControlInfo(masterCtrl).items()):
+        if side and info['side'] != side:
+            continue
+        if limb and info['limb'] != limb:
+            continue
+        if stage and info['stage'] != stage:
+            continue
+        controls.append(info['node'])
+    return controls
+
+# *** Getting a Control by Its Name Without the Rig Prefix ***
+def getControl(masterCtrl, name):
+    info = getControlInfo(masterCtrl).get(name)
+    return info['node'] if info else None
+
+
+# **** EDITING THE REGISTRY ****
+
+
+# *** Removing a Channel from the Registry of Every Rig a Control Belongs To, Before the Attribute Is Deleted ***
+def unregisterChannel(ctrl, attr):
+    removed = 0
+    for plug in cmds.listConnections(ctrl + '.message', source=False, destination=True, plugs=True) or []:
+        masterCtrl, controlsPlug = plug.split('.', 1)
+        if not controlsPlug.startswith('controls[') or not cmds.attributeQuery('controlInfo', node=masterCtrl, exists=True):
+            continue
+        infoList = json.loads(cmds.getAttr(masterCtrl + '.controlInfo'))
+        info = infoList[int(controlsPlug.split('[')[-1].rstrip(']'))]
+        if info['defaults'].pop(attr, None) is not None:
+            cmds.setAttr(masterCtrl + '.controlInfo', json.dumps(infoList, sort_keys=True), type='string')
+            removed += 1
+    return removed
+
+
+# **** WORKING ON CONTROLS ****
+
+
+# *** Selecting Controls of a Rig ***
+def selectControls(masterCtrl, side=None, limb=None, stage=None, add=False):
+    controls = getControls(masterCtrl, side, limb, stage)
+    cmds.select(controls, add=add, replace=not add)
+    return controls
+
+# *** Keying Every Channel of Controls of a Rig in One Call ***
+def keyControls(masterCtrl, side=None, limb=None, stage=None, time=None):
+    controls = getControls(masterCtrl, side, limb, stage)
+    if not controls:
+        return 0
+    if time is None:
+        time = cmds.currentTime(query=True)
+    return cmds.setKeyframe(controls, time=time)
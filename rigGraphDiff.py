@@ -0,0 +1,164 @@
+"""
+
+What Can This Program Do?
+- This program checks that bipedAutoRig.py builds the same rig under the Python 2 and Python 3 builds of mayapy.
+- It builds a synthetic character from skeletonGenerator.py in an empty scene and saves the node graph the rig builder made as JSON:
+    1. Every new node, by full path, with its type
+    2. Every connection between new nodes
+    3. The keyable values of every new node and the world matrix of every new transform
+- It compares two saved graphs and lists every node, connection, and value that differs.
+
+Notes for Running:
+- Running the script with mayapy as "rigGraphDiff.py capture graph.json [preset]" builds the rig and saves its graph.
+- Running it as "rigGraphDiff.py diff graphA.json graphB.json" prints the differences and exits with 1 if there are any.
+- Capture once with the Python 2 mayapy and once with the Python 3 mayapy, then diff the two files.
+- No pair of captures has been compared yet, so the Python 2 and Python 3 builds are not yet confirmed to match.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import json
+import sys
+
+from maya import cmds
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Largest Difference Between Two Values That Still Counts as the Same
+valueTolerance = 1e-4
+
+
+# **** CAPTURING THE NODE GRAPH ****
+
+
+# *** Getting the Keyable Values of a Node, Flattened to Floats ***
+def getNodeValues(node):
+    values = {}
+    for attr in cmds.listAttr(node, keyable=True, scalar=True) or []:
+        try:
+            value = cmds.getAttr(node + '.' + attr)
+        except (RuntimeError, ValueError):
+            continue
+        if isinstance(value, (bool, int, float)):
+            values[attr] = float(value)
+    if cmds.objectType(node, isAType='transform'):
+        values['worldMatrix'] = [float(value) for value in cmds.xform(node, query=True, matrix=True, worldSpace=True)]
+    return values
+
+# *** Capturing Every Node Created Since a List of Nodes, with Connections and Values ***
+def captureGraph(nodesBefore):
+    nodesBefore = set(nodesBefore)
+    nodes = [node for node in cmds.ls(long=True) if node not in nodesBefore]
+    nodeSet = set(nodes)
+    graph = {'nodes': {}, 'connections': []}
+    for node in nodes:
+        graph['nodes'][node] = {'type': cmds.nodeType(node), 'values': getNodeValues(node)}
+
+        # Keeping Only Connections Between Nodes of the Rig, in Both Directions Once
+        connections = cmds.listConnections(node, source=False, destination=True, connections=True, plugs=True) or []
+        for i in range(0, len(connections), 2):
+            destination = cmds.ls(connections[i + 1].split('.')[0], long=True)
+            if destination and destination[0] in nodeSet:
+                source = node + '.' + connections[i].split('.', 1)[1]
+                graph['connections'].append(source + ' -> ' + destination[0] + '.' + connections[i + 1].split('.', 1)[1])
+    graph['connections'].sort()
+    return graph
+
+# *** Building a Synthetic Character's Rig in an Empty Scene and Capturing What the Build Created ***
+def captureRigGraph(preset='Small'):
+    import bipedAutoRig
+    import skeletonGenerator
+    cmds.file(new=True, force=True)
+    character = skeletonGenerator.createPresetCharacter(preset)
+    nodesBefore = cmds.ls(long=True)
+    bipedAutoRig.buildRig(verify=False, **character)
+    graph = captureGraph(nodesBefore)
+    graph['mayaVersion'] = cmds.about(version=True)
+    graph['python'] = sys.version.split()[0]
+    return graph
+
+
+# **** SAVING AND COMPARING GRAPHS ****
+
+
+# *** Saving a Graph as JSON ***
+def saveGraph(graph, path):
+    with open(path, 'w') as graphFile:
+        json.dump(graph, graphFile, indent=1, sort_keys=True)
+    return path
+
+# *** Loading a Graph from JSON ***
+def loadGraph(path):
+    with open(path) as graphFile:
+        return json.load(graphFile)
+
+# *** Checking Two Values, or Two Lists of Values, Are the Same Within the Tolerance ***
+def isSameValue(valueA, valueB, tolerance):
+    if isinstance(valueA, list) or isinstance(valueB, list):
+        if not isinstance(valueA, list) or not isinstance(valueB, list) or len(valueA) != len(valueB):
+            return False
+        return all([abs(a - b) <= tolerance for a, b in zip(valueA, valueB)])
+    return abs(valueA - valueB) <= tolerance
+
+# *** Listing Every Node, Connection, and Value That Differs Between Two Graphs ***
+def diffGraphs(graphA, graphB, tolerance=valueTolerance):
+    differences = []
+    nodesA = graphA['nodes']
+    nodesB = graphB['nodes']
+    for node in sorted(set(nodesA) - set(nodesB)):
+        differences.append('Only in A: ' + node)
+    for node in sorted(set(nodesB) - set(nodesA)):
+        differences.append('Only in B: ' + node)
+
+    # ** Comparing Types and Values of Nodes Both Graphs Have **
+    for node in sorted(set(nodesA) & set(nodesB)):
+        if nodesA[node]['type'] != nodesB[node]['type']:
+            differences.append('Type of ' + node + ': ' + nodesA[node]['type'] + ' != ' + nodesB[node]['type'])
+            continue
+        valuesA = nodesA[node]['values']
+        valuesB = nodesB[node]['values']
+        for attr in sorted(set(valuesA) | set(valuesB)):
+            if attr not in valuesA or attr not in valuesB:
+                differences.append('Only one graph has ' + node + '.' + attr)
+            elif not isSameValue(valuesA[attr], valuesB[attr], tolerance):
+                differences.append('Value of ' + node + '.' + attr + ': ' + str(valuesA[attr]) + ' != ' + str(valuesB[attr]))
+
+    # ** Comparing Connections **
+    connectionsA = set(graphA['connections'])
+    connectionsB = set(graphB['connections'])
+    for connection in sorted(connectionsA - connectionsB):
+        differences.append('Connection only in A: ' + connection)
+    for connection in sorted(connectionsB - connectionsA):
+        differences.append('Connection only in B: ' + connection)
+    return differences
+
+# *** Comparing Two Saved Graphs and Printing the Differences ***
+def diffGraphFiles(pathA, pathB, tolerance=valueTolerance):
+    graphA = loadGraph(pathA)
+    graphB = loadGraph(pathB)
+    differences = diffGraphs(graphA, graphB, tolerance)
+    print('A: Python ' + str(graphA.get('python')) + ', ' + str(len(graphA['nodes'])) + ' nodes, ' + str(len(graphA['connections'])) + ' connections')
+    print('B: Python ' + str(graphB.get('python')) + ', ' + str(len(graphB['nodes'])) + ' nodes, ' + str(len(graphB['connections'])) + ' connections')
+    for difference in differences:
+        print(difference)
+    print(str(len(differences)) + ' differences')
+    return differences
+
+
+# ***** CAPTURING OR COMPARING GRAPHS FROM MAYAPY *****
+
+if __name__ == '__main__':
+    if len(sys.argv) > 3 and sys.argv[1] == 'diff':
+        sys.exit(1 if diffGraphFiles(sys.argv[2], sys.argv[3]) else 0)
+    elif len(sys.argv) > 2 and sys.argv[1] == 'capture':
+        import maya.standalone
+        maya.standalone.initialize()
+        saveGraph(captureRigGraph(sys.argv[3] if len(sys.argv) > 3 else 'Small'), sys.argv[2])
+    else:
+        print('Usage: mayapy rigGraphDiff.py capture graph.json [preset] | diff graphA.json graphB.json')
+        sys.exit(2)
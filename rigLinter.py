@@ -0,0 +1,221 @@
+"""
+
+What Can This Program Do?
+- This program reports how many nodes a rig from bipedAutoRig.py creates, by node type and by build stage.
+- It flags nodes and attributes that cost evaluation time and file size without changing the rig:
+    1. Constraint targets whose weight is always 0
+    2. Utility nodes and animation curves whose output drives nothing
+    3. Helper joints that no constraint, IK handle, or other node reads
+    4. Control attributes that drive nothing, like Head_Aim
+- It can prune everything it flags, repeating until nothing new becomes dead.
+- Pruned control attributes are also removed from the control registry on the master controller.
+- It takes the registry returned by bipedAutoRig.buildRig() to know which nodes belong to the rig and which stage created them.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+from maya import cmds
+
+import rigControls
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Constraint Types and Their Commands
+constraintCommands = {
+    'parentConstraint': cmds.parentConstraint,
+    'orientConstraint': cmds.orientConstraint,
+    'pointConstraint': cmds.pointConstraint,
+    'scaleConstraint': cmds.scaleConstraint,
+    'aimConstraint': cmds.aimConstraint,
+}
+
+# Build Stages in the Order bipedAutoRig.buildRig() Runs Them
+stageOrder = ['Locators', 'Spine', 'Neck', 'Arms', 'Legs', 'Skin', 'Final', 'Verify']
+
+# Node Types That Only Exist to Feed Other Nodes
+utilityTypes = ['multiplyDivide', 'plusMinusAverage', 'condition', 'reverse', 'blendColors', 'unitConversion',
+    'animCurveUA', 'animCurveUL', 'animCurveUU', 'animCurveUT', 'animCurveTA', 'animCurveTL', 'animCurveTU']
+
+
+# **** COUNTING NODES ****
+
+
+# *** Getting the Names of Every Node the Rig Created, by Stage ***
+def getStageNodes(registry):
+    stageNodes = {}
+    for stage, uuids in registry['stages'].items():
+        stageNodes[stage] = cmds.ls(uuids, long=True) if uuids else []
+    return stageNodes
+
+# *** Getting the Names of Every Node the Rig Created ***
+def getRigNodes(registry):
+    rigNodes = []
+    for nodes in getStageNodes(registry).values():
+        rigNodes += nodes
+    return rigNodes
+
+# *** Counting Nodes by Type ***
+def countNodeTypes(nodes):
+    counts = {}
+    for node in nodes:
+        nodeType = cmds.nodeType(node)
+        counts[nodeType] = counts.get(nodeType, 0) + 1
+    return counts
+
+# *** Counting Nodes by Type for the Whole Rig and Each Stage ***
+def getNodeBudget(registry):
+    stageNodes = getStageNodes(registry)
+    budget = {'total': {}, 'stages': {}}
+    for stage, nodes in stageNodes.items():
+        budget['stages'][stage] = countNodeTypes(nodes)
+        for nodeType, count in budget['stages'][stage].items():
+            budget['total'][nodeType] = budget['total'].get(nodeType, 0) + count
+    return budget
+
+
+# **** FINDING DEAD NODES ****
+
+
+# *** Checking Whether an Attribute Is Always 0, Static or Driven by Curves That Stay at 0 ***
+def isAlwaysZero(plug):
+    sources = cmds.listConnections(plug, source=True, destination=False, skipConversionNodes=True) or []
+    if not sources:
+        return abs(cmds.getAttr(plug)) < 1e-6
+    for source in sources:
+        if not cmds.nodeType(source).startswith('animCurve'):
+            return False
+        values = cmds.keyframe(source, query=True, valueChange=True) or []
+        if [value for value in values if abs(value) > 1e-6]:
+            return False
+    return True
+
+# *** Finding Constraint Targets Whose Weight Is Always 0 ***
+def findZeroWeightTargets(rigNodes):
+    zeroTargets = []
+    for node in rigNodes:
+        nodeType = cmds.nodeType(node)
+        if nodeType not in constraintCommands:
+            continue
+        constraintCmd = constraintCommands[nodeType]
+        targets = constraintCmd(node, query=True, targetList=True) or []
+        weights = constraintCmd(node, query=True, weightAliasList=True) or []
+        for target, weight in zip(targets, weights):
+            if isAlwaysZero(node + '.' + weight):
+                zeroTargets.append((node, target))
+    return zeroTargets
+
+# *** Getting Outgoing Connections, Ignoring Joint Hierarchy Scale Compensation ***
+def getOutputs(node):
+    connections = cmds.listConnections(node, source=False, destination=True, connections=True, plugs=True) or []
+    outputs = []
+    for i in range(0, len(connections), 2):
+        if connections[i + 1].endswith('.inverseScale'):
+            continue
+        outputs.append(connections[i + 1])
+    return outputs
+
+# *** Finding Utility Nodes and Curves Whose Output Drives Nothing ***
+def findDeadUtilityNodes(rigNodes):
+    return [node for node in rigNodes if cmds.nodeType(node) in utilityTypes and not getOutputs(node)]
+
+# *** Finding Helper Joints That Nothing Reads, Along with Everything Below Them ***
+def findDeadHelperJoints(rigNodes):
+    rigJoints = set(cmds.ls(rigNodes, type='joint', long=True))
+    deadJoints = []
+    for jnt in rigJoints:
+        descendants = cmds.listRelatives(jnt, allDescendents=True, fullPath=True) or []
+        if [child for child in descendants if cmds.nodeType(child) != 'joint' or child not in rigJoints]:
+            continue
+        if [node for node in [jnt] + descendants if getOutputs(node)]:
+            continue
+        deadJoints.append(jnt)
+
+    # ** Keeping Only the Top of Each Dead Hierarchy **
+    deadSet = set(deadJoints)
+    return [jnt for jnt in deadJoints if not [parent for parent in deadSet if jnt.startswith(parent + '|')]]
+
+# *** Finding Control Attributes That Drive Nothing ***
+def findDeadAttributes(rigNodes):
+    deadAttrs = []
+    for node in cmds.ls(rigNodes, transforms=True, long=True):
+        for attr in cmds.listAttr(node, userDefined=True, keyable=True) or []:
+            # Skipping Divider Attributes That Only Separate Others in the Channel Box
+            if not attr.strip('_'):
+                continue
+            if not cmds.listConnections(node + '.' + attr, source=False, destination=True):
+                deadAttrs.append(node + '.' + attr)
+    return deadAttrs
+
+# *** Linting a Rig for Every Kind of Dead Node ***
+def lintRig(registry):
+    rigNodes = getRigNodes(registry)
+    return {
+        'zeroWeightTargets': findZeroWeightTargets(rigNodes),
+        'deadUtilityNodes': findDeadUtilityNodes(rigNodes),
+        'deadHelperJoints': findDeadHelperJoints(rigNodes),
+        'deadAttributes': findDeadAttributes(rigNodes),
+    }
+
+
+# **** PRUNING ****
+
+
+# *** Removing Everything a Lint Found ***
+def pruneLintResults(results):
+    removed = 0
+    for constraint, target in results['zeroWeightTargets']:
+        if cmds.objExists(constraint) and cmds.objExists(target):
+            constraintCommands[cmds.nodeType(constraint)](target, constraint, edit=True, remove=True)
+            removed += 1
+    for node in results['deadUtilityNodes'] + results['deadHelperJoints']:
+        if cmds.objExists(node):
+            cmds.delete(node)
+            removed += 1
+    for attr in results['deadAttributes']:
+        if cmds.objExists(attr):
+            # Taking the Channel Out of the Control Registry, So Pose and Animation Tools Stop Reading It
+            node, attrName = attr.rsplit('.', 1)
+            rigControls.unregisterChannel(node, attrName)
+            cmds.deleteAttr(attr)
+            removed += 1
+    return removed
+
+# *** Pruning a Rig Until No Dead Nodes Are Left ***
+def pruneRig(registry, maxPasses=10):
+    removed = 0
+    for i in range(0, maxPasses):
+        passRemoved = pruneLintResults(lintRig(registry))
+        removed += passRemoved
+        if not passRemoved:
+            break
+    return removed
+
+
+# **** REPORTS ****
+
+
+# *** Printing Node Counts and Lint Results ***
+def printRigReport(registry):
+    budget = getNodeBudget(registry)
+    print('Node Count by Type:')
+    for nodeType in sorted(budget['total'], key=lambda name: -budget['total'][name]):
+        print('    %-24s %6d' % (nodeType, budget['total'][nodeType]))
+    print('Node Count by Stage:')
+    for stage in [stage for stage in stageOrder if stage in budget['stages']]:
+        print('    %-24s %6d' % (stage, sum(budget['stages'][stage].values())))
+    results = lintRig(registry)
+    print('Dead Nodes:')
+    for constraint, target in results['zeroWeightTargets']:
+        print('    Zero weight target: ' + target + ' on ' + constraint)
+    for node in results['deadUtilityNodes']:
+        print('    Unused utility node: ' + node)
+    for node in results['deadHelperJoints']:
+        print('    Unused helper joints: ' + node)
+    for attr in results['deadAttributes']:
+        print('    Unused attribute: ' + attr)
+    return budget, results
@@ -0,0 +1,164 @@
+"""
+
+What Can This Program Do?
+- This program checks that a character meets every assumption bipedAutoRig.py makes before building a rig, and lists what is wrong.
+- It checks for:
+    1. A root joint with a spine child and a pelvis child
+    2. A chest at the end of the spine holding the neck and both clavicles
+    3. A neck with at least a neck and a head joint
+    4. Arms of 11 joints and a hand below each clavicle end
+    5. Legs of 9 joints and a foot, ball, and toe below the pelvis on each side
+    6. A spine curve with enough CVs, a mesh, and the foot locators, unless they are placed from the mesh
+- It works on a plain skeleton description, so the same checks run in Maya through bipedAutoRig.getSkeleton() and without Maya through maSkeleton.py.
+
+Notes for the Skeleton Description:
+- joints maps each joint name to its parent name (None at the top), the list of its child joint names in order, and its translate and jointOrient when known.
+- curves maps each curve transform name to its CV count, and locators and meshes list transform names.
+
+"""
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Joints the Builder Expects in a Row: 11 Arm Joints, Then a Hand
+armJoints = 11
+armJointCount = armJoints + 1
+
+# Joints the Builder Expects in a Row: 9 Leg Joints, Then a Foot, Ball, and Toe
+legJoints = 9
+legJointCount = legJoints + 3
+
+# Fewest CVs a Spine Curve Needs for a Cubic Spline IK
+minSpineCVs = 4
+
+# Foot Locators the Builder Needs on the Left Side When They Are Not Placed from the Mesh
+footLocators = ['Ball', 'Heel', 'TippyToe', 'OuterToes', 'InnerToes']
+
+
+# **** READING THE SKELETON ****
+
+
+# *** Starting an Empty Skeleton Description ***
+def newSkeleton():
+    return {'joints': {}, 'curves': {}, 'locators': [], 'meshes': []}
+
+# *** Adding a Joint to a Skeleton Description Under Its Parent ***
+def addJoint(skeleton, name, parent=None):
+    joints = skeleton['joints']
+    if name not in joints:
+        joints[name] = {'parent': None, 'children': []}
+    joints[name]['parent'] = parent
+    if parent is not None:
+        if parent not in joints:
+            joints[parent] = {'parent': None, 'children': []}
+        joints[parent]['children'].append(name)
+
+# *** Stripping Namespaces and Paths from a Node Name ***
+def shortName(node):
+    return node.split('|')[-1].split(':')[-1]
+
+# *** Getting Child Joints Whose Short Name Contains Any of Some Words ***
+def findChildren(skeleton, jnt, words):
+    return [child for child in skeleton['joints'][jnt]['children'] if [word for word in words if word in shortName(child)]]
+
+# *** Walking Down a Joint Chain Until It Branches or Ends ***
+def getJointChain(skeleton, topJnt):
+    chain = [topJnt]
+    while len(skeleton['joints'][chain[-1]]['children']) == 1:
+        chain.append(skeleton['joints'][chain[-1]]['children'][0])
+    return chain
+
+# *** Finding the Root Joint, the Top Joint That Holds the Spine and Pelvis ***
+def findRoot(skeleton):
+    for name, jnt in sorted(skeleton['joints'].items()):
+        if jnt['parent'] is None and findChildren(skeleton, name, ['Spine', 'spine']) and findChildren(skeleton, name, ['Pelvis', 'pelvis']):
+            return name
+    return None
+
+# *** Finding the Spine Curve, the Curve Named for the Spine ***
+def findSpineCurve(skeleton):
+    for name in sorted(skeleton['curves']):
+        if 'Spine' in shortName(name) or 'spine' in shortName(name):
+            return name
+    return None
+
+
+# **** VALIDATING ****
+
+
+# *** Checking a Limb Chain Is Long Enough, and Ends Without Branching When Its End Joints Are Read from the Tip ***
+def checkLimb(skeleton, topJnt, label, count, problems, branches=True):
+    chain = getJointChain(skeleton, topJnt)
+    if len(chain) < count:
+        problems.append('%s has %d joints in a row from %s, but needs %d.' % (label, len(chain), topJnt, count))
+    elif not branches and skeleton['joints'][chain[-1]]['children']:
+        problems.append('%s branches at %s, but needs to end in a single toe joint.' % (label, chain[-1]))
+
+# *** Listing Every Problem That Would Stop a Rig Building on a Skeleton ***
+def validateSkeleton(skeleton, rootJnt=None, spineCurve=None, prefix='', placeFootPivots=False):
+    problems = []
+
+    # ** Checking the Root, Spine, and Pelvis **
+    if rootJnt is None:
+        rootJnt = findRoot(skeleton)
+    if rootJnt is None or rootJnt not in skeleton['joints']:
+        return ['No root joint with a Spine child and a Pelvis child was found.']
+    spineJnts = findChildren(skeleton, rootJnt, ['Spine', 'spine'])
+    pelvisJnts = findChildren(skeleton, rootJnt, ['Pelvis', 'pelvis'])
+    if len(spineJnts) != 1:
+        problems.append('The root joint %s needs exactly one Spine child, but has %d.' % (rootJnt, len(spineJnts)))
+    if len(pelvisJnts) != 1 or len(skeleton['joints'][rootJnt]['children']) != 2:
+        problems.append('The root joint %s needs only a Spine child and a Pelvis child.' % rootJnt)
+
+    # ** Checking the Chest Holds the Neck and Clavicles **
+    if spineJnts:
+        chestJnt = getJointChain(skeleton, spineJnts[0])[-1]
+        neckJnts = findChildren(skeleton, chestJnt, ['Neck', 'neck'])
+        clavicleJnts = findChildren(skeleton, chestJnt, ['Clavicle', 'clavicle'])
+        if not neckJnts:
+            problems.append('The chest joint %s has no Neck child.' % chestJnt)
+        elif len(getJointChain(skeleton, neckJnts[-1])) < 2:
+            problems.append('The neck %s needs at least a neck and a head joint.' % neckJnts[-1])
+        for side in 'LR':
+            sideClavicles = [jnt for jnt in clavicleJnts if side in shortName(jnt)]
+            if not sideClavicles:
+                problems.append('The chest joint %s has no %s Clavicle child.' % (chestJnt, side))
+                continue
+
+            # Arms Start Below the Clavicle End
+            clavicleEnd = skeleton['joints'][sideClavicles[-1]]['children']
+            armTop = skeleton['joints'][clavicleEnd[0]]['children'] if clavicleEnd else []
+            if not armTop:
+                problems.append('The %s clavicle %s needs a clavicle end joint with the arm below it.' % (side, sideClavicles[-1]))
+            else:
+                checkLimb(skeleton, armTop[0], 'The ' + side + ' arm', armJointCount, problems)
+
+    # ** Checking Both Legs **
+    if pelvisJnts:
+        for side in 'LR':
+            legJnts = [jnt for jnt in skeleton['joints'][pelvisJnts[0]]['children'] if side + '_' in shortName(jnt)]
+            if not legJnts:
+                problems.append('The pelvis %s has no %s_ leg child.' % (pelvisJnts[0], side))
+            else:
+                checkLimb(skeleton, legJnts[-1], 'The ' + side + ' leg', legJointCount, problems, branches=False)
+
+    # ** Checking the Spine Curve **
+    if spineCurve is None:
+        spineCurve = findSpineCurve(skeleton)
+    if spineCurve is None or spineCurve not in skeleton['curves']:
+        problems.append('No spine curve was found.')
+    elif skeleton['curves'][spineCurve] < minSpineCVs:
+        problems.append('The spine curve %s has %d CVs, but needs at least %d.' % (spineCurve, skeleton['curves'][spineCurve], minSpineCVs))
+
+    # ** Checking the Mesh **
+    if not skeleton['meshes']:
+        problems.append('No mesh was found.')
+
+    # ** Checking the Foot Locators **
+    if not placeFootPivots:
+        locators = set([shortName(loc) for loc in skeleton['locators']])
+        for preset in footLocators:
+            if prefix + 'L_' + preset + 'Loc' not in locators:
+                problems.append('The foot locator %sL_%sLoc is missing.' % (prefix, preset))
+    return problems
@@ -0,0 +1,270 @@
+"""
+
+What Can This Program Do?
+- This program creates synthetic biped characters that bipedAutoRig.py can rig without any hand-built fixtures.
+- Each character has a bind skeleton, a spine curve, a body mesh, and the left foot locators the auto rig expects.
+- The height of the character, the number of spine joints, neck joints, spine curve CVs, fingers, and knuckles, and the density of the mesh can all be changed.
+- Presets cover characters from small to huge, and createCrowd() lays out any number of characters on a grid for crowd scenes.
+- The bind skeleton of a named character is created in a namespace of that name, and its rig nodes use the name as their prefix.
+- createCharacter() returns buildRig keyword arguments, so bipedAutoRig.buildRig(**character) or bipedAutoRig.buildRigs(crowd) rigs the new characters.
+- Crowds can vary their proportions from a seed, so the same seed always creates the same scene.
+
+Notes for Running:
+- The generator works in an interactive Maya session and in mayapy.
+- Running the script with mayapy creates a crowd and saves it to the .ma file given as the first argument, followed by an optional preset name and character count.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+import random
+import sys
+
+from maya import cmds
+
+import bipedAutoRig
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# Finger Names, with Any Extra Fingers Named After Letters
+fingerNames = ['Thumb', 'Index', 'Middle', 'Ring', 'Pinky']
+
+# Height the Joint Positions Below Are Laid Out For
+baseHeight = 175.0
+
+# Character Presets, Given as createCharacter Keyword Arguments
+characterPresets = {
+    'Small': {'spineJoints': 5, 'neckJoints': 3, 'fingerCount': 5, 'knuckleCount': 4},
+    'Medium': {'spineJoints': 9, 'neckJoints': 5, 'fingerCount': 5, 'knuckleCount': 5, 'meshDivisions': 4},
+    'Large': {'spineJoints': 17, 'neckJoints': 9, 'fingerCount': 8, 'knuckleCount': 6, 'spineCVs': 12, 'meshDivisions': 8},
+    'Huge': {'spineJoints': 41, 'neckJoints': 17, 'fingerCount': 20, 'knuckleCount': 8, 'spineCVs': 24, 'meshDivisions': 16},
+}
+
+
+# **** POSITIONS AND NAMES ****
+
+
+# *** Getting the Name of a Finger from Its Index ***
+def getFingerBaseName(index):
+    if index < len(fingerNames):
+        return fingerNames[index]
+
+    # ** Naming Extra Fingers ExtraA to ExtraZ, Then ExtraAA and Onward **
+    index -= len(fingerNames)
+    letters = ''
+    while True:
+        letters = chr(65 + (index % 26)) + letters
+        index = (index // 26) - 1
+        if index < 0:
+            break
+    return 'Extra' + letters
+
+# *** Blending Between Two Positions ***
+def lerpPosition(start, end, amount):
+    return [start[i] + ((end[i] - start[i]) * amount) for i in range(0, 3)]
+
+# *** Getting Evenly Spaced Positions Between Two Points ***
+def getPositions(start, end, count):
+    if count == 1:
+        return [list(start)]
+    return [lerpPosition(start, end, float(i) / (count - 1)) for i in range(0, count)]
+
+# *** Making a Function That Scales, Mirrors, and Offsets Layout Positions ***
+def getPlacer(offset, scale, mirror=1):
+    def place(x, y, z):
+        return [(x * mirror * scale) + offset[0], (y * scale) + offset[1], (z * scale) + offset[2]]
+    return place
+
+
+# **** SKELETON ****
+
+
+# *** Creating and Orienting a Joint Chain Through Positions ***
+def createJointChain(names, positions, parent=None):
+    cmds.select(clear=True)
+    if parent:
+        cmds.select(parent)
+    chain = []
+    for name, pos in zip(names, positions):
+        chain.append(cmds.joint(p=pos, name=name))
+    cmds.joint(chain[0], edit=True, orientJoint='xyz', secondaryAxisOrient='yup', children=True, zeroScaleOrient=True)
+    cmds.select(clear=True)
+    return chain
+
+# *** Creating the Arm and Hand of One Side ***
+def createArm(namespace, side, chestJnt, place, fingerCount, knuckleCount):
+
+    # ** Creating Clavicle **
+    clavicle = createJointChain([namespace + side + '_Clavicle_jB', namespace + side + '_ClavicleEnd_jB'], [place(3, 145, 0), place(15, 147, -2)], chestJnt)
+
+    # ** Creating 11 Arm Joints, Elbow at Index 5 and Wrist at Index 10, Then the Hand **
+    shoulder = place(18, 147, -2)
+    elbow = place(45, 147, -4)
+    wrist = place(70, 147, -2)
+    armPositions = getPositions(shoulder, elbow, 6) + getPositions(elbow, wrist, 6)[1:] + [place(73, 147, -2)]
+    armNames = [namespace + side + '_Arm_' + str(i + 1) + '_jB' for i in range(0, 11)] + [namespace + side + '_Hand_jB']
+    armChain = createJointChain(armNames, armPositions, clavicle[-1])
+
+    # ** Creating Fingers Spread Across the Hand, Thumb First and One Knuckle Shorter **
+    for fingerIndex in range(0, fingerCount):
+        knuckles = knuckleCount
+        fingerZ = 4.0
+        if fingerCount > 1:
+            fingerZ = 4.0 - (8.0 * fingerIndex / (fingerCount - 1))
+        fingerY = 146
+        if fingerIndex == 0:
+            knuckles = max(2, knuckleCount - 1)
+            fingerY = 143
+        names = [namespace + side + '_' + getFingerBaseName(fingerIndex) + str(i + 1) + '_jB' for i in range(0, knuckles)]
+        positions = getPositions(place(76, fingerY, fingerZ), place(76 + (2.5 * knuckles), fingerY, fingerZ), knuckles)
+        createJointChain(names, positions, armChain[-1])
+    return clavicle[0]
+
+# *** Creating the Leg and Foot of One Side ***
+def createLeg(namespace, side, pelvisJnt, place):
+
+    # ** Creating 9 Leg Joints, Knee at Index 4 and Ankle at Index 8, Then Foot, Ball, and Toe **
+    hip = place(10, 92, 0)
+    knee = place(10, 50, 3)
+    ankle = place(10, 10, 0)
+    legPositions = getPositions(hip, knee, 5) + getPositions(knee, ankle, 5)[1:]
+    legPositions += [place(10, 6, 3), place(10, 2, 12), place(10, 2, 18)]
+    legNames = [namespace + side + '_Leg_' + str(i + 1) + '_jB' for i in range(0, 9)]
+    legNames += [namespace + side + '_Foot_jB', namespace + side + '_Ball_jB', namespace + side + '_Toe_jB']
+    legChain = createJointChain(legNames, legPositions, pelvisJnt)
+    return legChain[0]
+
+# *** Creating the Left Foot Locators Around the Foot ***
+def createFootLocators(prefix, place):
+    locators = bipedAutoRig.createFootLocators(prefix)
+    positions = {'Ball': (10, 2, 12), 'Heel': (10, 0, -4), 'TippyToe': (10, 0, 20), 'OuterToes': (15, 0, 12), 'InnerToes': (5, 0, 12)}
+    for preset, loc in zip(['Ball', 'Heel', 'TippyToe', 'OuterToes', 'InnerToes'], locators):
+        cmds.xform(loc, worldSpace=True, translation=place(*positions[preset]))
+    return locators
+
+
+# **** MESH ****
+
+
+# *** Creating One Box of the Body Between Two Corners ***
+def createBodyBox(place, corner1, corner2, divisions):
+    low = place(*corner1)
+    high = place(*corner2)
+    size = [abs(high[i] - low[i]) for i in range(0, 3)]
+    box = cmds.polyCube(width=size[0], height=size[1], depth=size[2], subdivisionsX=divisions, subdivisionsY=divisions, subdivisionsZ=divisions, constructionHistory=False)[0]
+    cmds.xform(box, worldSpace=True, translation=lerpPosition(low, high, 0.5))
+    return box
+
+# *** Creating a Blocky Body Mesh Around the Skeleton ***
+def createBodyMesh(name, offset, scale, divisions=1):
+    place = getPlacer(offset, scale)
+
+    # ** Creating Torso and Head **
+    boxes = [createBodyBox(place, (-16, 88, -10), (16, 150, 10), divisions)]
+    boxes.append(createBodyBox(place, (-9, 150, -10), (9, baseHeight, 10), divisions))
+
+    # ** Creating Arms, Hands, Legs, and Feet of Both Sides **
+    for mirror in [1, -1]:
+        sidePlace = getPlacer(offset, scale, mirror)
+        boxes.append(createBodyBox(sidePlace, (16, 142, -8), (72, 152, 4), divisions))
+        boxes.append(createBodyBox(sidePlace, (72, 141, -6), (96, 150, 6), divisions))
+        boxes.append(createBodyBox(sidePlace, (4, 8, -6), (16, 92, 8), divisions))
+        boxes.append(createBodyBox(sidePlace, (4, 0, -5), (16, 8, 21), divisions))
+
+    # ** Combining Boxes into One Mesh Without History **
+    mesh = cmds.polyUnite(boxes, constructionHistory=False, name=name)[0]
+    cmds.delete(mesh, constructionHistory=True)
+    return mesh
+
+
+# **** CHARACTERS ****
+
+
+# *** Creating a Full Synthetic Character Ready to Rig ***
+def createCharacter(name='', spineJoints=5, neckJoints=3, fingerCount=5, knuckleCount=4, spineCVs=7, height=baseHeight, meshDivisions=1, offset=(0, 0, 0)):
+
+    # ** Putting the Bind Skeleton in the Character's Namespace **
+    namespace = ''
+    prefix = ''
+    if name:
+        if not cmds.namespace(exists=':' + name):
+            cmds.namespace(add=name, parent=':')
+        namespace = name + ':'
+        prefix = name + '_'
+    scale = float(height) / baseHeight
+    place = getPlacer(offset, scale)
+
+    # ** Creating Root, Pelvis, and Spine **
+    rootJnt = createJointChain([namespace + 'Root_jB'], [place(0, 100, 0)])[0]
+    pelvisJnt = createJointChain([namespace + 'Pelvis_jB'], [place(0, 95, 0)], rootJnt)[0]
+    spineStart = place(0, 105, 0)
+    chestPos = place(0, 140, 0)
+    spineNames = [namespace + 'Spine_' + str(i + 1) + '_jB' for i in range(0, spineJoints - 1)] + [namespace + 'Chest_jB']
+    spineChain = createJointChain(spineNames, getPositions(spineStart, chestPos, spineJoints), rootJnt)
+    chestJnt = spineChain[-1]
+
+    # ** Creating Neck and Head **
+    neckNames = [namespace + 'Neck_' + str(i + 1) + '_jB' for i in range(0, neckJoints - 1)] + [namespace + 'Head_jB']
+    createJointChain(neckNames, getPositions(place(0, 150, 0), place(0, 165, 0), neckJoints), chestJnt)
+
+    # ** Creating Arms and Legs **
+    for side, mirror in [('L', 1), ('R', -1)]:
+        sidePlace = getPlacer(offset, scale, mirror)
+        createArm(namespace, side, chestJnt, sidePlace, fingerCount, knuckleCount)
+        createLeg(namespace, side, pelvisJnt, sidePlace)
+
+    # ** Creating Spine Curve from the Spine Base to the Chest **
+    spineCurve = cmds.curve(degree=3, point=getPositions(spineStart, chestPos, spineCVs), name=namespace + 'Spine_Curve')
+
+    # ** Creating the Body Mesh **
+    mesh = createBodyMesh(namespace + 'Body_Geo', offset, scale, meshDivisions)
+
+    # ** Creating Foot Locators for the Character's Rig Prefix **
+    createFootLocators(prefix, place)
+
+    # ** Returning Keyword Arguments for bipedAutoRig.buildRig **
+    rigName = 'Biped_Rig'
+    if name:
+        rigName = name + '_Rig'
+    return {'rootJnt': rootJnt, 'spineCurve': spineCurve, 'mesh': mesh, 'rigName': rigName, 'prefix': prefix}
+
+# *** Creating a Character from a Preset ***
+def createPresetCharacter(preset='Small', **kwargs):
+    characterArgs = dict(characterPresets[preset])
+    characterArgs.update(kwargs)
+    return createCharacter(**characterArgs)
+
+# *** Laying Out Many Characters on a Grid ***
+def createCrowd(count, preset='Small', spacing=250.0, columns=10, seed=0, heightVariation=0.0, namePrefix='char'):
+
+    # ** Using One Seeded Generator So the Same Seed Creates the Same Crowd **
+    generator = random.Random(seed)
+    characters = []
+    for i in range(0, count):
+        offset = ((i % columns) * spacing, 0, (i // columns) * spacing)
+        height = baseHeight * (1.0 + generator.uniform(-heightVariation, heightVariation))
+        name = namePrefix + str(i + 1).zfill(len(str(count)))
+        characters.append(createPresetCharacter(preset, name=name, height=height, offset=offset))
+    return characters
+
+
+# ***** CREATING A CROWD SCENE FROM MAYAPY *****
+
+if __name__ == '__main__':
+    import maya.standalone
+    maya.standalone.initialize()
+    scenePath = sys.argv[1]
+    preset = 'Small'
+    count = 1
+    if len(sys.argv) > 2:
+        preset = sys.argv[2]
+    if len(sys.argv) > 3:
+        count = int(sys.argv[3])
+    cmds.file(new=True, force=True)
+    createCrowd(count, preset)
+    cmds.file(rename=scenePath)
+    cmds.file(save=True, type='mayaAscii')
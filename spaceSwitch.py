@@ -0,0 +1,80 @@
+"""
+
+What Can This Program Do?
+- This program switches the space of controls built by bipedAutoRig.py without the control popping.
+- The IK wrist and ankle controls and the head aim control have a Space attribute picking what they follow: the world, root, chest, head, or pelvis.
+- Switching keys the Space attribute and keys the control so it stays where it was in the world, on one frame or over a frame range.
+- Every frame is sampled through the dependency graph without changing the current time, and each channel gets all of its keys in one curve edit.
+
+Notes for Use:
+- switchAndBake('L_IK_Wrist_Ctrl', 'Chest', 1, 120) keeps the left IK wrist where it was from frame 1 to 120, while following the chest.
+- switchAndBakeAll(masterCtrl, 'World', 1, 120) does every control of a rig with a Space attribute.
+
+"""
+
+
+# ***** IMPORTING MODULES *****
+
+
+from maya import cmds
+import maya.api.OpenMaya as om
+
+import ikfkMatch
+import rigControls
+
+
+# ***** FUNCTION DEFINITIONS *****
+
+
+# *** Getting the Offset Group and the Target Node of Every Space of a Control ***
+def getSpaceTargets(ctrl):
+    grp = cmds.listRelatives(ctrl, parent=True, fullPath=True)[0]
+    for choice in cmds.listConnections(ctrl + '.Space', source=False, destination=True, type='choice') or []:
+        count = len(cmds.getAttr(choice + '.input', multiIndices=True) or [])
+        targets = [(cmds.listConnections(choice + '.input[' + str(i) + ']', source=True, destination=False, plugs=True) or [''])[0] for i in range(0, count)]
+        
+        # The Space Choice Picks World Matrices, the Other One Picks Offsets Stored on the Group
+        if targets and targets[0].split('.')[-1].startswith('worldMatrix'):
+            return grp, [target.split('.')[0] for target in targets]
+    return grp, []
+
+# *** Switching a Control to Another Space and Keying It So It Does Not Move ***
+def switchAndBake(ctrl, space, startFrame=None, endFrame=None):
+    spaces = cmds.attributeQuery('Space', node=ctrl, listEnum=True)[0].split(':')
+    if space not in spaces:
+        cmds.error(ctrl + ' has no ' + space + ' space.')
+    index = spaces.index(space)
+    if startFrame is None:
+        startFrame = endFrame = cmds.currentTime(query=True)
+    frames = list(range(int(startFrame), int(endFrame) + 1))
+    
+    # Keying the Frame Before, So the Animation Leading In Keeps Its Old Space, as writeKeys Only Replaces Keys in the Range
+    for attr in ['Space', 'translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ']:
+        keyed = bool(cmds.keyframe(ctrl, attribute=attr, query=True, keyframeCount=True))
+        if keyed or cmds.getAttr(ctrl + '.' + attr, settable=True):
+            cmds.setKeyframe(ctrl, attribute=attr, time=frames[0] - 1, insert=keyed)
+    
+    # Sampling Where the Control Is and Where the New Space Is at Every Frame
+    grp, targets = getSpaceTargets(ctrl)
+    grpLocal = om.MMatrix(cmds.getAttr(grp + '.matrix'))
+    offset = om.MMatrix(cmds.getAttr(grp + '.Space_Offset[' + str(index) + ']'))
+    samples = ikfkMatch.samplePlugs(ikfkMatch.getPlugs([ctrl, targets[index]], 'worldMatrix'), frames)
+    ctrlLocals = [ctrlWorld * (grpLocal * offset * spaceWorld).inverse() for ctrlWorld, spaceWorld in samples]
+    
+    # Keying the Switch as a Step, Then the Control in Its New Space
+    ikfkMatch.writeKeys(ctrl, 'Space', frames, [float(index)] * len(frames))
+    cmds.keyTangent(ctrl, attribute='Space', time=(frames[0] - 1, frames[-1]), outTangentType='step')
+    ikfkMatch.writeRotationKeys(ctrl, frames, ctrlLocals)
+    ikfkMatch.writeTranslationKeys(ctrl, frames, [[m.getElement(3, 0), m.getElement(3, 1), m.getElement(3, 2)] for m in ctrlLocals])
+    return frames
+
+# *** Switching Every Control of a Rig That Has Spaces ***
+def switchAndBakeAll(masterCtrl, space, startFrame=None, endFrame=None):
+    switched = []
+    for ctrl in rigControls.getControls(masterCtrl):
+        if not cmds.attributeQuery('Space', node=ctrl, exists=True):
+            continue
+        if space in cmds.attributeQuery('Space', node=ctrl, listEnum=True)[0].split(':'):
+            switchAndBake(ctrl, space, startFrame, endFrame)
+            switched.append(ctrl)
+    return switched